@@ -1,20 +1,27 @@
 """
 API dependencies for authentication and authorization.
 """
-from typing import Optional, Generator
-from fastapi import Depends, HTTPException, status
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Generator, Type, TypeVar
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from jose import JWTError
+from jwt import InvalidTokenError as JWTError
+from pydantic import BaseModel, ValidationError
 
-from ..core.database import get_db
+from ..core.database import get_db, get_read_db
 from ..core.security import verify_token
 from ..models.user import Profile
+from ..schemas.common import BaseSchema
 from ..core.exceptions import UnauthorizedError, ForbiddenError
+from ..services.report_service import ReportService
 
 # Security scheme
 security = HTTPBearer()
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -128,6 +135,9 @@ def require_roles(required_roles: list):
     Returns:
         Dependency function
     """
+    # Admin is always allowed; one set lookup per request
+    allowed_roles = frozenset(required_roles) | {"admin"}
+    
     async def roles_checker(
         current_user: Profile = Depends(get_current_active_user)
     ) -> Profile:
@@ -143,7 +153,7 @@ def require_roles(required_roles: list):
         Raises:
             HTTPException: If user doesn't have any of the required roles
         """
-        if current_user.role not in required_roles and current_user.role != "admin":
+        if current_user.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Operation not permitted. Required roles: {', '.join(required_roles)}"
@@ -206,3 +216,70 @@ def get_pagination_params(
         "skip": max(0, skip),
         "limit": min(1000, max(1, limit))
     }
+
+
+def get_report_service(db: Session = Depends(get_read_db)) -> ReportService:
+    """
+    Get a report service bound to a read-only session.
+    
+    FastAPI caches dependencies per request, so every consumer within one
+    request shares the same instance.
+    
+    Args:
+        db: Read-only database session
+        
+    Returns:
+        ReportService: Report service
+    """
+    return ReportService(db)
+
+
+@lru_cache(maxsize=None)
+def json_body(schema: Type[ModelT]) -> Callable[[Request], Any]:
+    """
+    Build a dependency that validates the raw request body in one pass.
+    
+    pydantic-core parses and validates the JSON bytes directly, skipping the
+    intermediate dict FastAPI builds for a regular body parameter. Meant for
+    high-volume endpoints; pair the route with json_body_openapi so the
+    request body stays documented.
+    
+    Cached per schema, so every route using the same schema shares one
+    dependency bound to the schema's compiled validator.
+    
+    Args:
+        schema: Pydantic model for the request body
+        
+    Returns:
+        Dependency returning the validated model
+    """
+    validate_json = schema.__pydantic_validator__.validate_json
+    
+    async def dependency(request: Request) -> ModelT:
+        try:
+            return validate_json(await request.body())
+        except ValidationError as exc:
+            raise RequestValidationError([
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False, include_input=False)
+            ])
+    
+    return dependency
+
+
+def json_body_openapi(schema: Type[BaseSchema]) -> Dict[str, Any]:
+    """
+    OpenAPI request body for a route using json_body.
+    
+    Args:
+        schema: Pydantic model for the request body
+        
+    Returns:
+        dict: Value for the route's openapi_extra
+    """
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema.cached_json_schema()}},
+        }
+    }
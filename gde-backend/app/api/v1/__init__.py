@@ -1,7 +1,10 @@
 """
 API v1 package.
 """
+from fastapi import APIRouter
+
 from .auth import router as auth_router
+from .dashboard import router as dashboard_router
 from .products import router as products_router
 from .guias import router as guias_router
 from .kardex import router as kardex_router
@@ -12,8 +15,27 @@ from .reports import router as reports_router
 from .files import router as files_router
 from .audit import router as audit_router
 
+# Single router mounting every v1 module, included into the app once
+api_router = APIRouter(prefix="/api/v1")
+for _router in (
+    auth_router,
+    dashboard_router,
+    products_router,
+    guias_router,
+    kardex_router,
+    pistoleo_router,
+    costos_router,
+    notifications_router,
+    reports_router,
+    files_router,
+    audit_router,
+):
+    api_router.include_router(_router)
+
 __all__ = [
+    "api_router",
     "auth_router",
+    "dashboard_router",
     "products_router",
     "guias_router",
     "kardex_router",
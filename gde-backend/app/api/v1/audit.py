@@ -7,13 +7,25 @@ from sqlalchemy.orm import Session
 from datetime import datetime
 
 from ...core.database import get_db
+from ...core.responses import ORJSONResponse, rows_json
 from ...models.user import Profile
 from ...models.audit import AuditLog, ImportLog
+from ...models.base import raw_json_column
 from ...schemas.audit import AuditLogResponse, ImportLogResponse
 from ..dependencies import get_current_user, require_admin
 
 router = APIRouter(prefix="/audit", tags=["audit"])
 
+# Columns backing AuditLogResponse; list endpoints select these directly and
+# encode the rows without building ORM objects or response models. The JSON
+# value columns are read as text and passed through to the response unparsed.
+_RAW_JSON_FIELDS = frozenset({"valores_anteriores", "valores_nuevos"})
+_AUDIT_LOG_COLUMNS = tuple(
+    raw_json_column(AuditLog.__table__.c[name]) if name in _RAW_JSON_FIELDS
+    else AuditLog.__table__.c[name]
+    for name in AuditLogResponse.model_fields
+)
+
 
 @router.get("/logs", response_model=list[AuditLogResponse])
 async def get_audit_logs(
@@ -44,7 +56,7 @@ async def get_audit_logs(
     Returns:
         list[AuditLogResponse]: List of audit logs
     """
-    query = db.query(AuditLog)
+    query = db.query(*_AUDIT_LOG_COLUMNS)
     
     if usuario_id:
         query = query.filter(AuditLog.usuario_id == usuario_id)
@@ -65,7 +77,7 @@ async def get_audit_logs(
     query = query.order_by(AuditLog.fecha.desc())
     
     logs = query.offset(skip).limit(limit).all()
-    return logs
+    return rows_json(logs)
 
 
 @router.get("/logs/{log_id}", response_model=AuditLogResponse)
@@ -120,13 +132,13 @@ async def get_user_audit_logs(
     Returns:
         list[AuditLogResponse]: List of user audit logs
     """
-    logs = db.query(AuditLog).filter(
+    logs = db.query(*_AUDIT_LOG_COLUMNS).filter(
         AuditLog.usuario_id == user_id
     ).order_by(
         AuditLog.fecha.desc()
     ).offset(skip).limit(limit).all()
     
-    return logs
+    return rows_json(logs)
 
 
 @router.get("/logs/table/{table_name}", response_model=list[AuditLogResponse])
@@ -150,13 +162,13 @@ async def get_table_audit_logs(
     Returns:
         list[AuditLogResponse]: List of table audit logs
     """
-    logs = db.query(AuditLog).filter(
+    logs = db.query(*_AUDIT_LOG_COLUMNS).filter(
         AuditLog.tabla_afectada == table_name
     ).order_by(
         AuditLog.fecha.desc()
     ).offset(skip).limit(limit).all()
     
-    return logs
+    return rows_json(logs)
 
 
 @router.get("/logs/record/{table_name}/{record_id}", response_model=list[AuditLogResponse])
@@ -178,14 +190,14 @@ async def get_record_audit_logs(
     Returns:
         list[AuditLogResponse]: List of record audit logs
     """
-    logs = db.query(AuditLog).filter(
+    logs = db.query(*_AUDIT_LOG_COLUMNS).filter(
         AuditLog.tabla_afectada == table_name,
         AuditLog.registro_id == record_id
     ).order_by(
         AuditLog.fecha.desc()
     ).all()
     
-    return logs
+    return rows_json(logs)
 
 
 @router.get("/import-logs", response_model=list[ImportLogResponse])
@@ -268,7 +280,7 @@ async def get_import_log(
     return log
 
 
-@router.get("/statistics/actions")
+@router.get("/statistics/actions", response_class=ORJSONResponse)
 async def get_action_statistics(
     db: Session = Depends(get_db),
     current_user: Profile = Depends(require_admin),
@@ -285,7 +297,7 @@ async def get_action_statistics(
         fecha_hasta: Filter by date to
         
     Returns:
-        dict: Action statistics
+        ORJSONResponse: Action statistics
     """
     from sqlalchemy import func
     
@@ -302,15 +314,15 @@ async def get_action_statistics(
     
     results = query.group_by(AuditLog.accion).all()
     
-    return {
+    return ORJSONResponse({
         "statistics": [
             {"action": row.accion, "count": row.count}
             for row in results
         ]
-    }
+    })
 
 
-@router.get("/statistics/tables")
+@router.get("/statistics/tables", response_class=ORJSONResponse)
 async def get_table_statistics(
     db: Session = Depends(get_db),
     current_user: Profile = Depends(require_admin),
@@ -327,7 +339,7 @@ async def get_table_statistics(
         fecha_hasta: Filter by date to
         
     Returns:
-        dict: Table statistics
+        ORJSONResponse: Table statistics
     """
     from sqlalchemy import func
     
@@ -344,15 +356,15 @@ async def get_table_statistics(
     
     results = query.group_by(AuditLog.tabla_afectada).all()
     
-    return {
+    return ORJSONResponse({
         "statistics": [
             {"table": row.tabla_afectada, "count": row.count}
             for row in results
         ]
-    }
+    })
 
 
-@router.get("/statistics/users")
+@router.get("/statistics/users", response_class=ORJSONResponse)
 async def get_user_statistics(
     db: Session = Depends(get_db),
     current_user: Profile = Depends(require_admin),
@@ -369,7 +381,7 @@ async def get_user_statistics(
         fecha_hasta: Filter by date to
         
     Returns:
-        dict: User statistics
+        ORJSONResponse: User statistics
     """
     from sqlalchemy import func
     
@@ -386,12 +398,12 @@ async def get_user_statistics(
     
     results = query.group_by(AuditLog.usuario_id, Profile.username).all()
     
-    return {
+    return ORJSONResponse({
         "statistics": [
             {"user_id": str(row.usuario_id), "count": row.count}
             for row in results
         ]
-    }
+    })
 
 
 
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from datetime import date
 
 from ...core.database import get_db
+from ...core.responses import ORJSONResponse, construct_json
 from ...models.user import Profile
 from ...schemas.costo import (
     CostoCreate, CostoUpdate, CostoResponse,
@@ -80,7 +81,8 @@ async def get_costos(
         fecha_hasta=fecha_hasta,
         search=search
     )
-    return costos
+    # Costo columns map 1:1 onto CostoResponse types, so rows skip validation
+    return construct_json(CostoResponse, costos)
 
 
 @router.get("/{costo_id}", response_model=CostoResponse)
@@ -176,7 +178,7 @@ async def delete_costo(
         )
 
 
-@router.get("/summary/statistics")
+@router.get("/summary/statistics", response_class=ORJSONResponse)
 async def get_costos_summary(
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_user),
@@ -193,17 +195,17 @@ async def get_costos_summary(
         fecha_hasta: Filter by date to
         
     Returns:
-        dict: Costos summary
+        ORJSONResponse: Costos summary
     """
     service = CostoService(db)
     summary = service.get_costos_summary(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta
     )
-    return summary
+    return ORJSONResponse(summary)
 
 
-@router.get("/summary/by-category")
+@router.get("/summary/by-category", response_class=ORJSONResponse)
 async def get_costos_by_category(
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_user),
@@ -220,17 +222,17 @@ async def get_costos_by_category(
         fecha_hasta: Filter by date to
         
     Returns:
-        List[dict]: Costos grouped by category
+        ORJSONResponse: Costos grouped by category
     """
     service = CostoService(db)
     summary = service.get_costos_by_category(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta
     )
-    return summary
+    return ORJSONResponse(summary)
 
 
-@router.get("/reports/monthly")
+@router.get("/reports/monthly", response_class=ORJSONResponse)
 async def get_monthly_report(
     year: int = Query(..., description="Year"),
     month: int = Query(..., ge=1, le=12, description="Month"),
@@ -247,11 +249,11 @@ async def get_monthly_report(
         current_user: Current authenticated user
         
     Returns:
-        dict: Monthly report
+        ORJSONResponse: Monthly report
     """
     service = CostoService(db)
     report = service.get_monthly_report(year=year, month=month)
-    return report
+    return ORJSONResponse(report)
 
 
 # Category endpoints
@@ -296,7 +298,7 @@ async def get_categories(
     """
     service = CostoService(db)
     categories = service.get_categories(active_only=active_only)
-    return categories
+    return construct_json(CostCategoryResponse, categories)
 
 
 @router.get("/categories/{category_id}", response_model=CostCategoryResponse)
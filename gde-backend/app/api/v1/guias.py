@@ -2,23 +2,29 @@
 Guias API endpoints.
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.orm import Session
 from datetime import datetime
 
 from ...core.database import get_db
+from ...core.responses import adapter_json, rows_json
+from ...models.guia import GuiaMovement
 from ...models.user import Profile
 from ...schemas.guia import (
     GuiaCreate, GuiaUpdate, GuiaResponse,
     GuiaItemCreate, GuiaItemUpdate, GuiaItemResponse,
     GuiaMovementCreate, GuiaMovementResponse,
-    GuiaStatusUpdate, GuiaTrackingResponse
+    GuiaStatusUpdate, GuiaTrackingResponse, GuiaResponseListAdapter
 )
 from ...services.guia_service import GuiaService
 from ..dependencies import get_current_user, require_contable
 
 router = APIRouter(prefix="/guias", tags=["guias"])
 
+# Columns backing GuiaMovementResponse; the movements listing encodes rows
+# directly instead of building one ORM object and one model per movement
+_MOVEMENT_COLUMNS = tuple(GuiaMovement.__table__.c[name] for name in GuiaMovementResponse.model_fields)
+
 
 @router.post("/", response_model=GuiaResponse, status_code=status.HTTP_201_CREATED)
 async def create_guia(
@@ -78,7 +84,7 @@ async def get_guias(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta
     )
-    return guias
+    return adapter_json(GuiaResponseListAdapter, guias)
 
 
 @router.get("/{guia_id}", response_model=GuiaResponse)
@@ -365,8 +371,8 @@ async def get_guia_movements(
         List[GuiaMovementResponse]: List of guia movements
     """
     service = GuiaService(db)
-    movements = service.get_guia_movements(guia_id)
-    return movements
+    movements = service.get_guia_movement_rows(guia_id, _MOVEMENT_COLUMNS)
+    return rows_json(movements)
 
 
 # Tracking endpoint (public or with optional auth)
@@ -397,7 +403,10 @@ async def track_guia(
             detail="Guia not found"
         )
     
-    return tracking
+    return Response(
+        GuiaTrackingResponse.model_validate(tracking).to_json(),
+        media_type="application/json"
+    )
 
 
 
@@ -8,6 +8,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from ...core.database import get_db
+from ...core.responses import ORJSONResponse, construct_json
 from ...models.user import Profile
 from ...schemas.product import KardexCreate, KardexResponse
 from ...services.kardex_service import KardexService
@@ -92,10 +93,10 @@ async def get_product_kardex(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta
     )
-    return kardex
+    return construct_json(KardexResponse, kardex)
 
 
-@router.get("/summary")
+@router.get("/summary", response_class=ORJSONResponse)
 async def get_kardex_summary(
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_user),
@@ -116,7 +117,7 @@ async def get_kardex_summary(
         fecha_hasta: Filter by date to
         
     Returns:
-        dict: Kardex summary statistics
+        ORJSONResponse: Kardex summary statistics
     """
     service = KardexService(db)
     summary = service.get_kardex_summary(
@@ -125,7 +126,7 @@ async def get_kardex_summary(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta
     )
-    return summary
+    return ORJSONResponse(summary)
 
 
 @router.get("/product/{product_id}/report")
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from ...core.database import get_db
+from ...core.responses import construct_json
 from ...models.user import Profile
 from ...schemas.notification import (
     NotificationCreate, NotificationUpdate, NotificationResponse,
@@ -74,7 +75,7 @@ async def get_notifications(
         notification_type=notification_type,
         priority=priority
     )
-    return notifications
+    return construct_json(NotificationResponse, notifications)
 
 
 @router.get("/unread/count")
@@ -6,13 +6,14 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from ...core.database import get_db
+from ...core.responses import ORJSONResponse, construct_json
 from ...models.user import Profile
 from ...schemas.pistoleo import (
     PistoleoSessionCreate, PistoleoSessionUpdate, PistoleoSessionResponse,
     EscaneoCreate, EscaneoResponse
 )
 from ...services.pistoleo_service import PistoleoService
-from ..dependencies import get_current_user, require_contable
+from ..dependencies import get_current_user, json_body, json_body_openapi, require_contable
 
 router = APIRouter(prefix="/pistoleo", tags=["pistoleo"])
 
@@ -68,7 +69,7 @@ async def get_sessions(
         estado=estado,
         user_id=str(current_user.id) if current_user.role != "admin" else None
     )
-    return sessions
+    return construct_json(PistoleoSessionResponse, sessions)
 
 
 @router.get("/sessions/{session_id}", response_model=PistoleoSessionResponse)
@@ -232,10 +233,15 @@ async def cancel_session(
 
 
 # Scan endpoints
-@router.post("/sessions/{session_id}/scans", response_model=EscaneoResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/sessions/{session_id}/scans",
+    response_model=EscaneoResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=json_body_openapi(EscaneoCreate)
+)
 async def create_scan(
     session_id: int,
-    scan_data: EscaneoCreate,
+    scan_data: EscaneoCreate = Depends(json_body(EscaneoCreate)),
     db: Session = Depends(get_db),
     current_user: Profile = Depends(get_current_user)
 ):
@@ -286,10 +292,10 @@ async def get_session_scans(
         limit=limit,
         estado_escaneo=estado_escaneo
     )
-    return scans
+    return construct_json(EscaneoResponse, scans)
 
 
-@router.get("/sessions/{session_id}/statistics")
+@router.get("/sessions/{session_id}/statistics", response_class=ORJSONResponse)
 async def get_session_statistics(
     session_id: int,
     db: Session = Depends(get_db),
@@ -304,7 +310,7 @@ async def get_session_statistics(
         current_user: Current authenticated user
         
     Returns:
-        dict: Session statistics
+        ORJSONResponse: Session statistics
     """
     service = PistoleoService(db)
     stats = service.get_session_statistics(session_id)
@@ -315,7 +321,7 @@ async def get_session_statistics(
             detail="Session not found"
         )
     
-    return stats
+    return ORJSONResponse(stats)
 
 
 
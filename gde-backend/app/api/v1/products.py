@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 
 from ...core.database import get_db
+from ...core.responses import construct_json, fast_json, rows_json
 from ...models.user import Profile
 from ...schemas.product import (
     ProductCreate, 
@@ -229,23 +230,7 @@ async def get_low_stock_alerts(
         List[StockAlertResponse]: Products with low stock
     """
     service = ProductService(db)
-    products = service.get_low_stock_products(threshold)
-    
-    alerts = []
-    for product in products:
-        alert_type = "out_of_stock" if product.stock_actual == 0 else "low_stock"
-        severity = "critical" if product.stock_actual == 0 else "warning"
-        
-        alerts.append(StockAlertResponse(
-            product_id=product.id,
-            product_name=product.name,
-            current_stock=product.stock_actual,
-            minimum_stock=product.stock_minimo,
-            alert_type=alert_type,
-            severity=severity
-        ))
-    
-    return alerts
+    return rows_json(service.get_low_stock_alert_rows(threshold))
 
 
 @router.get("/inventory/summary", response_model=InventoryReportResponse)
@@ -266,13 +251,13 @@ async def get_inventory_summary(
     service = ProductService(db)
     summary = service.get_inventory_summary()
     
-    return InventoryReportResponse(
+    return fast_json(InventoryReportResponse(
         total_products=summary["total_products"],
         total_value=summary["total_value"],
         low_stock_products=summary["low_stock_products"],
         out_of_stock_products=summary["out_of_stock_products"],
         categories_summary=[]  # TODO: Implement categories summary
-    )
+    ))
 
 
 # Category endpoints
@@ -317,7 +302,7 @@ async def get_categories(
     """
     service = ProductService(db)
     categories = service.get_categories(active_only=active_only)
-    return categories
+    return construct_json(CategoryResponse, categories)
 
 
 @router.get("/categories/{category_id}", response_model=CategoryResponse)
@@ -1,22 +1,106 @@
 """
 Reports API endpoints for analytics and business intelligence.
 """
-from typing import Optional
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+import csv
+import io
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from openpyxl import Workbook
+from pydantic import TypeAdapter
 from datetime import date
 
-from ...core.database import get_db
 from ...models.user import Profile
-from ...services.report_service import ReportService
-from ..dependencies import get_current_user
+from ...services.report_service import (
+    ReportService,
+    INVENTORY_EXPORT_COLUMNS,
+    COSTS_EXPORT_COLUMNS,
+    EXPORT_BATCH_SIZE,
+)
+from ..dependencies import get_current_user, get_report_service
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "excel": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+EXPORT_EXTENSIONS = {"csv": "csv", "excel": "xlsx"}
 
-@router.get("/inventory/stock")
+# Bytes read per chunk when streaming a saved xlsx export
+EXCEL_STREAM_BLOCK_SIZE = 64 * 1024
+
+# Built once so report bodies go straight through pydantic-core's serializer
+_REPORT_ADAPTER = TypeAdapter(Dict[str, Any])
+
+
+def _report_response(report: Dict[str, Any]) -> Response:
+    """Serialize a report dict to a JSON response."""
+    return Response(_REPORT_ADAPTER.dump_json(report), media_type="application/json")
+
+
+def _csv_chunks(columns: Sequence[str], rows: Iterable[Sequence]) -> Iterator[str]:
+    """Render rows as CSV, yielding one chunk per EXPORT_BATCH_SIZE rows."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow(row)
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    yield buffer.getvalue()
+
+
+def _excel_chunks(columns: Sequence[str], rows: Iterable[Sequence]) -> Iterator[bytes]:
+    """
+    Render rows as an xlsx workbook and stream it in blocks.
+    
+    Rows go through openpyxl's write-only mode and the workbook is saved to
+    a temporary file, so the finished file is never held in memory.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(list(columns))
+    for row in rows:
+        sheet.append(list(row))
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+        while block := file.read(EXCEL_STREAM_BLOCK_SIZE):
+            yield block
+
+
+def _export_response(
+    columns: Sequence[str],
+    rows: Iterable[Sequence],
+    format: str,
+    filename: str
+) -> StreamingResponse:
+    """Build a streaming file response for an export."""
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported export format: {format}"
+        )
+    
+    chunks = _csv_chunks(columns, rows) if format == "csv" else _excel_chunks(columns, rows)
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": (
+                f"attachment; filename={filename}.{EXPORT_EXTENSIONS[format]}"
+            )
+        }
+    )
+
+
+@router.get("/inventory/stock", response_class=Response)
 async def get_inventory_stock_report(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user),
     categoria_id: Optional[int] = Query(None, description="Filter by category ID"),
     almacen: Optional[str] = Query(None, description="Filter by warehouse"),
@@ -27,7 +111,7 @@ async def get_inventory_stock_report(
     Get inventory stock report.
     
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
         categoria_id: Filter by category ID
         almacen: Filter by warehouse
@@ -35,21 +119,20 @@ async def get_inventory_stock_report(
         include_zero: Include items with zero stock
         
     Returns:
-        dict: Inventory stock report
+        Response: Inventory stock report
     """
-    service = ReportService(db)
     report = service.get_inventory_report(
         categoria_id=categoria_id,
         almacen=almacen,
         low_stock_only=low_stock_only,
         include_zero=include_zero
     )
-    return report
+    return _report_response(report)
 
 
-@router.get("/inventory/movements")
+@router.get("/inventory/movements", response_class=Response)
 async def get_inventory_movements_report(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user),
     fecha_desde: date = Query(..., description="Start date"),
     fecha_hasta: date = Query(..., description="End date"),
@@ -61,7 +144,7 @@ async def get_inventory_movements_report(
     Get inventory movements report.
     
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
         fecha_desde: Start date
         fecha_hasta: End date
@@ -70,9 +153,8 @@ async def get_inventory_movements_report(
         almacen: Filter by warehouse
         
     Returns:
-        dict: Inventory movements report
+        Response: Inventory movements report
     """
-    service = ReportService(db)
     report = service.get_movements_report(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta,
@@ -80,12 +162,12 @@ async def get_inventory_movements_report(
         tipo_movimiento=tipo_movimiento,
         almacen=almacen
     )
-    return report
+    return _report_response(report)
 
 
-@router.get("/guides/statistics")
+@router.get("/guides/statistics", response_class=Response)
 async def get_guides_statistics(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user),
     fecha_desde: Optional[date] = Query(None, description="Start date"),
     fecha_hasta: Optional[date] = Query(None, description="End date"),
@@ -96,7 +178,7 @@ async def get_guides_statistics(
     Get guides statistics report.
     
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
         fecha_desde: Start date
         fecha_hasta: End date
@@ -104,21 +186,20 @@ async def get_guides_statistics(
         estado: Filter by status
         
     Returns:
-        dict: Guides statistics
+        Response: Guides statistics
     """
-    service = ReportService(db)
     report = service.get_guides_report(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta,
         tipo_movimiento=tipo_movimiento,
         estado=estado
     )
-    return report
+    return _report_response(report)
 
 
-@router.get("/pistoleo/statistics")
+@router.get("/pistoleo/statistics", response_class=Response)
 async def get_pistoleo_statistics(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user),
     fecha_desde: Optional[date] = Query(None, description="Start date"),
     fecha_hasta: Optional[date] = Query(None, description="End date"),
@@ -128,27 +209,26 @@ async def get_pistoleo_statistics(
     Get pistoleo (scanning) statistics report.
     
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
         fecha_desde: Start date
         fecha_hasta: End date
         user_id: Filter by user ID
         
     Returns:
-        dict: Pistoleo statistics
+        Response: Pistoleo statistics
     """
-    service = ReportService(db)
     report = service.get_pistoleo_report(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta,
         user_id=user_id
     )
-    return report
+    return _report_response(report)
 
 
-@router.get("/costs/summary")
+@router.get("/costs/summary", response_class=Response)
 async def get_costs_summary(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user),
     fecha_desde: date = Query(..., description="Start date"),
     fecha_hasta: date = Query(..., description="End date"),
@@ -159,7 +239,7 @@ async def get_costs_summary(
     Get costs summary report.
     
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
         fecha_desde: Start date
         fecha_hasta: End date
@@ -167,21 +247,20 @@ async def get_costs_summary(
         estado: Filter by status
         
     Returns:
-        dict: Costs summary
+        Response: Costs summary
     """
-    service = ReportService(db)
     report = service.get_costs_report(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta,
         categoria_id=categoria_id,
         estado=estado
     )
-    return report
+    return _report_response(report)
 
 
-@router.get("/costs/by-category")
+@router.get("/costs/by-category", response_class=Response)
 async def get_costs_by_category(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user),
     fecha_desde: date = Query(..., description="Start date"),
     fecha_hasta: date = Query(..., description="End date")
@@ -190,25 +269,24 @@ async def get_costs_by_category(
     Get costs grouped by category.
     
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
         fecha_desde: Start date
         fecha_hasta: End date
         
     Returns:
-        dict: Costs by category
+        Response: Costs by category
     """
-    service = ReportService(db)
     report = service.get_costs_by_category(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta
     )
-    return report
+    return _report_response(report)
 
 
-@router.get("/costs/trends")
+@router.get("/costs/trends", response_class=Response)
 async def get_costs_trends(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user),
     fecha_desde: date = Query(..., description="Start date"),
     fecha_hasta: date = Query(..., description="End date"),
@@ -218,47 +296,45 @@ async def get_costs_trends(
     Get costs trends over time.
     
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
         fecha_desde: Start date
         fecha_hasta: End date
         group_by: Grouping period (day, week, month, year)
         
     Returns:
-        dict: Costs trends
+        Response: Costs trends
     """
-    service = ReportService(db)
     report = service.get_costs_trends(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta,
         group_by=group_by
     )
-    return report
+    return _report_response(report)
 
 
-@router.get("/dashboard/summary")
+@router.get("/dashboard/summary", response_class=Response)
 async def get_dashboard_summary(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user)
 ):
     """
     Get dashboard summary with key metrics.
     
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
         
     Returns:
-        dict: Dashboard summary
+        Response: Dashboard summary
     """
-    service = ReportService(db)
     summary = service.get_dashboard_summary()
-    return summary
+    return _report_response(summary)
 
 
-@router.get("/user/activity")
+@router.get("/user/activity", response_class=Response)
 async def get_user_activity_report(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user),
     fecha_desde: Optional[date] = Query(None, description="Start date"),
     fecha_hasta: Optional[date] = Query(None, description="End date"),
@@ -268,86 +344,75 @@ async def get_user_activity_report(
     Get user activity report.
     
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
         fecha_desde: Start date
         fecha_hasta: End date
         user_id: Filter by user ID
         
     Returns:
-        dict: User activity report
+        Response: User activity report
     """
-    service = ReportService(db)
     report = service.get_user_activity_report(
         fecha_desde=fecha_desde,
         fecha_hasta=fecha_hasta,
         user_id=user_id
     )
-    return report
+    return _report_response(report)
 
 
 @router.get("/export/inventory")
 async def export_inventory_report(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user),
-    format: str = Query("csv", description="Export format: csv, excel, pdf")
+    format: str = Query("csv", description="Export format: csv, excel")
 ):
     """
     Export inventory report to file.
     
+    Rows are streamed from the database in batches, so memory use does not
+    grow with the size of the inventory.
+    
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
-        format: Export format (csv, excel, pdf)
+        format: Export format (csv, excel)
         
     Returns:
-        File: Exported report file
+        StreamingResponse: Exported report file
     """
-    service = ReportService(db)
-    # This would typically return a file response
-    # For now, we'll return the data that would be exported
-    report = service.get_inventory_report()
-    return {
-        "message": f"Export to {format} format",
-        "data": report
-    }
+    return _export_response(
+        INVENTORY_EXPORT_COLUMNS,
+        service.iter_inventory_export(),
+        format,
+        "inventory"
+    )
 
 
 @router.get("/export/costs")
 async def export_costs_report(
-    db: Session = Depends(get_db),
+    service: ReportService = Depends(get_report_service),
     current_user: Profile = Depends(get_current_user),
     fecha_desde: date = Query(..., description="Start date"),
     fecha_hasta: date = Query(..., description="End date"),
-    format: str = Query("csv", description="Export format: csv, excel, pdf")
+    format: str = Query("csv", description="Export format: csv, excel")
 ):
     """
     Export costs report to file.
     
     Args:
-        db: Database session
+        service: Report service
         current_user: Current authenticated user
         fecha_desde: Start date
         fecha_hasta: End date
-        format: Export format (csv, excel, pdf)
+        format: Export format (csv, excel)
         
     Returns:
-        File: Exported report file
+        StreamingResponse: Exported report file
     """
-    service = ReportService(db)
-    # This would typically return a file response
-    # For now, we'll return the data that would be exported
-    report = service.get_costs_report(
-        fecha_desde=fecha_desde,
-        fecha_hasta=fecha_hasta
+    return _export_response(
+        COSTS_EXPORT_COLUMNS,
+        service.iter_costs_export(fecha_desde=fecha_desde, fecha_hasta=fecha_hasta),
+        format,
+        "costs"
     )
-    return {
-        "message": f"Export to {format} format",
-        "data": report
-    }
-
-
-
-
-
-
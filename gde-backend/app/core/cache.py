@@ -0,0 +1,100 @@
+"""
+In-process TTL cache for read-heavy report queries.
+"""
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe key/value store whose entries expire after a TTL."""
+
+    def __init__(self):
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or expired entry
+
+        Returns:
+            Any: Cached value or default
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            with self._lock:
+                self._data.pop(key, None)
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: int) -> None:
+        """
+        Store a value for ttl seconds.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+# Shared cache for report/dashboard results
+report_cache = TTLCache()
+
+
+def make_key(name: str, args: tuple = (), kwargs: Dict[str, Any] = None) -> Hashable:
+    """
+    Build a cache key from a function name and its arguments.
+
+    Args:
+        name: Qualified function name
+        args: Positional arguments (excluding self)
+        kwargs: Keyword arguments
+
+    Returns:
+        Hashable: Cache key
+    """
+    return (name, args, tuple(sorted((kwargs or {}).items())))
+
+
+def cached_method(ttl: int) -> Callable:
+    """
+    Cache a service method's result in report_cache, ignoring ``self``.
+
+    Args:
+        ttl: Time to live in seconds
+
+    Returns:
+        Decorator function
+    """
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = make_key(func.__qualname__, args, kwargs)
+            value = report_cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(self, *args, **kwargs)
+                report_cache.set(key, value, ttl)
+            return value
+
+        return wrapper
+
+    return decorator
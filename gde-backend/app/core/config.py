@@ -1,10 +1,16 @@
 """
 Configuration settings for the GDE Backend API.
 """
-import os
-from typing import List, Optional
+import json
+from typing import FrozenSet, Optional, Tuple
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import computed_field
+from pydantic import Field, PrivateAttr, model_validator
+
+
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated (or JSON list) setting into unique, non-empty items, keeping order."""
+    items = json.loads(value) if value.lstrip().startswith("[") else value.split(",")
+    return tuple(dict.fromkeys(s.strip() for s in items if s.strip()))
 
 
 class Settings(BaseSettings):
@@ -21,9 +27,11 @@ class Settings(BaseSettings):
     app_version: str = "1.0.0"
     debug: bool = False
     environment: str = "production"
+    workers: int = 1
     
     # Database
     database_url: str
+    database_readonly_url: Optional[str] = None  # Replica for report queries
     supabase_url: str
     supabase_key: str
     supabase_service_key: str
@@ -33,15 +41,18 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     
-    # CORS - stored as strings, converted to lists via computed fields
-    _allowed_origins_str: str = "http://localhost:3000"
-    _allowed_methods_str: str = "GET,POST,PUT,DELETE,PATCH"
-    _allowed_headers_str: str = "*"
+    # CORS - comma-separated in the environment, parsed once into tuples
+    allowed_origins_raw: str = Field("http://localhost:3000", validation_alias="allowed_origins")
+    allowed_methods_raw: str = Field("GET,POST,PUT,DELETE,PATCH", validation_alias="allowed_methods")
+    allowed_headers_raw: str = Field("*", validation_alias="allowed_headers")
+    
+    # Trusted hosts - "*" disables Host header checking
+    allowed_hosts_raw: str = Field("*", validation_alias="allowed_hosts")
     
     # File Upload
     upload_dir: str = "uploads"
     max_file_size: int = 10485760  # 10MB
-    _allowed_file_types_str: str = "csv,xlsx,xls,json"
+    allowed_file_types_raw: str = Field("csv,xlsx,xls,json", validation_alias="allowed_file_types")
     
     # Email
     smtp_host: Optional[str] = None
@@ -69,33 +80,53 @@ class Settings(BaseSettings):
     redis_url: Optional[str] = None
     cache_ttl: int = 300  # 5 minutes
     
-    @computed_field
+    _allowed_origins: Tuple[str, ...] = PrivateAttr()
+    _allowed_origins_set: FrozenSet[str] = PrivateAttr()
+    _allowed_methods: Tuple[str, ...] = PrivateAttr()
+    _allowed_headers: Tuple[str, ...] = PrivateAttr()
+    _allowed_hosts: Tuple[str, ...] = PrivateAttr()
+    _allowed_file_types: Tuple[str, ...] = PrivateAttr()
+    
+    @model_validator(mode="after")
+    def _finalize(self) -> "Settings":
+        """Parse the comma-separated settings once."""
+        self._allowed_origins = _split_csv(self.allowed_origins_raw)
+        self._allowed_origins_set = frozenset(self._allowed_origins)
+        self._allowed_methods = _split_csv(self.allowed_methods_raw)
+        self._allowed_headers = _split_csv(self.allowed_headers_raw)
+        self._allowed_hosts = _split_csv(self.allowed_hosts_raw)
+        self._allowed_file_types = _split_csv(self.allowed_file_types_raw)
+        return self
+    
+    @property
+    def allowed_origins(self) -> Tuple[str, ...]:
+        """Allowed CORS origins."""
+        return self._allowed_origins
+    
+    @property
+    def allowed_origins_set(self) -> FrozenSet[str]:
+        """Allowed CORS origins, for O(1) membership checks."""
+        return self._allowed_origins_set
+    
     @property
-    def allowed_origins(self) -> List[str]:
-        """Parse allowed origins from environment variable."""
-        env_val = os.getenv("ALLOWED_ORIGINS", self._allowed_origins_str)
-        return [i.strip() for i in env_val.split(",") if i.strip()]
+    def allowed_methods(self) -> Tuple[str, ...]:
+        """Allowed CORS methods."""
+        return self._allowed_methods
     
-    @computed_field
     @property
-    def allowed_methods(self) -> List[str]:
-        """Parse allowed methods from environment variable."""
-        env_val = os.getenv("ALLOWED_METHODS", self._allowed_methods_str)
-        return [i.strip() for i in env_val.split(",") if i.strip()]
+    def allowed_headers(self) -> Tuple[str, ...]:
+        """Allowed CORS headers."""
+        return self._allowed_headers
     
-    @computed_field
     @property
-    def allowed_headers(self) -> List[str]:
-        """Parse allowed headers from environment variable."""
-        env_val = os.getenv("ALLOWED_HEADERS", self._allowed_headers_str)
-        return [i.strip() for i in env_val.split(",") if i.strip()]
+    def allowed_hosts(self) -> Tuple[str, ...]:
+        """Hosts accepted in the Host header."""
+        return self._allowed_hosts
     
-    @computed_field
     @property
-    def allowed_file_types(self) -> List[str]:
-        """Parse allowed file types from environment variable."""
-        env_val = os.getenv("ALLOWED_FILE_TYPES", self._allowed_file_types_str)
-        return [i.strip() for i in env_val.split(",") if i.strip()]
+    def allowed_file_types(self) -> Tuple[str, ...]:
+        """Allowed upload file extensions."""
+        return self._allowed_file_types
 
 
 # Global settings instance
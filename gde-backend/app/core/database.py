@@ -1,7 +1,7 @@
 """
 Database configuration and session management.
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
@@ -20,8 +20,16 @@ engine = create_engine(
     echo=settings.debug,
 )
 
-# Create session factory
+# Read-only engine for reports; falls back to the primary when no replica is set
+read_engine = create_engine(
+    settings.database_readonly_url,
+    poolclass=StaticPool,
+    echo=settings.debug,
+) if settings.database_readonly_url else engine
+
+# Create session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 # Create base class for models
 Base = declarative_base()
@@ -45,6 +53,30 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Dependency to get a read-only database session.
+    
+    When a PostgreSQL replica is configured the transaction is opened READ
+    ONLY, so report queries can be served by a standby. Without one the
+    session is bound to the primary and left as a normal transaction.
+    
+    Yields:
+        Session: Read-only database session
+    """
+    db = ReadSessionLocal()
+    try:
+        if read_engine is not engine and read_engine.dialect.name == "postgresql":
+            db.execute(text("SET TRANSACTION READ ONLY"))
+        yield db
+    except Exception as e:
+        logger.error(f"Database session error: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 def create_tables():
     """Create all database tables."""
     try:
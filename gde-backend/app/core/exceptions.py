@@ -1,8 +1,12 @@
 """
 Custom exceptions for the GDE Backend API.
 """
+from types import MappingProxyType
 from fastapi import HTTPException, status
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
+
+# Shared read-only details for exceptions raised without any
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
 
 
 class GDEException(Exception):
@@ -16,7 +20,7 @@ class GDEException(Exception):
     ):
         self.message = message
         self.status_code = status_code
-        self.details = details or {}
+        self.details = _EMPTY if details is None else details
         super().__init__(self.message)
 
 
@@ -34,9 +38,11 @@ class ValidationError(GDEException):
 class NotFoundError(GDEException):
     """Resource not found exception."""
     
+    _FMT = "{} with id {} not found".format
+    
     def __init__(self, resource: str, identifier: Any):
         super().__init__(
-            message=f"{resource} with id {identifier} not found",
+            message=NotFoundError._FMT(resource, identifier),
             status_code=status.HTTP_404_NOT_FOUND
         )
 
@@ -123,6 +129,6 @@ def handle_gde_exception(exc: GDEException) -> HTTPException:
         status_code=exc.status_code,
         detail={
             "message": exc.message,
-            "details": exc.details
+            "details": dict(exc.details)
         }
     )
@@ -0,0 +1,241 @@
+"""
+ASGI middleware for the GDE Backend API.
+"""
+import logging
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+
+import orjson
+from starlette.middleware.cors import SAFELISTED_HEADERS
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .exceptions import GDEException
+
+logger = logging.getLogger(__name__)
+
+# Body for unhandled errors, serialized once
+_INTERNAL_ERROR_BODY = orjson.dumps({
+    "message": "Internal server error",
+    "details": {}
+})
+
+
+@lru_cache(maxsize=256)
+def error_body(message: str) -> bytes:
+    """
+    Serialized error body with empty details, cached per message.
+
+    Args:
+        message: Error message
+
+    Returns:
+        bytes: JSON body
+    """
+    return orjson.dumps({"message": message, "details": {}})
+
+
+class ExceptionASGIMiddleware:
+    """
+    Turn GDE and unhandled exceptions into JSON error responses.
+
+    Works at the raw ASGI level, so no Request or Response objects are
+    built on either the success or the error path.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except GDEException as exc:
+            if response_started:
+                raise
+            if exc.details:
+                body = orjson.dumps(
+                    {"message": exc.message, "details": dict(exc.details)},
+                    default=str
+                )
+            else:
+                body = error_body(exc.message)
+            await _send_json(send, exc.status_code, body)
+        except Exception as exc:
+            if response_started:
+                raise
+            logger.error(f"Unhandled exception: {exc}", exc_info=True)
+            await _send_json(send, 500, _INTERNAL_ERROR_BODY)
+
+
+async def _send_json(send: Send, status_code: int, body: bytes) -> None:
+    """
+    Send a complete JSON response.
+
+    Args:
+        send: ASGI send callable
+        status_code: HTTP status code
+        body: Serialized JSON body
+    """
+    headers: Any = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+    await send({"type": "http.response.start", "status": status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class FastCORSMiddleware:
+    """
+    Pure ASGI CORS handler with the response headers built once at startup.
+
+    Preflight requests are answered directly: 204 when the origin, method
+    and headers are all allowed, 400 otherwise. Other requests carrying an
+    allowed Origin get the allow headers appended to the response start
+    message.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600
+    ):
+        self.app = app
+        self._allow_all_origins = "*" in allow_origins
+        self._allow_origins = frozenset(origin.encode() for origin in allow_origins)
+        self._allow_all_headers = "*" in allow_headers
+        self._allow_credentials = allow_credentials
+
+        if "*" in allow_methods:
+            allow_methods = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+        allow_headers = sorted(SAFELISTED_HEADERS.union(allow_headers))
+        self._allow_methods = frozenset(method.encode() for method in allow_methods)
+        self._allow_headers = frozenset(header.lower().encode() for header in allow_headers)
+
+        # Echo the request origin unless any origin is allowed without credentials
+        self._echo_origin = not self._allow_all_origins or allow_credentials
+
+        simple_headers = []
+        if allow_credentials:
+            simple_headers.append((b"access-control-allow-credentials", b"true"))
+        if self._echo_origin:
+            simple_headers.append((b"vary", b"Origin"))
+        else:
+            simple_headers.append((b"access-control-allow-origin", b"*"))
+        self._simple_headers = simple_headers
+
+        preflight_headers = [
+            *simple_headers,
+            (b"access-control-allow-methods", ", ".join(allow_methods).encode()),
+            (b"access-control-max-age", str(max_age).encode()),
+        ]
+        if not self._allow_all_headers:
+            preflight_headers.append(
+                (b"access-control-allow-headers", ", ".join(allow_headers).encode())
+            )
+        self._preflight_headers = preflight_headers
+
+    def _origin_allowed(self, origin: bytes) -> bool:
+        """Check an Origin header value against the allowed origins."""
+        return self._allow_all_origins or origin in self._allow_origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin, request_method, request_headers)
+            return
+
+        if not self._origin_allowed(origin):
+            await self.app(scope, receive, send)
+            return
+
+        extra_headers = self._simple_headers
+        if self._echo_origin:
+            extra_headers = [(b"access-control-allow-origin", origin), *extra_headers]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _preflight(
+        self,
+        send: Send,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: Optional[bytes]
+    ) -> None:
+        """
+        Answer a preflight request without calling the application.
+
+        Args:
+            send: ASGI send callable
+            origin: Request Origin header value
+            request_method: Access-Control-Request-Method value
+            request_headers: Access-Control-Request-Headers value, if any
+        """
+        failures = []
+        if not self._origin_allowed(origin):
+            failures.append("origin")
+        if request_method not in self._allow_methods:
+            failures.append("method")
+        if request_headers and not self._allow_all_headers:
+            requested = (header.strip() for header in request_headers.lower().split(b","))
+            if not self._allow_headers.issuperset(requested):
+                failures.append("headers")
+
+        if failures:
+            body = ("Disallowed CORS " + ", ".join(failures)).encode()
+            await send({
+                "type": "http.response.start",
+                "status": 400,
+                "headers": [
+                    (b"content-type", b"text/plain; charset=utf-8"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = list(self._preflight_headers)
+        if self._echo_origin:
+            headers.append((b"access-control-allow-origin", origin))
+        if self._allow_all_headers and request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
@@ -0,0 +1,128 @@
+"""
+Response classes for the GDE Backend API.
+"""
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Iterable, List, Type
+
+import orjson
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+# Exact-type encoders for values orjson does not handle natively; date,
+# datetime and UUID are already encoded by orjson itself. Decimal is a
+# string, as in pydantic's JSON mode, so amounts keep their precision
+_ENCODERS = {Decimal: str}
+
+# UTC datetimes end in "Z" and keys may be non-str, matching pydantic output
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def _default(obj: Any, _encoders: dict = _ENCODERS) -> Any:
+    """Encode types orjson does not handle natively."""
+    encoder = _encoders.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+def rows_json(rows: Iterable[Any]) -> ORJSONResponse:
+    """
+    Encode column-query rows as a JSON list of objects.
+    
+    Args:
+        rows: SQLAlchemy Row objects
+        
+    Returns:
+        ORJSONResponse: JSON list
+    """
+    return ORJSONResponse([row._asdict() for row in rows])
+
+
+def fast_json(model: BaseModel, status_code: int = 200) -> Response:
+    """
+    Serialize an already validated schema straight to a JSON response.
+    
+    Returning a Response skips FastAPI's response_model validation of the
+    returned object; keep response_model on the route for the OpenAPI docs.
+    
+    Args:
+        model: Validated Pydantic model
+        status_code: HTTP status code
+        
+    Returns:
+        Response: JSON response
+    """
+    return Response(
+        model.__pydantic_serializer__.to_json(model),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def adapter_json(
+    adapter: TypeAdapter,
+    content: Any,
+    status_code: int = 200,
+    validate: bool = True
+) -> Response:
+    """
+    Validate content with a prebuilt TypeAdapter and return it as JSON.
+    
+    Args:
+        adapter: Module-level adapter for the response type
+        content: ORM objects or plain data to validate
+        status_code: HTTP status code
+        validate: Set to False when content is already made of constructed models
+        
+    Returns:
+        Response: JSON response
+    """
+    value = adapter.validate_python(content, from_attributes=True) if validate else content
+    return Response(
+        adapter.dump_json(value),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(item_schema: Type[BaseModel]) -> TypeAdapter:
+    """TypeAdapter for a list of one item schema, built once."""
+    return TypeAdapter(List[item_schema])
+
+
+def construct_json(item_schema: Type[Any], rows: Iterable[Any], status_code: int = 200) -> Response:
+    """
+    Serialize trusted ORM rows through a ResponseSchema without validating them.
+    
+    Only for schemas whose field types match the mapped column types exactly;
+    see ResponseSchema.construct_from_orm.
+    
+    Args:
+        item_schema: ResponseSchema subclass of the list items
+        rows: ORM objects loaded from the database
+        status_code: HTTP status code
+        
+    Returns:
+        Response: JSON list
+    """
+    construct = item_schema.construct_from_orm
+    return Response(
+        _list_adapter(item_schema).dump_json([construct(row) for row in rows]),
+        status_code=status_code,
+        media_type="application/json"
+    )
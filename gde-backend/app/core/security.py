@@ -1,9 +1,11 @@
 """
 Security utilities for authentication and authorization.
 """
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Optional, Union
-from jose import JWTError, jwt
+import time
+import jwt
+from jwt import InvalidTokenError as JWTError
 from passlib.context import CryptContext
 from fastapi import HTTPException, status
 import logging
@@ -15,6 +17,16 @@ logger = logging.getLogger(__name__)
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# JWT signing material, resolved once at import instead of per call
+_SIGNING_KEY = settings.secret_key.encode()
+_ALGORITHM = settings.algorithm
+_ALGORITHMS = [settings.algorithm]
+
+# Token lifetimes in seconds
+_TOKEN_TTL = settings.access_token_expire_minutes * 60
+_REFRESH_TTL = 7 * 86400  # 7 days
+_RESET_TTL = 3600  # 1 hour
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -58,18 +70,14 @@ def create_access_token(
         str: JWT token
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.access_token_expire_minutes
-        )
+    now = int(time.time())
+    ttl = int(expires_delta.total_seconds()) if expires_delta else _TOKEN_TTL
     
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": now + ttl, "iat": now})
     encoded_jwt = jwt.encode(
         to_encode, 
-        settings.secret_key, 
-        algorithm=settings.algorithm
+        _SIGNING_KEY, 
+        algorithm=_ALGORITHM
     )
     return encoded_jwt
 
@@ -90,8 +98,8 @@ def verify_token(token: str) -> dict:
     try:
         payload = jwt.decode(
             token, 
-            settings.secret_key, 
-            algorithms=[settings.algorithm]
+            _SIGNING_KEY, 
+            algorithms=_ALGORITHMS
         )
         return payload
     except JWTError as e:
@@ -114,13 +122,13 @@ def create_refresh_token(data: dict) -> str:
         str: JWT refresh token
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=7)  # 7 days
-    to_encode.update({"exp": expire, "type": "refresh"})
+    now = int(time.time())
+    to_encode.update({"exp": now + _REFRESH_TTL, "iat": now, "type": "refresh"})
     
     encoded_jwt = jwt.encode(
         to_encode, 
-        settings.secret_key, 
-        algorithm=settings.algorithm
+        _SIGNING_KEY, 
+        algorithm=_ALGORITHM
     )
     return encoded_jwt
 
@@ -141,8 +149,8 @@ def verify_refresh_token(token: str) -> dict:
     try:
         payload = jwt.decode(
             token, 
-            settings.secret_key, 
-            algorithms=[settings.algorithm]
+            _SIGNING_KEY, 
+            algorithms=_ALGORITHMS
         )
         if payload.get("type") != "refresh":
             raise HTTPException(
@@ -168,14 +176,11 @@ def generate_password_reset_token(email: str) -> str:
     Returns:
         str: Password reset token
     """
-    delta = timedelta(hours=1)  # 1 hour expiration
-    now = datetime.utcnow()
-    expires = now + delta
-    exp = expires.timestamp()
+    now = int(time.time())
     encoded_jwt = jwt.encode(
-        {"exp": exp, "nbf": now, "sub": email, "type": "password_reset"},
-        settings.secret_key,
-        algorithm=settings.algorithm,
+        {"exp": now + _RESET_TTL, "nbf": now, "sub": email, "type": "password_reset"},
+        _SIGNING_KEY,
+        algorithm=_ALGORITHM,
     )
     return encoded_jwt
 
@@ -193,8 +198,8 @@ def verify_password_reset_token(token: str) -> Optional[str]:
     try:
         decoded_token = jwt.decode(
             token, 
-            settings.secret_key, 
-            algorithms=[settings.algorithm]
+            _SIGNING_KEY, 
+            algorithms=_ALGORITHMS
         )
         if decoded_token.get("type") != "password_reset":
             return None
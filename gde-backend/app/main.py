@@ -1,30 +1,23 @@
 """
 Main FastAPI application for GDE Backend.
 """
+import asyncio
+import importlib
 import logging
-from datetime import datetime
+import os
+import time
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, status
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import FastAPI, Request, Response, status
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from .core.config import settings
-from .core.database import create_tables
-from .core.exceptions import GDEException, handle_gde_exception
-from .api.v1.auth import router as auth_router
-from .api.v1.dashboard import router as dashboard_router
-from .api.v1.products import router as products_router
-from .api.v1.guias import router as guias_router
-from .api.v1.kardex import router as kardex_router
-from .api.v1.pistoleo import router as pistoleo_router
-from .api.v1.costos import router as costos_router
-from .api.v1.notifications import router as notifications_router
-from .api.v1.reports import router as reports_router
-from .api.v1.files import router as files_router
-from .api.v1.audit import router as audit_router
+from .core.database import ReadSessionLocal, create_tables
+from .core.middleware import ExceptionASGIMiddleware, FastCORSMiddleware, error_body
+from .core.responses import ORJSONResponse
 
 # Configure logging
 logging.basicConfig(
@@ -33,6 +26,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Routers as "module:attribute"; set SKIP_ROUTER_LOAD=1 to leave them out
+# so that importing app.main stays cheap for scripts and tooling
+ROUTERS = (
+    "app.api.v1:api_router",
+)
+
+
+def include_routers(app: FastAPI) -> None:
+    """
+    Import ROUTERS and mount them on the app.
+    
+    Skipped entirely when SKIP_ROUTER_LOAD=1.
+    
+    Args:
+        app: FastAPI application instance
+    """
+    if os.getenv("SKIP_ROUTER_LOAD") == "1":
+        return
+    
+    for path in ROUTERS:
+        module_name, attribute = path.split(":")
+        app.include_router(getattr(importlib.import_module(module_name), attribute))
+
+
+def warm_report_cache() -> None:
+    """Pre-compute common reports so the first request after deploy is a cache hit."""
+    from .services.report_service import ReportService
+    
+    db = ReadSessionLocal()
+    try:
+        ReportService(db).warm_cache()
+        logger.info("Report cache warmed")
+    except Exception as e:
+        logger.warning(f"Report cache warm-up failed: {e}")
+    finally:
+        db.close()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -53,12 +83,22 @@ async def lifespan(app: FastAPI):
         logger.error(f"Error creating database tables: {e}")
         raise
     
+    # Build the OpenAPI schema now instead of on the first /openapi.json hit.
+    # Response-model validators and serializers need no warm-up: FastAPI
+    # builds their TypeAdapters when routes are declared.
+    if app.openapi_url:
+        app.openapi()
+    
+    # Warm report cache in the background without delaying startup
+    warmup_task = asyncio.create_task(asyncio.to_thread(warm_report_cache))
+    
     logger.info("GDE Backend API started successfully")
     
     yield
     
     # Shutdown
     logger.info("Shutting down GDE Backend API...")
+    warmup_task.cancel()
 
 
 # Create FastAPI application
@@ -69,47 +109,47 @@ app = FastAPI(
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
     openapi_url="/openapi.json" if settings.debug else None,
+    redirect_slashes=False,
     lifespan=lifespan
 )
 
+# Compress larger responses; added first so it sits inside the exception
+# middleware and small error bodies are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
+# Convert GDE and unhandled exceptions to JSON responses
+app.add_middleware(ExceptionASGIMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origins=settings.allowed_origins,
     allow_credentials=True,
     allow_methods=settings.allowed_methods,
     allow_headers=settings.allowed_headers,
 )
 
-# Add trusted host middleware
-if not settings.debug:
+# Add trusted host middleware; a "*" wildcard would accept every host anyway
+if not settings.debug and settings.allowed_hosts != ("*",):
     app.add_middleware(
         TrustedHostMiddleware,
-        allowed_hosts=["*"]  # Configure with your domain in production
+        allowed_hosts=settings.allowed_hosts
     )
 
 
 # Exception handlers
-@app.exception_handler(GDEException)
-async def gde_exception_handler(request: Request, exc: GDEException):
-    """Handle GDE custom exceptions."""
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "message": exc.message,
-            "details": exc.details
-        }
-    )
-
-
+# GDEException and unhandled errors are handled by ExceptionASGIMiddleware.
+# Validation and HTTP errors are caught inside FastAPI's routing, so they
+# stay as exception handlers.
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors."""
-    return JSONResponse(
+    # Errors from custom validators carry the raised exception in ctx
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "message": "Validation error",
-            "details": exc.errors()
+            "details": jsonable_encoder(exc.errors())
         }
     )
 
@@ -117,7 +157,13 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(StarletteHTTPException)
 async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     """Handle HTTP exceptions."""
-    return JSONResponse(
+    if isinstance(exc.detail, str):
+        return Response(
+            content=error_body(exc.detail),
+            status_code=exc.status_code,
+            media_type="application/json"
+        )
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "message": exc.detail,
@@ -126,38 +172,28 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
     )
 
 
-@app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception):
-    """Handle general exceptions."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "message": "Internal server error",
-            "details": {}
-        }
-    )
+# Static part of the health payload; only the timestamp changes per probe
+_HEALTH_STATIC = {
+    "status": "healthy",
+    "version": settings.app_version,
+    "environment": settings.environment
+}
 
 
 # Health check endpoint
-@app.get("/health", tags=["health"])
+@app.get("/health", tags=["health"], response_class=ORJSONResponse)
 async def health_check():
     """
     Health check endpoint.
     
     Returns:
-        dict: Health status
+        ORJSONResponse: Health status with a Unix timestamp
     """
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": settings.app_version,
-        "environment": settings.environment
-    }
+    return ORJSONResponse({**_HEALTH_STATIC, "timestamp": time.time()})
 
 
 # Root endpoint
-@app.get("/", tags=["root"])
+@app.get("/", tags=["root"], response_class=ORJSONResponse)
 async def root():
     """
     Root endpoint.
@@ -173,64 +209,13 @@ async def root():
     }
 
 
-# Include API routers
-app.include_router(
-    auth_router,
-    prefix="/api/v1"
-)
-
-app.include_router(
-    dashboard_router,
-    prefix="/api/v1"
-)
-
-app.include_router(
-    products_router,
-    prefix="/api/v1"
-)
-
-app.include_router(
-    guias_router,
-    prefix="/api/v1"
-)
-
-app.include_router(
-    kardex_router,
-    prefix="/api/v1"
-)
-
-app.include_router(
-    pistoleo_router,
-    prefix="/api/v1"
-)
-
-app.include_router(
-    costos_router,
-    prefix="/api/v1"
-)
-
-app.include_router(
-    notifications_router,
-    prefix="/api/v1"
-)
-
-app.include_router(
-    reports_router,
-    prefix="/api/v1"
-)
-
-app.include_router(
-    files_router,
-    prefix="/api/v1"
-)
-
-app.include_router(
-    audit_router,
-    prefix="/api/v1"
-)
+# Include API routers when the module is imported, so the app serves them
+# even when it runs without the lifespan
+include_routers(app)
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     
     uvicorn.run(
@@ -238,5 +223,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows build
+        http="httptools",
+        workers=1 if settings.debug else settings.workers
     )
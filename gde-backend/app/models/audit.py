@@ -1,7 +1,7 @@
 """
 Audit and logging models.
 """
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, JSON, DateTime
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, JSON, DateTime, func, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -21,7 +21,12 @@ class AuditLog(BaseModel):
     valores_nuevos = Column(JSON)
     ip_address = Column(String(45))
     user_agent = Column(Text)
-    fecha = Column(DateTime(timezone=True), default="now()")
+    fecha = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        Index("ix_audit_logs_usuario_fecha", usuario_id, fecha.desc()),
+        Index("ix_audit_logs_tabla_registro", tabla_afectada, registro_id),
+    )
     
     # Relationships
     user = relationship("Profile", back_populates="audit_logs")
@@ -43,7 +48,7 @@ class ImportLog(BaseModel):
     registros_exitosos = Column(Integer, default=0)
     registros_fallidos = Column(Integer, default=0)
     errores = Column(JSON)  # Error details
-    fecha_importacion = Column(DateTime(timezone=True), default="now()")
+    fecha_importacion = Column(DateTime(timezone=True), server_default=func.now())
     fecha_procesamiento = Column(DateTime(timezone=True))
     estado = Column(String(20), default="processing")  # processing, completed, failed
     
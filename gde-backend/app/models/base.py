@@ -1,13 +1,42 @@
 """
 Base model class with common fields and functionality.
 """
-from sqlalchemy import Column, Integer, DateTime, func
+import operator
+import orjson
+from sqlalchemy import Column, Integer, DateTime, JSON, Text, TypeDecorator, cast, func, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declared_attr
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, FrozenSet, Tuple
 
 from ..core.database import Base
 
+# JSONB on PostgreSQL, plain JSON on other dialects (e.g. SQLite in tests)
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class RawJSONText(TypeDecorator):
+    """Result type returning JSON text as an orjson.Fragment, so it is emitted without parsing."""
+    
+    impl = Text
+    cache_ok = True
+    
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        return None if value is None else orjson.Fragment(value)
+
+
+def raw_json_column(column: Column) -> Any:
+    """
+    Select a JSON column as raw text, labelled with the column's name.
+    
+    Args:
+        column: JSON/JSONB column
+        
+    Returns:
+        Labelled column expression yielding orjson.Fragment values
+    """
+    return type_coerce(cast(column, Text), RawJSONText()).label(column.name)
+
 
 class BaseModel(Base):
     """Base model with common fields."""
@@ -23,18 +52,26 @@ class BaseModel(Base):
         """Generate table name from class name."""
         return cls.__name__.lower()
     
+    @classmethod
+    def _column_accessors(cls) -> Tuple[Tuple[str, ...], Callable[[Any], tuple], FrozenSet[str]]:
+        """Column names, a getter for their values and the name set, built once per class."""
+        accessors = cls.__dict__.get("_column_accessors_cache")
+        if accessors is None:
+            names = tuple(column.name for column in cls.__table__.columns)
+            accessors = (names, operator.attrgetter(*names), frozenset(names))
+            cls._column_accessors_cache = accessors
+        return accessors
+    
     def to_dict(self) -> dict:
         """Convert model instance to dictionary."""
-        return {
-            column.name: getattr(self, column.name)
-            for column in self.__table__.columns
-        }
+        names, getter, _ = self._column_accessors()
+        return dict(zip(names, getter(self)))
     
     def update_from_dict(self, data: dict) -> None:
-        """Update model instance from dictionary."""
-        for key, value in data.items():
-            if hasattr(self, key):
-                setattr(self, key, value)
+        """Update model instance columns from dictionary, ignoring other keys."""
+        column_set = self._column_accessors()[2]
+        for key in data.keys() & column_set:
+            setattr(self, key, data[key])
     
     def __repr__(self) -> str:
         """String representation of the model."""
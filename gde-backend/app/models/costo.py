@@ -1,12 +1,12 @@
 """
 Cost and accounting models.
 """
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, Numeric, Date, ARRAY, Boolean
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, Numeric, Date, Boolean, DDL, event, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from decimal import Decimal
 
-from .base import BaseModel
+from .base import BaseModel, JSONBType
 
 
 class CostCategory(BaseModel):
@@ -24,7 +24,7 @@ class CostCategory(BaseModel):
     
     # Relationships
     parent = relationship("CostCategory", remote_side="CostCategory.id", back_populates="children")
-    children = relationship("CostCategory", back_populates="parent")
+    children = relationship("CostCategory", back_populates="parent", lazy="selectin")
     costos = relationship("Costo", back_populates="category")
     
     def __repr__(self) -> str:
@@ -49,12 +49,41 @@ class Costo(BaseModel):
     estado = Column(String(20), default="pendiente")  # pendiente, pagado, anulado
     metodo_pago = Column(String(20), default="transferencia")  # efectivo, transferencia, tarjeta, cheque
     observaciones = Column(Text)
-    evidencias = Column(ARRAY(String))  # URLs of scanned documents
+    evidencias = Column(JSONBType)  # URLs of scanned documents
     created_by = Column(UUID(as_uuid=True), ForeignKey("profiles.id"))
     
+    __table_args__ = (
+        # Matches get_costos: filter on categoria/estado, newest first
+        Index("ix_costos_fecha_desc_cat_estado", fecha.desc(), categoria_id, estado),
+    )
+    
     # Relationships
-    category = relationship("CostCategory", back_populates="costos")
+    category = relationship("CostCategory", back_populates="costos", lazy="selectin")
     creator = relationship("Profile", back_populates="costos")
     
     def __repr__(self) -> str:
         return f"<Costo(id={self.id}, descripcion={self.descripcion}, monto={self.monto})>"
+
+
+# Expression index for monthly cost trends; date_trunc is PostgreSQL-only
+event.listen(
+    Costo.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_costos_fecha_month "
+        "ON costos (date_trunc('month', fecha::timestamp))"
+    ).execute_if(dialect="postgresql")
+)
+
+# Trigram indexes for the ILIKE search in get_costos; pg_trgm is PostgreSQL-only
+event.listen(
+    Costo.__table__,
+    "after_create",
+    DDL(
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm; "
+        "CREATE INDEX IF NOT EXISTS ix_costos_descripcion_trgm "
+        "ON costos USING gin (descripcion gin_trgm_ops); "
+        "CREATE INDEX IF NOT EXISTS ix_costos_proveedor_trgm "
+        "ON costos USING gin (proveedor gin_trgm_ops)"
+    ).execute_if(dialect="postgresql")
+)
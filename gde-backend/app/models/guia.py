@@ -1,12 +1,12 @@
 """
 Guia (dispatch guide) models.
 """
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, Numeric, Date, DateTime, ARRAY
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, Numeric, Date, DateTime, func, Index, DDL, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from decimal import Decimal
 
-from .base import BaseModel
+from .base import BaseModel, JSONBType
 
 
 class Guia(BaseModel):
@@ -22,22 +22,28 @@ class Guia(BaseModel):
     cliente_telefono = Column(String(20))
     cliente_email = Column(String(100))
     direccion_entrega = Column(Text)
-    fecha_creacion = Column(DateTime(timezone=True), default="now()")
+    fecha_creacion = Column(DateTime(timezone=True), server_default=func.now())
     fecha_estimada_entrega = Column(Date)
     fecha_entrega_real = Column(DateTime(timezone=True))
     ubicacion_actual = Column(String(100))
     transportista = Column(String(100))
     numero_guia_transportista = Column(String(100))
-    peso_total = Column(Numeric(8, 2))
-    volumen_total = Column(Numeric(8, 2))
-    valor_declarado = Column(Numeric(10, 2))
+    peso_total = Column(Numeric(8, 2, asdecimal=False))
+    volumen_total = Column(Numeric(8, 2, asdecimal=False))
+    valor_declarado = Column(Numeric(10, 2, asdecimal=False))
     observaciones = Column(Text)
     created_by = Column(UUID(as_uuid=True), ForeignKey("profiles.id"))
     
+    __table_args__ = (
+        # Named as in base_datos.md so create_all does not add duplicates
+        Index("idx_guias_estado", estado),
+        Index("idx_guias_fecha_creacion", fecha_creacion),
+    )
+    
     # Relationships
     creator = relationship("Profile", back_populates="guias")
-    items = relationship("GuiaItem", back_populates="guia", cascade="all, delete-orphan")
-    movimientos = relationship("GuiaMovement", back_populates="guia", cascade="all, delete-orphan")
+    items = relationship("GuiaItem", back_populates="guia", cascade="all, delete-orphan", lazy="selectin")
+    movimientos = relationship("GuiaMovement", back_populates="guia", cascade="all, delete-orphan", lazy="selectin")
     escaneos = relationship("Escaneo", back_populates="guia")
     
     def __repr__(self) -> str:
@@ -52,9 +58,9 @@ class GuiaItem(BaseModel):
     guia_id = Column(Integer, ForeignKey("guias.id"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     cantidad = Column(Integer, nullable=False)
-    precio_unitario = Column(Numeric(10, 2))
-    descuento = Column(Numeric(10, 2), default=0)
-    subtotal = Column(Numeric(12, 2))
+    precio_unitario = Column(Numeric(10, 2, asdecimal=False))
+    descuento = Column(Numeric(10, 2, asdecimal=False), default=0)
+    subtotal = Column(Numeric(12, 2, asdecimal=False))
     observaciones = Column(Text)
     
     # Relationships
@@ -75,8 +81,12 @@ class GuiaMovement(BaseModel):
     accion = Column(String(50), nullable=False)
     ubicacion = Column(String(100))
     observaciones = Column(Text)
-    evidencias = Column(ARRAY(String))  # URLs of photos/receipts
-    fecha_movimiento = Column(DateTime(timezone=True), default="now()")
+    evidencias = Column(JSONBType)  # URLs of photos/receipts
+    fecha_movimiento = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        Index("ix_guia_movimientos_guia_fecha", guia_id, fecha_movimiento.desc()),
+    )
     
     # Relationships
     guia = relationship("Guia", back_populates="movimientos")
@@ -84,3 +94,19 @@ class GuiaMovement(BaseModel):
     
     def __repr__(self) -> str:
         return f"<GuiaMovement(id={self.id}, guia_id={self.guia_id}, accion={self.accion})>"
+
+
+# Trigram and full-text indexes for the search in get_guias; PostgreSQL-only
+event.listen(
+    Guia.__table__,
+    "after_create",
+    DDL(
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm; "
+        "CREATE INDEX IF NOT EXISTS ix_guias_codigo_trgm "
+        "ON guias USING gin (codigo gin_trgm_ops); "
+        "CREATE INDEX IF NOT EXISTS ix_guias_cliente_nombre_trgm "
+        "ON guias USING gin (cliente_nombre gin_trgm_ops); "
+        "CREATE INDEX IF NOT EXISTS ix_guias_search_fts "
+        "ON guias USING gin (to_tsvector('simple', coalesce(codigo, '') || ' ' || coalesce(cliente_nombre, '')))"
+    ).execute_if(dialect="postgresql")
+)
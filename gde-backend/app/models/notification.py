@@ -1,7 +1,7 @@
 """
 Notification models.
 """
-from sqlalchemy import Column, String, Text, ForeignKey, Boolean, DateTime, JSON
+from sqlalchemy import Column, String, Text, ForeignKey, Boolean, DateTime, JSON, func, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -20,9 +20,15 @@ class Notification(BaseModel):
     data = Column(JSON)  # Additional notification data
     user_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"))
     is_read = Column(Boolean, default=False)
-    sent_at = Column(DateTime(timezone=True), default="now()")
+    sent_at = Column(DateTime(timezone=True), server_default=func.now())
     read_at = Column(DateTime(timezone=True))
     
+    __table_args__ = (
+        Index("ix_notifications_user_read_sent", user_id, is_read, sent_at.desc()),
+        # Unread counts only touch unread rows
+        Index("ix_notifications_unread", user_id, postgresql_where=is_read.is_(False)),
+    )
+    
     # Relationships
     user = relationship("Profile", back_populates="notifications")
     
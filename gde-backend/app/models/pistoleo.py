@@ -1,7 +1,7 @@
 """
 Pistoleo (scanning) models.
 """
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, Numeric, DateTime, JSON
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, Numeric, DateTime, JSON, func, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from decimal import Decimal
@@ -17,7 +17,7 @@ class PistoleoSession(BaseModel):
     codigo_qr = Column(String(100), unique=True, nullable=False)
     usuario_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=False)
     nombre_sesion = Column(String(100))
-    fecha_inicio = Column(DateTime(timezone=True), default="now()")
+    fecha_inicio = Column(DateTime(timezone=True), server_default=func.now())
     fecha_fin = Column(DateTime(timezone=True))
     estado = Column(String(20), default="active")  # active, completed, cancelled
     escaneos_totales = Column(Integer, default=0)
@@ -27,7 +27,7 @@ class PistoleoSession(BaseModel):
     
     # Relationships
     user = relationship("Profile", back_populates="pistoleo_sessions")
-    escaneos = relationship("Escaneo", back_populates="session", cascade="all, delete-orphan")
+    escaneos = relationship("Escaneo", back_populates="session", cascade="all, delete-orphan", lazy="selectin")
     
     def __repr__(self) -> str:
         return f"<PistoleoSession(id={self.id}, codigo_qr={self.codigo_qr}, estado={self.estado})>"
@@ -42,21 +42,35 @@ class Escaneo(BaseModel):
     guia_id = Column(Integer, ForeignKey("guias.id"))
     codigo_barras = Column(String(100), nullable=False)
     tipo_codigo = Column(String(20), default="CODE128")
-    fecha_escaneo = Column(DateTime(timezone=True), default="now()")
+    fecha_escaneo = Column(DateTime(timezone=True), server_default=func.now())
     dispositivo = Column(String(100))
     ubicacion = Column(String(100))
-    latitud = Column(Numeric(10, 8))
-    longitud = Column(Numeric(11, 8))
-    precision_gps = Column(Numeric(5, 2))
+    latitud = Column(Numeric(10, 8, asdecimal=False))
+    longitud = Column(Numeric(11, 8, asdecimal=False))
+    precision_gps = Column(Numeric(5, 2, asdecimal=False))
     imagen_url = Column(Text)
     estado_escaneo = Column(String(20), default="success")  # success, error, duplicate
     mensaje_error = Column(Text)
     extra_data = Column(JSON)
     
+    __table_args__ = (
+        Index("ix_escaneos_session_fecha", session_id, fecha_escaneo),
+        Index("ix_escaneos_codigo_barras", codigo_barras),
+    )
+    
     # Relationships
     session = relationship("PistoleoSession", back_populates="escaneos")
     guia = relationship("Guia", back_populates="escaneos")
-    user = relationship("Profile", back_populates="escaneos")
+    # escaneos has no user column; the scanning user is the session's user
+    user = relationship(
+        "Profile",
+        secondary="pistoleo_sessions",
+        primaryjoin="Escaneo.session_id == PistoleoSession.id",
+        secondaryjoin="PistoleoSession.usuario_id == Profile.id",
+        back_populates="escaneos",
+        viewonly=True,
+        uselist=False
+    )
     
     def __repr__(self) -> str:
         return f"<Escaneo(id={self.id}, session_id={self.session_id}, codigo_barras={self.codigo_barras})>"
@@ -1,12 +1,12 @@
 """
 Product and inventory models.
 """
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, Numeric, Boolean, JSON, ARRAY
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, Numeric, Boolean, JSON, DateTime, func, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from decimal import Decimal
 
-from .base import BaseModel
+from .base import BaseModel, JSONBType
 
 
 class Category(BaseModel):
@@ -24,7 +24,7 @@ class Category(BaseModel):
     
     # Relationships
     parent = relationship("Category", remote_side="Category.id", back_populates="children")
-    children = relationship("Category", back_populates="parent")
+    children = relationship("Category", back_populates="parent", lazy="selectin")
     products = relationship("Product", back_populates="category")
     
     def __repr__(self) -> str:
@@ -50,14 +50,19 @@ class Product(BaseModel):
     marca = Column(String(100))
     modelo = Column(String(100))
     unidad_medida = Column(String(20), default="UNIDAD")
-    peso = Column(Numeric(8, 2))
+    peso = Column(Numeric(8, 2, asdecimal=False))
     dimensiones = Column(JSON)
     codigo_barras = Column(String(100))
-    imagenes = Column(ARRAY(String))
+    imagenes = Column(JSONBType)  # List of image URLs
     status = Column(String(20), default="active")
     extra_data = Column(JSON)
     created_by = Column(UUID(as_uuid=True), ForeignKey("profiles.id"))
     
+    __table_args__ = (
+        # Containment lookups, e.g. imagenes @> '["url"]'
+        Index("ix_products_imagenes_gin", imagenes, postgresql_using="gin"),
+    )
+    
     # Relationships
     category = relationship("Category", back_populates="products")
     creator = relationship("Profile", back_populates="products")
@@ -83,10 +88,14 @@ class Kardex(BaseModel):
     costo_unitario = Column(Numeric(10, 2))
     costo_promedio = Column(Numeric(10, 2))
     valor_total = Column(Numeric(12, 2))
-    fecha_movimiento = Column(String, default="now()")
+    fecha_movimiento = Column(DateTime(timezone=True), server_default=func.now())
     usuario_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"))
     observaciones = Column(Text)
     
+    __table_args__ = (
+        Index("ix_kardex_product_fecha", product_id, fecha_movimiento.desc()),
+    )
+    
     # Relationships
     product = relationship("Product", back_populates="kardex_entries")
     user = relationship("Profile")
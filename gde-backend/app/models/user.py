@@ -30,11 +30,21 @@ class Profile(BaseModel):
     guias = relationship("Guia", back_populates="creator")
     costos = relationship("Costo", back_populates="creator")
     pistoleo_sessions = relationship("PistoleoSession", back_populates="user")
-    escaneos = relationship("Escaneo", back_populates="user")
-    audit_logs = relationship("AuditLog", back_populates="user")
     import_logs = relationship("ImportLog", back_populates="user")
     preferences = relationship("UserPreferences", back_populates="user", uselist=False)
-    notifications = relationship("Notification", back_populates="user")
+    # Unbounded per-user histories: load explicitly with selectinload()
+    audit_logs = relationship("AuditLog", back_populates="user", lazy="raise")
+    notifications = relationship("Notification", back_populates="user", lazy="raise")
+    # Scans reference their session, not the user; read-only through pistoleo_sessions
+    escaneos = relationship(
+        "Escaneo",
+        secondary="pistoleo_sessions",
+        primaryjoin="Profile.id == PistoleoSession.usuario_id",
+        secondaryjoin="PistoleoSession.id == Escaneo.session_id",
+        back_populates="user",
+        viewonly=True,
+        lazy="raise"
+    )
     notification_settings = relationship("NotificationSettings", back_populates="user", uselist=False)
     
     def __repr__(self) -> str:
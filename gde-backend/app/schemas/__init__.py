@@ -1,38 +1,72 @@
 """
 Pydantic schemas for request/response validation.
+
+Submodules are imported on first attribute access, so importing one schema
+does not build every model in the package.
 """
-from .common import BaseSchema, PaginationParams, PaginatedResponse
-from .user import ProfileCreate, ProfileUpdate, ProfileResponse, RoleCreate, RoleResponse
-from .product import (
-    ProductCreate, ProductUpdate, ProductResponse, 
-    CategoryCreate, CategoryUpdate, CategoryResponse,
-    KardexCreate, KardexResponse
-)
-from .guia import (
-    GuiaCreate, GuiaUpdate, GuiaResponse,
-    GuiaItemCreate, GuiaItemUpdate, GuiaItemResponse,
-    GuiaMovementCreate, GuiaMovementResponse
-)
-from .pistoleo import (
-    PistoleoSessionCreate, PistoleoSessionUpdate, PistoleoSessionResponse,
-    EscaneoCreate, EscaneoUpdate, EscaneoResponse
-)
-from .costo import (
-    CostoCreate, CostoUpdate, CostoResponse,
-    CostCategoryCreate, CostCategoryUpdate, CostCategoryResponse
-)
-from .audit import AuditLogResponse, ImportLogResponse
-from .config import (
-    CompanyConfigCreate, CompanyConfigUpdate, CompanyConfigResponse,
-    UserPreferencesCreate, UserPreferencesUpdate, UserPreferencesResponse
-)
-from .notification import (
-    NotificationCreate, NotificationUpdate, NotificationResponse,
-    NotificationSettingsUpdate, NotificationSettingsResponse
-)
+import importlib
+from typing import Any, List
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "BaseSchema": "common",
+    "ResponseSchema": "common",
+    "TimestampMixin": "common",
+    "PaginationParams": "common",
+    "PaginatedResponse": "common",
+    "ProfileCreate": "user",
+    "ProfileUpdate": "user",
+    "ProfileResponse": "user",
+    "RoleCreate": "user",
+    "RoleResponse": "user",
+    "ProductCreate": "product",
+    "ProductUpdate": "product",
+    "ProductResponse": "product",
+    "CategoryCreate": "product",
+    "CategoryUpdate": "product",
+    "CategoryResponse": "product",
+    "KardexCreate": "product",
+    "KardexResponse": "product",
+    "GuiaCreate": "guia",
+    "GuiaUpdate": "guia",
+    "GuiaResponse": "guia",
+    "GuiaItemCreate": "guia",
+    "GuiaItemUpdate": "guia",
+    "GuiaItemResponse": "guia",
+    "GuiaMovementCreate": "guia",
+    "GuiaMovementResponse": "guia",
+    "PistoleoSessionCreate": "pistoleo",
+    "PistoleoSessionUpdate": "pistoleo",
+    "PistoleoSessionResponse": "pistoleo",
+    "EscaneoCreate": "pistoleo",
+    "EscaneoUpdate": "pistoleo",
+    "EscaneoResponse": "pistoleo",
+    "CostoCreate": "costo",
+    "CostoUpdate": "costo",
+    "CostoResponse": "costo",
+    "CostCategoryCreate": "costo",
+    "CostCategoryUpdate": "costo",
+    "CostCategoryResponse": "costo",
+    "AuditLogResponse": "audit",
+    "ImportLogResponse": "audit",
+    "CompanyConfigCreate": "config",
+    "CompanyConfigUpdate": "config",
+    "CompanyConfigResponse": "config",
+    "UserPreferencesCreate": "config",
+    "UserPreferencesUpdate": "config",
+    "UserPreferencesResponse": "config",
+    "NotificationCreate": "notification",
+    "NotificationUpdate": "notification",
+    "NotificationResponse": "notification",
+    "NotificationSettingsUpdate": "notification",
+    "NotificationSettingsResponse": "notification",
+}
+
 
 __all__ = [
     "BaseSchema",
+    "ResponseSchema",
+    "TimestampMixin",
     "PaginationParams", 
     "PaginatedResponse",
     "ProfileCreate",
@@ -82,3 +116,19 @@ __all__ = [
     "NotificationSettingsUpdate",
     "NotificationSettingsResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining name on first access (PEP 562)."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List loaded and lazily available names."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,55 +1,190 @@
 """
 Common Pydantic schemas.
 """
-from typing import Any, Dict, Generic, List, Optional, TypeVar
-from pydantic import BaseModel, Field
+import operator
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Generic, List, Optional, TypeVar
+from pydantic import (
+    AfterValidator, BaseModel, BeforeValidator, ConfigDict, Field, StringConstraints, WithJsonSchema
+)
 from datetime import datetime
+from pydantic_core import PydanticCustomError
+
+from ..core.config import settings
 
 DataT = TypeVar('DataT')
 
 
+def doc(description: str) -> Optional[str]:
+    """
+    Field description, kept only when the OpenAPI docs are served.
+    
+    Docs are disabled outside debug mode, so production builds skip storing
+    the description on every FieldInfo and in every core schema.
+    
+    Args:
+        description: Field description
+        
+    Returns:
+        Optional[str]: The description in debug mode, otherwise None
+    """
+    return description if settings.debug else None
+
+# Constrained string types shared across schemas, so each constraint set is
+# declared once instead of per field
+Str10 = Annotated[str, StringConstraints(max_length=10)]
+Str20 = Annotated[str, StringConstraints(max_length=20)]
+Str50 = Annotated[str, StringConstraints(max_length=50)]
+Str100 = Annotated[str, StringConstraints(max_length=100)]
+Str200 = Annotated[str, StringConstraints(max_length=200)]
+RUC = Str20
+Phone = Str20
+ShortCode = Str100
+HexColor = Annotated[str, StringConstraints(max_length=7, pattern=r"^#[0-9A-Fa-f]{6}$")]
+
+
+@lru_cache(maxsize=4096)
+def _validate_email(value: str) -> str:
+    """Validate and normalize an email address; repeated addresses hit the cache."""
+    # Imported on first use: email_validator compiles its grammar at import,
+    # which would otherwise land on every process start
+    from email_validator import validate_email
+    
+    return validate_email(value, check_deliverability=False).normalized
+
+
+# Drop-in for EmailStr with a cached validator
+CachedEmail = Annotated[
+    str,
+    AfterValidator(_validate_email),
+    WithJsonSchema({"type": "string", "format": "email"}),
+]
+
+
+def _check_object(value: Any) -> Any:
+    """Accept a dict as-is, without walking its keys and values."""
+    if isinstance(value, dict):
+        return value
+    raise PydanticCustomError("dict_type", "Input should be a valid dictionary")
+
+
+# Free-form JSON object (extra_data, data, ...): one isinstance check instead
+# of a Dict[str, Any] validator copying the dict key by key
+JSONObject = Annotated[
+    Any,
+    BeforeValidator(_check_object),
+    WithJsonSchema({"type": "object", "additionalProperties": True}),
+]
+
+# Decimal fields stay plain Decimal: pydantic-core already writes them as JSON
+# strings in Rust, and a PlainSerializer would add a Python call per value
+
+
 class BaseSchema(BaseModel):
     """Base schema with common configuration."""
     
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # datetimes use pydantic-core's native ISO 8601 serializer
+    model_config = ConfigDict(from_attributes=True, ser_json_timedelta="iso8601")
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def cached_json_schema(cls) -> Dict[str, Any]:
+        """
+        Validation-mode JSON schema, generated once per schema class.
+        
+        The returned dict is shared between callers and must not be mutated.
+        
+        Returns:
+            Dict[str, Any]: JSON schema
+        """
+        return cls.model_json_schema()
+
+
+class ResponseSchema(BaseSchema):
+    """Base schema for response DTOs, which are never mutated after construction."""
+    
+    # Trust boundary: rows loaded by our own queries may skip validation via
+    # construct_from_orm, but anything derived from request input must still
+    # go through model_validate. Nested response instances are reused as-is,
+    # and strings are never stripped or re-checked on assignment.
+    model_config = ConfigDict(
+        from_attributes=True,
+        frozen=True,
+        extra="ignore",
+        populate_by_name=True,
+        revalidate_instances="never",
+        str_strip_whitespace=False,
+        validate_assignment=False
+    )
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Field names and a C-level getter for them, built once per schema
+        names = tuple(cls.model_fields)
+        cls._field_names = names
+        cls._field_getter = (
+            operator.attrgetter(*names) if len(names) > 1
+            else lambda obj: tuple(getattr(obj, name) for name in names)
+        )
+    
+    @classmethod
+    def construct_from_orm(cls, obj: Any) -> "ResponseSchema":
+        """
+        Build an instance from a trusted ORM object without validation.
+        
+        Only use this when the mapped column types already match the schema's
+        field types; mismatches surface as serialization warnings instead of
+        validation errors.
+        
+        Args:
+            obj: ORM object exposing every schema field as an attribute
+            
+        Returns:
+            ResponseSchema: Unvalidated instance
+        """
+        return cls.model_construct(**dict(zip(cls._field_names, cls._field_getter(obj))))
+
+
+class TimestampMixin(BaseSchema):
+    """Creation and update timestamps shared by response schemas."""
+    
+    created_at: datetime = Field(description=doc("Creation timestamp"))
+    updated_at: datetime = Field(description=doc("Last update timestamp"))
 
 
 class PaginationParams(BaseSchema):
     """Pagination parameters."""
-    skip: int = Field(default=0, ge=0, description="Number of records to skip")
-    limit: int = Field(default=100, ge=1, le=1000, description="Number of records to return")
+    skip: int = Field(default=0, ge=0, description=doc("Number of records to skip"))
+    limit: int = Field(default=100, ge=1, le=1000, description=doc("Number of records to return"))
 
 
-class PaginatedResponse(BaseSchema, Generic[DataT]):
+class PaginatedResponse(ResponseSchema, Generic[DataT]):
     """Paginated response schema."""
-    items: List[DataT] = Field(description="List of items")
-    total: int = Field(description="Total number of items")
-    skip: int = Field(description="Number of items skipped")
-    limit: int = Field(description="Number of items returned")
-    has_next: bool = Field(description="Whether there are more items")
-    has_prev: bool = Field(description="Whether there are previous items")
+    items: List[DataT] = Field(description=doc("List of items"))
+    total: int = Field(description=doc("Total number of items"))
+    skip: int = Field(description=doc("Number of items skipped"))
+    limit: int = Field(description=doc("Number of items returned"))
+    has_next: bool = Field(description=doc("Whether there are more items"))
+    has_prev: bool = Field(description=doc("Whether there are previous items"))
 
 
-class ErrorResponse(BaseSchema):
+class ErrorResponse(ResponseSchema):
     """Error response schema."""
-    message: str = Field(description="Error message")
-    details: Optional[Dict[str, Any]] = Field(default=None, description="Error details")
-    code: Optional[str] = Field(default=None, description="Error code")
+    message: str = Field(description=doc("Error message"))
+    details: Optional[Dict[str, Any]] = Field(default=None, description=doc("Error details"))
+    code: Optional[str] = Field(default=None, description=doc("Error code"))
 
 
-class SuccessResponse(BaseSchema):
+class SuccessResponse(ResponseSchema):
     """Success response schema."""
-    message: str = Field(description="Success message")
-    data: Optional[Dict[str, Any]] = Field(default=None, description="Response data")
+    message: str = Field(description=doc("Success message"))
+    data: Optional[Dict[str, Any]] = Field(default=None, description=doc("Response data"))
 
 
-class HealthCheckResponse(BaseSchema):
+class HealthCheckResponse(ResponseSchema):
     """Health check response schema."""
-    status: str = Field(description="Service status")
-    timestamp: datetime = Field(description="Current timestamp")
-    version: str = Field(description="API version")
-    environment: str = Field(description="Environment")
+    status: str = Field(description=doc("Service status"))
+    timestamp: datetime = Field(description=doc("Current timestamp"))
+    version: str = Field(description=doc("API version"))
+    environment: str = Field(description=doc("Environment"))
@@ -2,24 +2,27 @@
 Configuration schemas.
 """
 from typing import Optional, Dict, Any
-from pydantic import Field, EmailStr
+from pydantic import Field
 
-from .common import BaseSchema
+from .common import (
+    BaseSchema, CachedEmail, Phone, RUC, ResponseSchema, Str10, Str50, Str200, TimestampMixin,
+    doc
+)
 
 
 class CompanyConfigBase(BaseSchema):
     """Base company config schema."""
-    nombre_empresa: str = Field(..., max_length=200, description="Company name")
-    ruc: str = Field(..., max_length=20, description="Company RUC")
-    direccion: Optional[str] = Field(None, description="Company address")
-    telefono: Optional[str] = Field(None, max_length=20, description="Company phone")
-    email: Optional[EmailStr] = Field(None, description="Company email")
-    website: Optional[str] = Field(None, max_length=200, description="Company website")
-    logo_url: Optional[str] = Field(None, description="Logo URL")
-    moneda: str = Field(default="USD", max_length=10, description="Currency")
-    idioma: str = Field(default="es", max_length=10, description="Language")
-    zona_horaria: str = Field(default="America/Guayaquil", max_length=50, description="Time zone")
-    configuraciones: Dict[str, Any] = Field(default_factory=dict, description="Additional configurations")
+    nombre_empresa: Str200 = Field(..., description=doc("Company name"))
+    ruc: RUC = Field(..., description=doc("Company RUC"))
+    direccion: Optional[str] = Field(None, description=doc("Company address"))
+    telefono: Optional[Phone] = Field(None, description=doc("Company phone"))
+    email: Optional[CachedEmail] = Field(None, description=doc("Company email"))
+    website: Optional[Str200] = Field(None, description=doc("Company website"))
+    logo_url: Optional[str] = Field(None, description=doc("Logo URL"))
+    moneda: Str10 = Field(default="USD", description=doc("Currency"))
+    idioma: Str10 = Field(default="es", description=doc("Language"))
+    zona_horaria: Str50 = Field(default="America/Guayaquil", description=doc("Time zone"))
+    configuraciones: Dict[str, Any] = Field(default_factory=dict, description=doc("Additional configurations"))
 
 
 class CompanyConfigCreate(CompanyConfigBase):
@@ -29,66 +32,62 @@ class CompanyConfigCreate(CompanyConfigBase):
 
 class CompanyConfigUpdate(BaseSchema):
     """Company config update schema."""
-    nombre_empresa: Optional[str] = Field(None, max_length=200, description="Company name")
-    ruc: Optional[str] = Field(None, max_length=20, description="Company RUC")
-    direccion: Optional[str] = Field(None, description="Company address")
-    telefono: Optional[str] = Field(None, max_length=20, description="Company phone")
-    email: Optional[EmailStr] = Field(None, description="Company email")
-    website: Optional[str] = Field(None, max_length=200, description="Company website")
-    logo_url: Optional[str] = Field(None, description="Logo URL")
-    moneda: Optional[str] = Field(None, max_length=10, description="Currency")
-    idioma: Optional[str] = Field(None, max_length=10, description="Language")
-    zona_horaria: Optional[str] = Field(None, max_length=50, description="Time zone")
-    configuraciones: Optional[Dict[str, Any]] = Field(None, description="Additional configurations")
-
-
-class CompanyConfigResponse(CompanyConfigBase):
+    nombre_empresa: Optional[Str200] = Field(None, description=doc("Company name"))
+    ruc: Optional[RUC] = Field(None, description=doc("Company RUC"))
+    direccion: Optional[str] = Field(None, description=doc("Company address"))
+    telefono: Optional[Phone] = Field(None, description=doc("Company phone"))
+    email: Optional[CachedEmail] = Field(None, description=doc("Company email"))
+    website: Optional[Str200] = Field(None, description=doc("Company website"))
+    logo_url: Optional[str] = Field(None, description=doc("Logo URL"))
+    moneda: Optional[Str10] = Field(None, description=doc("Currency"))
+    idioma: Optional[Str10] = Field(None, description=doc("Language"))
+    zona_horaria: Optional[Str50] = Field(None, description=doc("Time zone"))
+    configuraciones: Optional[Dict[str, Any]] = Field(None, description=doc("Additional configurations"))
+
+
+class CompanyConfigResponse(CompanyConfigBase, TimestampMixin, ResponseSchema):
     """Company config response schema."""
-    id: int = Field(description="Config ID")
-    created_at: str = Field(description="Creation timestamp")
-    updated_at: str = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Config ID"))
 
 
 class UserPreferencesBase(BaseSchema):
     """Base user preferences schema."""
-    tema: str = Field(default="claro", description="Theme preference")
-    idioma: str = Field(default="es", description="Language preference")
-    zona_horaria: str = Field(default="America/Guayaquil", description="Time zone preference")
-    notificaciones_email: bool = Field(default=True, description="Email notifications enabled")
-    notificaciones_push: bool = Field(default=True, description="Push notifications enabled")
-    pagina_inicio: str = Field(default="dashboard", description="Home page preference")
-    configuraciones: Dict[str, Any] = Field(default_factory=dict, description="Additional preferences")
+    tema: str = Field(default="claro", description=doc("Theme preference"))
+    idioma: str = Field(default="es", description=doc("Language preference"))
+    zona_horaria: str = Field(default="America/Guayaquil", description=doc("Time zone preference"))
+    notificaciones_email: bool = Field(default=True, description=doc("Email notifications enabled"))
+    notificaciones_push: bool = Field(default=True, description=doc("Push notifications enabled"))
+    pagina_inicio: str = Field(default="dashboard", description=doc("Home page preference"))
+    configuraciones: Dict[str, Any] = Field(default_factory=dict, description=doc("Additional preferences"))
 
 
 class UserPreferencesCreate(UserPreferencesBase):
     """User preferences creation schema."""
-    user_id: str = Field(..., description="User ID")
+    user_id: str = Field(..., description=doc("User ID"))
 
 
 class UserPreferencesUpdate(BaseSchema):
     """User preferences update schema."""
-    tema: Optional[str] = Field(None, description="Theme preference")
-    idioma: Optional[str] = Field(None, description="Language preference")
-    zona_horaria: Optional[str] = Field(None, description="Time zone preference")
-    notificaciones_email: Optional[bool] = Field(None, description="Email notifications enabled")
-    notificaciones_push: Optional[bool] = Field(None, description="Push notifications enabled")
-    pagina_inicio: Optional[str] = Field(None, description="Home page preference")
-    configuraciones: Optional[Dict[str, Any]] = Field(None, description="Additional preferences")
+    tema: Optional[str] = Field(None, description=doc("Theme preference"))
+    idioma: Optional[str] = Field(None, description=doc("Language preference"))
+    zona_horaria: Optional[str] = Field(None, description=doc("Time zone preference"))
+    notificaciones_email: Optional[bool] = Field(None, description=doc("Email notifications enabled"))
+    notificaciones_push: Optional[bool] = Field(None, description=doc("Push notifications enabled"))
+    pagina_inicio: Optional[str] = Field(None, description=doc("Home page preference"))
+    configuraciones: Optional[Dict[str, Any]] = Field(None, description=doc("Additional preferences"))
 
 
-class UserPreferencesResponse(UserPreferencesBase):
+class UserPreferencesResponse(UserPreferencesBase, TimestampMixin, ResponseSchema):
     """User preferences response schema."""
-    id: int = Field(description="Preferences ID")
-    user_id: str = Field(description="User ID")
-    created_at: str = Field(description="Creation timestamp")
-    updated_at: str = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Preferences ID"))
+    user_id: str = Field(description=doc("User ID"))
 
 
-class SystemSettingsResponse(BaseSchema):
+class SystemSettingsResponse(ResponseSchema):
     """System settings response schema."""
-    company_config: CompanyConfigResponse = Field(description="Company configuration")
-    default_preferences: UserPreferencesResponse = Field(description="Default user preferences")
-    available_themes: list = Field(description="Available themes")
-    available_languages: list = Field(description="Available languages")
-    available_timezones: list = Field(description="Available time zones")
-    supported_currencies: list = Field(description="Supported currencies")
+    company_config: CompanyConfigResponse = Field(description=doc("Company configuration"))
+    default_preferences: UserPreferencesResponse = Field(description=doc("Default user preferences"))
+    available_themes: list = Field(description=doc("Available themes"))
+    available_languages: list = Field(description=doc("Available languages"))
+    available_timezones: list = Field(description=doc("Available time zones"))
+    supported_currencies: list = Field(description=doc("Supported currencies"))
@@ -6,18 +6,20 @@ from pydantic import Field
 from datetime import date
 from decimal import Decimal
 
-from .common import BaseSchema
+from .common import (
+    BaseSchema, HexColor, ResponseSchema, ShortCode, Str100, Str200, TimestampMixin, doc
+)
 
 
 class CostCategoryBase(BaseSchema):
     """Base cost category schema."""
-    name: str = Field(..., max_length=100, description="Category name")
-    description: Optional[str] = Field(None, description="Category description")
-    parent_id: Optional[int] = Field(None, description="Parent category ID")
-    tipo: str = Field(..., description="Category type (gasto, ingreso, costo)")
-    color: Optional[str] = Field(None, max_length=7, description="Hex color code")
-    is_active: bool = Field(default=True, description="Whether category is active")
-    sort_order: int = Field(default=0, description="Sort order")
+    name: Str100 = Field(..., description=doc("Category name"))
+    description: Optional[str] = Field(None, description=doc("Category description"))
+    parent_id: Optional[int] = Field(None, description=doc("Parent category ID"))
+    tipo: str = Field(..., description=doc("Category type (gasto, ingreso, costo)"))
+    color: Optional[HexColor] = Field(None, description=doc("Hex color code"))
+    is_active: bool = Field(default=True, description=doc("Whether category is active"))
+    sort_order: int = Field(default=0, description=doc("Sort order"))
 
 
 class CostCategoryCreate(CostCategoryBase):
@@ -27,38 +29,36 @@ class CostCategoryCreate(CostCategoryBase):
 
 class CostCategoryUpdate(BaseSchema):
     """Cost category update schema."""
-    name: Optional[str] = Field(None, max_length=100, description="Category name")
-    description: Optional[str] = Field(None, description="Category description")
-    parent_id: Optional[int] = Field(None, description="Parent category ID")
-    tipo: Optional[str] = Field(None, description="Category type")
-    color: Optional[str] = Field(None, max_length=7, description="Hex color code")
-    is_active: Optional[bool] = Field(None, description="Whether category is active")
-    sort_order: Optional[int] = Field(None, description="Sort order")
+    name: Optional[Str100] = Field(None, description=doc("Category name"))
+    description: Optional[str] = Field(None, description=doc("Category description"))
+    parent_id: Optional[int] = Field(None, description=doc("Parent category ID"))
+    tipo: Optional[str] = Field(None, description=doc("Category type"))
+    color: Optional[HexColor] = Field(None, description=doc("Hex color code"))
+    is_active: Optional[bool] = Field(None, description=doc("Whether category is active"))
+    sort_order: Optional[int] = Field(None, description=doc("Sort order"))
 
 
-class CostCategoryResponse(CostCategoryBase):
+class CostCategoryResponse(CostCategoryBase, TimestampMixin, ResponseSchema):
     """Cost category response schema."""
-    id: int = Field(description="Category ID")
-    created_at: str = Field(description="Creation timestamp")
-    updated_at: str = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Category ID"))
 
 
 class CostoBase(BaseSchema):
     """Base costo schema."""
-    fecha: date = Field(..., description="Date")
-    categoria_id: int = Field(..., description="Category ID")
-    subcategoria: Optional[str] = Field(None, max_length=100, description="Subcategory")
-    descripcion: str = Field(..., description="Description")
-    monto: Decimal = Field(..., description="Amount")
-    proveedor: Optional[str] = Field(None, max_length=200, description="Supplier")
-    documento: Optional[str] = Field(None, max_length=100, description="Document type")
-    numero_documento: Optional[str] = Field(None, max_length=100, description="Document number")
-    tipo_documento: Optional[str] = Field(None, description="Document type")
-    fecha_documento: Optional[date] = Field(None, description="Document date")
-    estado: str = Field(default="pendiente", description="Status")
-    metodo_pago: str = Field(default="transferencia", description="Payment method")
-    observaciones: Optional[str] = Field(None, description="Observations")
-    evidencias: Optional[List[str]] = Field(None, description="Evidence URLs")
+    fecha: date = Field(..., description=doc("Date"))
+    categoria_id: int = Field(..., description=doc("Category ID"))
+    subcategoria: Optional[Str100] = Field(None, description=doc("Subcategory"))
+    descripcion: str = Field(..., description=doc("Description"))
+    monto: Decimal = Field(..., description=doc("Amount"))
+    proveedor: Optional[Str200] = Field(None, description=doc("Supplier"))
+    documento: Optional[Str100] = Field(None, description=doc("Document type"))
+    numero_documento: Optional[ShortCode] = Field(None, description=doc("Document number"))
+    tipo_documento: Optional[str] = Field(None, description=doc("Document type"))
+    fecha_documento: Optional[date] = Field(None, description=doc("Document date"))
+    estado: str = Field(default="pendiente", description=doc("Status"))
+    metodo_pago: str = Field(default="transferencia", description=doc("Payment method"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
+    evidencias: Optional[List[str]] = Field(None, description=doc("Evidence URLs"))
 
 
 class CostoCreate(CostoBase):
@@ -68,67 +68,80 @@ class CostoCreate(CostoBase):
 
 class CostoUpdate(BaseSchema):
     """Costo update schema."""
-    fecha: Optional[date] = Field(None, description="Date")
-    categoria_id: Optional[int] = Field(None, description="Category ID")
-    subcategoria: Optional[str] = Field(None, max_length=100, description="Subcategory")
-    descripcion: Optional[str] = Field(None, description="Description")
-    monto: Optional[Decimal] = Field(None, description="Amount")
-    proveedor: Optional[str] = Field(None, max_length=200, description="Supplier")
-    documento: Optional[str] = Field(None, max_length=100, description="Document type")
-    numero_documento: Optional[str] = Field(None, max_length=100, description="Document number")
-    tipo_documento: Optional[str] = Field(None, description="Document type")
-    fecha_documento: Optional[date] = Field(None, description="Document date")
-    estado: Optional[str] = Field(None, description="Status")
-    metodo_pago: Optional[str] = Field(None, description="Payment method")
-    observaciones: Optional[str] = Field(None, description="Observations")
-    evidencias: Optional[List[str]] = Field(None, description="Evidence URLs")
-
-
-class CostoResponse(CostoBase):
+    fecha: Optional[date] = Field(None, description=doc("Date"))
+    categoria_id: Optional[int] = Field(None, description=doc("Category ID"))
+    subcategoria: Optional[Str100] = Field(None, description=doc("Subcategory"))
+    descripcion: Optional[str] = Field(None, description=doc("Description"))
+    monto: Optional[Decimal] = Field(None, description=doc("Amount"))
+    proveedor: Optional[Str200] = Field(None, description=doc("Supplier"))
+    documento: Optional[Str100] = Field(None, description=doc("Document type"))
+    numero_documento: Optional[ShortCode] = Field(None, description=doc("Document number"))
+    tipo_documento: Optional[str] = Field(None, description=doc("Document type"))
+    fecha_documento: Optional[date] = Field(None, description=doc("Document date"))
+    estado: Optional[str] = Field(None, description=doc("Status"))
+    metodo_pago: Optional[str] = Field(None, description=doc("Payment method"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
+    evidencias: Optional[List[str]] = Field(None, description=doc("Evidence URLs"))
+
+
+class CostoResponse(CostoBase, TimestampMixin, ResponseSchema):
     """Costo response schema."""
-    id: int = Field(description="Costo ID")
-    created_at: str = Field(description="Creation timestamp")
-    updated_at: str = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Costo ID"))
 
 
 class FinancialReportRequest(BaseSchema):
     """Financial report request schema."""
-    fecha_inicio: date = Field(..., description="Start date")
-    fecha_fin: date = Field(..., description="End date")
-    categoria_id: Optional[int] = Field(None, description="Category ID filter")
-    tipo: Optional[str] = Field(None, description="Type filter")
-    estado: Optional[str] = Field(None, description="Status filter")
-    group_by: Optional[str] = Field(None, description="Group by field")
+    fecha_inicio: date = Field(..., description=doc("Start date"))
+    fecha_fin: date = Field(..., description=doc("End date"))
+    categoria_id: Optional[int] = Field(None, description=doc("Category ID filter"))
+    tipo: Optional[str] = Field(None, description=doc("Type filter"))
+    estado: Optional[str] = Field(None, description=doc("Status filter"))
+    group_by: Optional[str] = Field(None, description=doc("Group by field"))
 
 
-class FinancialReportResponse(BaseSchema):
+class CategorySummary(ResponseSchema):
+    """Per-category totals within a financial report."""
+    categoria_id: int = Field(description=doc("Category ID"))
+    categoria_nombre: str = Field(description=doc("Category name"))
+    total: Decimal = Field(description=doc("Total amount"))
+    count: int = Field(description=doc("Number of records"))
+
+
+class TrendPoint(ResponseSchema):
+    """Total for one period of a trend series."""
+    periodo: str = Field(description=doc("Period start (ISO date)"))
+    total: Decimal = Field(description=doc("Total amount"))
+    count: int = Field(default=0, description=doc("Number of records"))
+
+
+class FinancialReportResponse(ResponseSchema):
     """Financial report response schema."""
-    periodo: str = Field(description="Report period")
-    total_ingresos: Decimal = Field(description="Total income")
-    total_gastos: Decimal = Field(description="Total expenses")
-    total_costos: Decimal = Field(description="Total costs")
-    balance: Decimal = Field(description="Balance")
-    categorias: List[dict] = Field(description="Summary by category")
-    tendencia: List[dict] = Field(description="Trend data")
+    periodo: str = Field(description=doc("Report period"))
+    total_ingresos: Decimal = Field(description=doc("Total income"))
+    total_gastos: Decimal = Field(description=doc("Total expenses"))
+    total_costos: Decimal = Field(description=doc("Total costs"))
+    balance: Decimal = Field(description=doc("Balance"))
+    categorias: List[CategorySummary] = Field(description=doc("Summary by category"))
+    tendencia: List[TrendPoint] = Field(description=doc("Trend data"))
 
 
-class CostAnalysisResponse(BaseSchema):
+class CostAnalysisResponse(ResponseSchema):
     """Cost analysis response schema."""
-    categoria_id: int = Field(description="Category ID")
-    categoria_nombre: str = Field(description="Category name")
-    total_monto: Decimal = Field(description="Total amount")
-    cantidad_registros: int = Field(description="Number of records")
-    promedio_monto: Decimal = Field(description="Average amount")
-    porcentaje_total: Decimal = Field(description="Percentage of total")
-    tendencia_mensual: List[dict] = Field(description="Monthly trend")
+    categoria_id: int = Field(description=doc("Category ID"))
+    categoria_nombre: str = Field(description=doc("Category name"))
+    total_monto: Decimal = Field(description=doc("Total amount"))
+    cantidad_registros: int = Field(description=doc("Number of records"))
+    promedio_monto: Decimal = Field(description=doc("Average amount"))
+    porcentaje_total: Decimal = Field(description=doc("Percentage of total"))
+    tendencia_mensual: List[TrendPoint] = Field(description=doc("Monthly trend"))
 
 
-class BudgetAlertResponse(BaseSchema):
+class BudgetAlertResponse(ResponseSchema):
     """Budget alert response schema."""
-    categoria_id: int = Field(description="Category ID")
-    categoria_nombre: str = Field(description="Category name")
-    presupuesto: Decimal = Field(description="Budget amount")
-    gastado: Decimal = Field(description="Spent amount")
-    porcentaje_usado: Decimal = Field(description="Percentage used")
-    alerta_tipo: str = Field(description="Alert type")
-    severidad: str = Field(description="Alert severity")
+    categoria_id: int = Field(description=doc("Category ID"))
+    categoria_nombre: str = Field(description=doc("Category name"))
+    presupuesto: Decimal = Field(description=doc("Budget amount"))
+    gastado: Decimal = Field(description=doc("Spent amount"))
+    porcentaje_usado: Decimal = Field(description=doc("Percentage used"))
+    alerta_tipo: str = Field(description=doc("Alert type"))
+    severidad: str = Field(description=doc("Alert severity"))
@@ -2,31 +2,34 @@
 Guia (dispatch guide) schemas.
 """
 from typing import Optional, List
-from pydantic import Field, EmailStr
+from pydantic import Field, TypeAdapter
 from datetime import datetime, date
 from decimal import Decimal
 
-from .common import BaseSchema
+from .common import (
+    BaseSchema, CachedEmail, Phone, RUC, ResponseSchema, ShortCode, Str50, Str100, Str200,
+    TimestampMixin, doc
+)
 
 
 class GuiaBase(BaseSchema):
     """Base guia schema."""
-    codigo: str = Field(..., max_length=100, description="Guide code")
-    estado: str = Field(default="pendiente", description="Guide status")
-    cliente_nombre: str = Field(..., max_length=200, description="Client name")
-    cliente_ruc: Optional[str] = Field(None, max_length=20, description="Client RUC")
-    cliente_direccion: Optional[str] = Field(None, description="Client address")
-    cliente_telefono: Optional[str] = Field(None, max_length=20, description="Client phone")
-    cliente_email: Optional[EmailStr] = Field(None, description="Client email")
-    direccion_entrega: Optional[str] = Field(None, description="Delivery address")
-    fecha_estimada_entrega: Optional[date] = Field(None, description="Estimated delivery date")
-    ubicacion_actual: Optional[str] = Field(None, max_length=100, description="Current location")
-    transportista: Optional[str] = Field(None, max_length=100, description="Carrier")
-    numero_guia_transportista: Optional[str] = Field(None, max_length=100, description="Carrier guide number")
-    peso_total: Optional[Decimal] = Field(None, description="Total weight")
-    volumen_total: Optional[Decimal] = Field(None, description="Total volume")
-    valor_declarado: Optional[Decimal] = Field(None, description="Declared value")
-    observaciones: Optional[str] = Field(None, description="Observations")
+    codigo: ShortCode = Field(..., description=doc("Guide code"))
+    estado: str = Field(default="pendiente", description=doc("Guide status"))
+    cliente_nombre: Str200 = Field(..., description=doc("Client name"))
+    cliente_ruc: Optional[RUC] = Field(None, description=doc("Client RUC"))
+    cliente_direccion: Optional[str] = Field(None, description=doc("Client address"))
+    cliente_telefono: Optional[Phone] = Field(None, description=doc("Client phone"))
+    cliente_email: Optional[CachedEmail] = Field(None, description=doc("Client email"))
+    direccion_entrega: Optional[str] = Field(None, description=doc("Delivery address"))
+    fecha_estimada_entrega: Optional[date] = Field(None, description=doc("Estimated delivery date"))
+    ubicacion_actual: Optional[Str100] = Field(None, description=doc("Current location"))
+    transportista: Optional[Str100] = Field(None, description=doc("Carrier"))
+    numero_guia_transportista: Optional[ShortCode] = Field(None, description=doc("Carrier guide number"))
+    peso_total: Optional[Decimal] = Field(None, description=doc("Total weight"))
+    volumen_total: Optional[Decimal] = Field(None, description=doc("Total volume"))
+    valor_declarado: Optional[Decimal] = Field(None, description=doc("Declared value"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
 
 
 class GuiaCreate(GuiaBase):
@@ -36,43 +39,41 @@ class GuiaCreate(GuiaBase):
 
 class GuiaUpdate(BaseSchema):
     """Guia update schema."""
-    codigo: Optional[str] = Field(None, max_length=100, description="Guide code")
-    estado: Optional[str] = Field(None, description="Guide status")
-    cliente_nombre: Optional[str] = Field(None, max_length=200, description="Client name")
-    cliente_ruc: Optional[str] = Field(None, max_length=20, description="Client RUC")
-    cliente_direccion: Optional[str] = Field(None, description="Client address")
-    cliente_telefono: Optional[str] = Field(None, max_length=20, description="Client phone")
-    cliente_email: Optional[EmailStr] = Field(None, description="Client email")
-    direccion_entrega: Optional[str] = Field(None, description="Delivery address")
-    fecha_estimada_entrega: Optional[date] = Field(None, description="Estimated delivery date")
-    fecha_entrega_real: Optional[datetime] = Field(None, description="Actual delivery date")
-    ubicacion_actual: Optional[str] = Field(None, max_length=100, description="Current location")
-    transportista: Optional[str] = Field(None, max_length=100, description="Carrier")
-    numero_guia_transportista: Optional[str] = Field(None, max_length=100, description="Carrier guide number")
-    peso_total: Optional[Decimal] = Field(None, description="Total weight")
-    volumen_total: Optional[Decimal] = Field(None, description="Total volume")
-    valor_declarado: Optional[Decimal] = Field(None, description="Declared value")
-    observaciones: Optional[str] = Field(None, description="Observations")
-
-
-class GuiaResponse(GuiaBase):
+    codigo: Optional[ShortCode] = Field(None, description=doc("Guide code"))
+    estado: Optional[str] = Field(None, description=doc("Guide status"))
+    cliente_nombre: Optional[Str200] = Field(None, description=doc("Client name"))
+    cliente_ruc: Optional[RUC] = Field(None, description=doc("Client RUC"))
+    cliente_direccion: Optional[str] = Field(None, description=doc("Client address"))
+    cliente_telefono: Optional[Phone] = Field(None, description=doc("Client phone"))
+    cliente_email: Optional[CachedEmail] = Field(None, description=doc("Client email"))
+    direccion_entrega: Optional[str] = Field(None, description=doc("Delivery address"))
+    fecha_estimada_entrega: Optional[date] = Field(None, description=doc("Estimated delivery date"))
+    fecha_entrega_real: Optional[datetime] = Field(None, description=doc("Actual delivery date"))
+    ubicacion_actual: Optional[Str100] = Field(None, description=doc("Current location"))
+    transportista: Optional[Str100] = Field(None, description=doc("Carrier"))
+    numero_guia_transportista: Optional[ShortCode] = Field(None, description=doc("Carrier guide number"))
+    peso_total: Optional[Decimal] = Field(None, description=doc("Total weight"))
+    volumen_total: Optional[Decimal] = Field(None, description=doc("Total volume"))
+    valor_declarado: Optional[Decimal] = Field(None, description=doc("Declared value"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
+
+
+class GuiaResponse(GuiaBase, TimestampMixin, ResponseSchema):
     """Guia response schema."""
-    id: int = Field(description="Guia ID")
-    fecha_creacion: datetime = Field(description="Creation date")
-    fecha_entrega_real: Optional[datetime] = Field(None, description="Actual delivery date")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Guia ID"))
+    fecha_creacion: datetime = Field(description=doc("Creation date"))
+    fecha_entrega_real: Optional[datetime] = Field(None, description=doc("Actual delivery date"))
 
 
 class GuiaItemBase(BaseSchema):
     """Base guia item schema."""
-    guia_id: int = Field(..., description="Guia ID")
-    product_id: int = Field(..., description="Product ID")
-    cantidad: int = Field(..., description="Quantity")
-    precio_unitario: Optional[Decimal] = Field(None, description="Unit price")
-    descuento: Decimal = Field(default=0, description="Discount")
-    subtotal: Optional[Decimal] = Field(None, description="Subtotal")
-    observaciones: Optional[str] = Field(None, description="Observations")
+    guia_id: int = Field(..., description=doc("Guia ID"))
+    product_id: int = Field(..., description=doc("Product ID"))
+    cantidad: int = Field(..., description=doc("Quantity"))
+    precio_unitario: Optional[Decimal] = Field(None, description=doc("Unit price"))
+    descuento: Decimal = Field(default=0, description=doc("Discount"))
+    subtotal: Optional[Decimal] = Field(None, description=doc("Subtotal"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
 
 
 class GuiaItemCreate(GuiaItemBase):
@@ -82,29 +83,27 @@ class GuiaItemCreate(GuiaItemBase):
 
 class GuiaItemUpdate(BaseSchema):
     """Guia item update schema."""
-    product_id: Optional[int] = Field(None, description="Product ID")
-    cantidad: Optional[int] = Field(None, description="Quantity")
-    precio_unitario: Optional[Decimal] = Field(None, description="Unit price")
-    descuento: Optional[Decimal] = Field(None, description="Discount")
-    subtotal: Optional[Decimal] = Field(None, description="Subtotal")
-    observaciones: Optional[str] = Field(None, description="Observations")
+    product_id: Optional[int] = Field(None, description=doc("Product ID"))
+    cantidad: Optional[int] = Field(None, description=doc("Quantity"))
+    precio_unitario: Optional[Decimal] = Field(None, description=doc("Unit price"))
+    descuento: Optional[Decimal] = Field(None, description=doc("Discount"))
+    subtotal: Optional[Decimal] = Field(None, description=doc("Subtotal"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
 
 
-class GuiaItemResponse(GuiaItemBase):
+class GuiaItemResponse(GuiaItemBase, TimestampMixin, ResponseSchema):
     """Guia item response schema."""
-    id: int = Field(description="Guia item ID")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Guia item ID"))
 
 
 class GuiaMovementBase(BaseSchema):
     """Base guia movement schema."""
-    guia_id: int = Field(..., description="Guia ID")
-    accion: str = Field(..., max_length=50, description="Action")
-    ubicacion: Optional[str] = Field(None, max_length=100, description="Location")
-    observaciones: Optional[str] = Field(None, description="Observations")
-    evidencias: Optional[List[str]] = Field(None, description="Evidence URLs")
-    fecha_movimiento: Optional[datetime] = Field(None, description="Movement date")
+    guia_id: int = Field(..., description=doc("Guia ID"))
+    accion: Str50 = Field(..., description=doc("Action"))
+    ubicacion: Optional[Str100] = Field(None, description=doc("Location"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
+    evidencias: Optional[List[str]] = Field(None, description=doc("Evidence URLs"))
+    fecha_movimiento: Optional[datetime] = Field(None, description=doc("Movement date"))
 
 
 class GuiaMovementCreate(GuiaMovementBase):
@@ -114,35 +113,49 @@ class GuiaMovementCreate(GuiaMovementBase):
 
 class GuiaMovementUpdate(BaseSchema):
     """Guia movement update schema."""
-    accion: Optional[str] = Field(None, max_length=50, description="Action")
-    ubicacion: Optional[str] = Field(None, max_length=100, description="Location")
-    observaciones: Optional[str] = Field(None, description="Observations")
-    evidencias: Optional[List[str]] = Field(None, description="Evidence URLs")
-    fecha_movimiento: Optional[datetime] = Field(None, description="Movement date")
+    accion: Optional[Str50] = Field(None, description=doc("Action"))
+    ubicacion: Optional[Str100] = Field(None, description=doc("Location"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
+    evidencias: Optional[List[str]] = Field(None, description=doc("Evidence URLs"))
+    fecha_movimiento: Optional[datetime] = Field(None, description=doc("Movement date"))
 
 
-class GuiaMovementResponse(GuiaMovementBase):
+class GuiaMovementResponse(GuiaMovementBase, TimestampMixin, ResponseSchema):
     """Guia movement response schema."""
-    id: int = Field(description="Guia movement ID")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Guia movement ID"))
 
 
 class GuiaStatusUpdate(BaseSchema):
     """Guia status update schema."""
-    estado: str = Field(..., description="New status")
-    observaciones: Optional[str] = Field(None, description="Status change observations")
-    ubicacion: Optional[str] = Field(None, description="Current location")
-    evidencias: Optional[List[str]] = Field(None, description="Evidence URLs")
+    estado: str = Field(..., description=doc("New status"))
+    observaciones: Optional[str] = Field(None, description=doc("Status change observations"))
+    ubicacion: Optional[str] = Field(None, description=doc("Current location"))
+    evidencias: Optional[List[str]] = Field(None, description=doc("Evidence URLs"))
 
 
-class GuiaTrackingResponse(BaseSchema):
+class GuiaTrackingResponse(ResponseSchema):
     """Guia tracking response schema."""
-    guia_id: int = Field(description="Guia ID")
-    codigo: str = Field(description="Guide code")
-    estado: str = Field(description="Current status")
-    ubicacion_actual: Optional[str] = Field(None, description="Current location")
-    fecha_creacion: datetime = Field(description="Creation date")
-    fecha_estimada_entrega: Optional[date] = Field(None, description="Estimated delivery date")
-    fecha_entrega_real: Optional[datetime] = Field(None, description="Actual delivery date")
-    movimientos: List[GuiaMovementResponse] = Field(description="Movement history")
+    guia_id: int = Field(description=doc("Guia ID"))
+    codigo: str = Field(description=doc("Guide code"))
+    estado: str = Field(description=doc("Current status"))
+    ubicacion_actual: Optional[str] = Field(None, description=doc("Current location"))
+    fecha_creacion: datetime = Field(description=doc("Creation date"))
+    fecha_estimada_entrega: Optional[date] = Field(None, description=doc("Estimated delivery date"))
+    fecha_entrega_real: Optional[datetime] = Field(None, description=doc("Actual delivery date"))
+    movimientos: List[GuiaMovementResponse] = Field(description=doc("Movement history"))
+    
+    def to_json(self) -> bytes:
+        """
+        Serialize to JSON, dumping the movement history through its own list adapter.
+        
+        Returns:
+            bytes: JSON body, identical to model_dump_json()
+        """
+        head = self.__pydantic_serializer__.to_json(self, exclude={"movimientos"})
+        movimientos = GuiaMovementListAdapter.dump_json(self.movimientos)
+        return b"".join((head[:-1], b',"movimientos":', movimientos, b"}"))
+
+
+# Built once at import so list endpoints reuse the compiled core schema
+GuiaResponseListAdapter = TypeAdapter(List[GuiaResponse])
+GuiaMovementListAdapter = TypeAdapter(List[GuiaMovementResponse])
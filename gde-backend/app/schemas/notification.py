@@ -1,52 +1,50 @@
 """
 Notification schemas.
 """
-from typing import Optional, Dict, Any
+from typing import Optional
 from pydantic import Field
 from datetime import datetime
 import uuid
 
-from .common import BaseSchema
+from .common import BaseSchema, JSONObject, ResponseSchema, Str200, TimestampMixin, doc
 
 
 class NotificationBase(BaseSchema):
     """Base notification schema."""
-    title: str = Field(..., max_length=200, description="Notification title")
-    message: str = Field(..., description="Notification message")
-    type: Optional[str] = Field(None, description="Notification type")
-    priority: str = Field(default="normal", description="Notification priority")
-    data: Optional[Dict[str, Any]] = Field(None, description="Additional notification data")
+    title: Str200 = Field(..., description=doc("Notification title"))
+    message: str = Field(..., description=doc("Notification message"))
+    type: Optional[str] = Field(None, description=doc("Notification type"))
+    priority: str = Field(default="normal", description=doc("Notification priority"))
+    data: Optional[JSONObject] = Field(None, description=doc("Additional notification data"))
 
 
 class NotificationCreate(NotificationBase):
     """Notification creation schema."""
-    user_id: uuid.UUID = Field(..., description="User ID")
+    user_id: uuid.UUID = Field(..., description=doc("User ID"))
 
 
 class NotificationUpdate(BaseSchema):
     """Notification update schema."""
-    is_read: Optional[bool] = Field(None, description="Whether notification is read")
-    read_at: Optional[datetime] = Field(None, description="Read timestamp")
+    is_read: Optional[bool] = Field(None, description=doc("Whether notification is read"))
+    read_at: Optional[datetime] = Field(None, description=doc("Read timestamp"))
 
 
-class NotificationResponse(NotificationBase):
+class NotificationResponse(NotificationBase, TimestampMixin, ResponseSchema):
     """Notification response schema."""
-    id: int = Field(description="Notification ID")
-    user_id: uuid.UUID = Field(description="User ID")
-    is_read: bool = Field(description="Whether notification is read")
-    sent_at: datetime = Field(description="Sent timestamp")
-    read_at: Optional[datetime] = Field(None, description="Read timestamp")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Notification ID"))
+    user_id: uuid.UUID = Field(description=doc("User ID"))
+    is_read: bool = Field(description=doc("Whether notification is read"))
+    sent_at: datetime = Field(description=doc("Sent timestamp"))
+    read_at: Optional[datetime] = Field(None, description=doc("Read timestamp"))
 
 
 class NotificationSettingsBase(BaseSchema):
     """Base notification settings schema."""
-    email_notifications: bool = Field(default=True, description="Enable email notifications")
-    push_notifications: bool = Field(default=True, description="Enable push notifications")
-    stock_alerts: bool = Field(default=True, description="Enable stock alerts")
-    guide_updates: bool = Field(default=True, description="Enable guide updates")
-    system_notifications: bool = Field(default=True, description="Enable system notifications")
+    email_notifications: bool = Field(default=True, description=doc("Enable email notifications"))
+    push_notifications: bool = Field(default=True, description=doc("Enable push notifications"))
+    stock_alerts: bool = Field(default=True, description=doc("Enable stock alerts"))
+    guide_updates: bool = Field(default=True, description=doc("Enable guide updates"))
+    system_notifications: bool = Field(default=True, description=doc("Enable system notifications"))
 
 
 class NotificationSettingsUpdate(NotificationSettingsBase):
@@ -58,22 +56,15 @@ class NotificationSettingsUpdate(NotificationSettingsBase):
     system_notifications: Optional[bool] = None
 
 
-class NotificationSettingsResponse(NotificationSettingsBase):
+class NotificationSettingsResponse(NotificationSettingsBase, TimestampMixin, ResponseSchema):
     """Notification settings response schema."""
-    id: int = Field(description="Settings ID")
-    user_id: uuid.UUID = Field(description="User ID")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Settings ID"))
+    user_id: uuid.UUID = Field(description=doc("User ID"))
 
 
-class BulkNotificationCreate(BaseSchema):
+class BulkNotificationCreate(NotificationBase):
     """Bulk notification creation schema."""
-    title: str = Field(..., max_length=200, description="Notification title")
-    message: str = Field(..., description="Notification message")
-    type: Optional[str] = Field(None, description="Notification type")
-    priority: str = Field(default="normal", description="Notification priority")
-    data: Optional[Dict[str, Any]] = Field(None, description="Additional notification data")
-    user_ids: list[uuid.UUID] = Field(..., description="List of user IDs")
+    user_ids: list[uuid.UUID] = Field(..., description=doc("List of user IDs"))
 
 
 
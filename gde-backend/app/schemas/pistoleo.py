@@ -4,17 +4,18 @@ Pistoleo (scanning) schemas.
 from typing import Optional, Dict, Any
 from pydantic import Field
 from datetime import datetime
-from decimal import Decimal
 
-from .common import BaseSchema
+from .common import (
+    BaseSchema, JSONObject, ResponseSchema, Str20, Str100, TimestampMixin, doc
+)
 
 
 class PistoleoSessionBase(BaseSchema):
     """Base pistoleo session schema."""
-    codigo_qr: str = Field(..., max_length=100, description="QR code")
-    nombre_sesion: Optional[str] = Field(None, max_length=100, description="Session name")
-    ubicacion: Optional[str] = Field(None, max_length=100, description="Location")
-    observaciones: Optional[str] = Field(None, description="Observations")
+    codigo_qr: Str100 = Field(..., description=doc("QR code"))
+    nombre_sesion: Optional[Str100] = Field(None, description=doc("Session name"))
+    ubicacion: Optional[Str100] = Field(None, description=doc("Location"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
 
 
 class PistoleoSessionCreate(PistoleoSessionBase):
@@ -24,39 +25,37 @@ class PistoleoSessionCreate(PistoleoSessionBase):
 
 class PistoleoSessionUpdate(BaseSchema):
     """Pistoleo session update schema."""
-    nombre_sesion: Optional[str] = Field(None, max_length=100, description="Session name")
-    estado: Optional[str] = Field(None, description="Session status")
-    ubicacion: Optional[str] = Field(None, max_length=100, description="Location")
-    observaciones: Optional[str] = Field(None, description="Observations")
+    nombre_sesion: Optional[Str100] = Field(None, description=doc("Session name"))
+    estado: Optional[str] = Field(None, description=doc("Session status"))
+    ubicacion: Optional[Str100] = Field(None, description=doc("Location"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
 
 
-class PistoleoSessionResponse(PistoleoSessionBase):
+class PistoleoSessionResponse(PistoleoSessionBase, TimestampMixin, ResponseSchema):
     """Pistoleo session response schema."""
-    id: int = Field(description="Session ID")
-    fecha_inicio: datetime = Field(description="Start date")
-    fecha_fin: Optional[datetime] = Field(None, description="End date")
-    estado: str = Field(description="Session status")
-    escaneos_totales: int = Field(description="Total scans")
-    guias_procesadas: int = Field(description="Processed guides")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Session ID"))
+    fecha_inicio: datetime = Field(description=doc("Start date"))
+    fecha_fin: Optional[datetime] = Field(None, description=doc("End date"))
+    estado: str = Field(description=doc("Session status"))
+    escaneos_totales: int = Field(description=doc("Total scans"))
+    guias_procesadas: int = Field(description=doc("Processed guides"))
 
 
 class EscaneoBase(BaseSchema):
     """Base escaneo schema."""
-    session_id: int = Field(..., description="Session ID")
-    guia_id: Optional[int] = Field(None, description="Guia ID")
-    codigo_barras: str = Field(..., max_length=100, description="Barcode")
-    tipo_codigo: str = Field(default="CODE128", max_length=20, description="Code type")
-    dispositivo: Optional[str] = Field(None, max_length=100, description="Device")
-    ubicacion: Optional[str] = Field(None, max_length=100, description="Location")
-    latitud: Optional[Decimal] = Field(None, description="Latitude")
-    longitud: Optional[Decimal] = Field(None, description="Longitude")
-    precision_gps: Optional[Decimal] = Field(None, description="GPS precision")
-    imagen_url: Optional[str] = Field(None, description="Image URL")
-    estado_escaneo: str = Field(default="success", description="Scan status")
-    mensaje_error: Optional[str] = Field(None, description="Error message")
-    extra_data: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    session_id: int = Field(..., description=doc("Session ID"))
+    guia_id: Optional[int] = Field(None, description=doc("Guia ID"))
+    codigo_barras: Str100 = Field(..., description=doc("Barcode"))
+    tipo_codigo: Str20 = Field(default="CODE128", description=doc("Code type"))
+    dispositivo: Optional[Str100] = Field(None, description=doc("Device"))
+    ubicacion: Optional[Str100] = Field(None, description=doc("Location"))
+    latitud: Optional[float] = Field(None, description=doc("Latitude in decimal degrees, stored to 8 places"))
+    longitud: Optional[float] = Field(None, description=doc("Longitude in decimal degrees, stored to 8 places"))
+    precision_gps: Optional[float] = Field(None, description=doc("GPS precision, stored to 2 places"))
+    imagen_url: Optional[str] = Field(None, description=doc("Image URL"))
+    estado_escaneo: str = Field(default="success", description=doc("Scan status"))
+    mensaje_error: Optional[str] = Field(None, description=doc("Error message"))
+    extra_data: Optional[JSONObject] = Field(None, description=doc("Additional metadata"))
 
 
 class EscaneoCreate(EscaneoBase):
@@ -66,68 +65,66 @@ class EscaneoCreate(EscaneoBase):
 
 class EscaneoUpdate(BaseSchema):
     """Escaneo update schema."""
-    guia_id: Optional[int] = Field(None, description="Guia ID")
-    codigo_barras: Optional[str] = Field(None, max_length=100, description="Barcode")
-    tipo_codigo: Optional[str] = Field(None, max_length=20, description="Code type")
-    dispositivo: Optional[str] = Field(None, max_length=100, description="Device")
-    ubicacion: Optional[str] = Field(None, max_length=100, description="Location")
-    latitud: Optional[Decimal] = Field(None, description="Latitude")
-    longitud: Optional[Decimal] = Field(None, description="Longitude")
-    precision_gps: Optional[Decimal] = Field(None, description="GPS precision")
-    imagen_url: Optional[str] = Field(None, description="Image URL")
-    estado_escaneo: Optional[str] = Field(None, description="Scan status")
-    mensaje_error: Optional[str] = Field(None, description="Error message")
-    extra_data: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
-
-
-class EscaneoResponse(EscaneoBase):
+    guia_id: Optional[int] = Field(None, description=doc("Guia ID"))
+    codigo_barras: Optional[Str100] = Field(None, description=doc("Barcode"))
+    tipo_codigo: Optional[Str20] = Field(None, description=doc("Code type"))
+    dispositivo: Optional[Str100] = Field(None, description=doc("Device"))
+    ubicacion: Optional[Str100] = Field(None, description=doc("Location"))
+    latitud: Optional[float] = Field(None, description=doc("Latitude in decimal degrees, stored to 8 places"))
+    longitud: Optional[float] = Field(None, description=doc("Longitude in decimal degrees, stored to 8 places"))
+    precision_gps: Optional[float] = Field(None, description=doc("GPS precision, stored to 2 places"))
+    imagen_url: Optional[str] = Field(None, description=doc("Image URL"))
+    estado_escaneo: Optional[str] = Field(None, description=doc("Scan status"))
+    mensaje_error: Optional[str] = Field(None, description=doc("Error message"))
+    extra_data: Optional[JSONObject] = Field(None, description=doc("Additional metadata"))
+
+
+class EscaneoResponse(EscaneoBase, TimestampMixin, ResponseSchema):
     """Escaneo response schema."""
-    id: int = Field(description="Escaneo ID")
-    fecha_escaneo: datetime = Field(description="Scan date")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Escaneo ID"))
+    fecha_escaneo: datetime = Field(description=doc("Scan date"))
 
 
 class SessionStartRequest(BaseSchema):
     """Session start request schema."""
-    nombre_sesion: str = Field(..., max_length=100, description="Session name")
-    ubicacion: Optional[str] = Field(None, max_length=100, description="Location")
-    observaciones: Optional[str] = Field(None, description="Observations")
+    nombre_sesion: Str100 = Field(..., description=doc("Session name"))
+    ubicacion: Optional[Str100] = Field(None, description=doc("Location"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
 
 
 class SessionEndRequest(BaseSchema):
     """Session end request schema."""
-    observaciones: Optional[str] = Field(None, description="End observations")
+    observaciones: Optional[str] = Field(None, description=doc("End observations"))
 
 
 class ScanRequest(BaseSchema):
     """Scan request schema."""
-    codigo_barras: str = Field(..., max_length=100, description="Barcode to scan")
-    guia_id: Optional[int] = Field(None, description="Associated guia ID")
-    ubicacion: Optional[str] = Field(None, max_length=100, description="Scan location")
-    latitud: Optional[Decimal] = Field(None, description="Latitude")
-    longitud: Optional[Decimal] = Field(None, description="Longitude")
-    precision_gps: Optional[Decimal] = Field(None, description="GPS precision")
-    imagen_url: Optional[str] = Field(None, description="Image URL")
-    extra_data: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    codigo_barras: Str100 = Field(..., description=doc("Barcode to scan"))
+    guia_id: Optional[int] = Field(None, description=doc("Associated guia ID"))
+    ubicacion: Optional[Str100] = Field(None, description=doc("Scan location"))
+    latitud: Optional[float] = Field(None, description=doc("Latitude in decimal degrees, stored to 8 places"))
+    longitud: Optional[float] = Field(None, description=doc("Longitude in decimal degrees, stored to 8 places"))
+    precision_gps: Optional[float] = Field(None, description=doc("GPS precision, stored to 2 places"))
+    imagen_url: Optional[str] = Field(None, description=doc("Image URL"))
+    extra_data: Optional[JSONObject] = Field(None, description=doc("Additional metadata"))
 
 
-class ScanResponse(BaseSchema):
+class ScanResponse(ResponseSchema):
     """Scan response schema."""
-    success: bool = Field(description="Whether scan was successful")
-    escaneo: Optional[EscaneoResponse] = Field(None, description="Scan record")
-    message: str = Field(description="Response message")
-    validation_errors: Optional[Dict[str, Any]] = Field(None, description="Validation errors")
+    success: bool = Field(description=doc("Whether scan was successful"))
+    escaneo: Optional[EscaneoResponse] = Field(None, description=doc("Scan record"))
+    message: str = Field(description=doc("Response message"))
+    validation_errors: Optional[Dict[str, Any]] = Field(None, description=doc("Validation errors"))
 
 
-class SessionStatsResponse(BaseSchema):
+class SessionStatsResponse(ResponseSchema):
     """Session statistics response schema."""
-    session_id: int = Field(description="Session ID")
-    total_scans: int = Field(description="Total number of scans")
-    successful_scans: int = Field(description="Number of successful scans")
-    failed_scans: int = Field(description="Number of failed scans")
-    duplicate_scans: int = Field(description="Number of duplicate scans")
-    guides_processed: int = Field(description="Number of guides processed")
-    session_duration: Optional[int] = Field(None, description="Session duration in minutes")
-    start_time: datetime = Field(description="Session start time")
-    end_time: Optional[datetime] = Field(None, description="Session end time")
+    session_id: int = Field(description=doc("Session ID"))
+    total_scans: int = Field(description=doc("Total number of scans"))
+    successful_scans: int = Field(description=doc("Number of successful scans"))
+    failed_scans: int = Field(description=doc("Number of failed scans"))
+    duplicate_scans: int = Field(description=doc("Number of duplicate scans"))
+    guides_processed: int = Field(description=doc("Number of guides processed"))
+    session_duration: Optional[int] = Field(None, description=doc("Session duration in minutes"))
+    start_time: datetime = Field(description=doc("Session start time"))
+    end_time: Optional[datetime] = Field(None, description=doc("Session end time"))
@@ -6,18 +6,21 @@ from pydantic import Field
 from datetime import datetime
 from decimal import Decimal
 
-from .common import BaseSchema
+from .common import (
+    BaseSchema, HexColor, JSONObject, ResponseSchema, Str20, Str50, Str100, Str200,
+    TimestampMixin, doc
+)
 
 
 class CategoryBase(BaseSchema):
     """Base category schema."""
-    name: str = Field(..., max_length=100, description="Category name")
-    description: Optional[str] = Field(None, description="Category description")
-    parent_id: Optional[int] = Field(None, description="Parent category ID")
-    color: Optional[str] = Field(None, max_length=7, description="Hex color code")
-    icon: Optional[str] = Field(None, max_length=50, description="Icon name")
-    sort_order: int = Field(default=0, description="Sort order")
-    is_active: bool = Field(default=True, description="Whether category is active")
+    name: Str100 = Field(..., description=doc("Category name"))
+    description: Optional[str] = Field(None, description=doc("Category description"))
+    parent_id: Optional[int] = Field(None, description=doc("Parent category ID"))
+    color: Optional[HexColor] = Field(None, description=doc("Hex color code"))
+    icon: Optional[Str50] = Field(None, description=doc("Icon name"))
+    sort_order: int = Field(default=0, description=doc("Sort order"))
+    is_active: bool = Field(default=True, description=doc("Whether category is active"))
 
 
 class CategoryCreate(CategoryBase):
@@ -27,44 +30,42 @@ class CategoryCreate(CategoryBase):
 
 class CategoryUpdate(BaseSchema):
     """Category update schema."""
-    name: Optional[str] = Field(None, max_length=100, description="Category name")
-    description: Optional[str] = Field(None, description="Category description")
-    parent_id: Optional[int] = Field(None, description="Parent category ID")
-    color: Optional[str] = Field(None, max_length=7, description="Hex color code")
-    icon: Optional[str] = Field(None, max_length=50, description="Icon name")
-    sort_order: Optional[int] = Field(None, description="Sort order")
-    is_active: Optional[bool] = Field(None, description="Whether category is active")
+    name: Optional[Str100] = Field(None, description=doc("Category name"))
+    description: Optional[str] = Field(None, description=doc("Category description"))
+    parent_id: Optional[int] = Field(None, description=doc("Parent category ID"))
+    color: Optional[HexColor] = Field(None, description=doc("Hex color code"))
+    icon: Optional[Str50] = Field(None, description=doc("Icon name"))
+    sort_order: Optional[int] = Field(None, description=doc("Sort order"))
+    is_active: Optional[bool] = Field(None, description=doc("Whether category is active"))
 
 
-class CategoryResponse(CategoryBase):
+class CategoryResponse(CategoryBase, TimestampMixin, ResponseSchema):
     """Category response schema."""
-    id: int = Field(description="Category ID")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Category ID"))
 
 
 class ProductBase(BaseSchema):
     """Base product schema."""
-    code: str = Field(..., max_length=50, description="Product code")
-    name: str = Field(..., max_length=200, description="Product name")
-    description: Optional[str] = Field(None, description="Product description")
-    category_id: Optional[int] = Field(None, description="Category ID")
-    stock_actual: int = Field(default=0, description="Current stock")
-    stock_minimo: int = Field(default=10, description="Minimum stock")
-    stock_maximo: Optional[int] = Field(None, description="Maximum stock")
-    precio_compra: Decimal = Field(default=0, description="Purchase price")
-    precio_venta: Decimal = Field(default=0, description="Sale price")
-    ubicacion_bodega: Optional[str] = Field(None, max_length=100, description="Warehouse location")
-    proveedor: Optional[str] = Field(None, max_length=100, description="Supplier")
-    marca: Optional[str] = Field(None, max_length=100, description="Brand")
-    modelo: Optional[str] = Field(None, max_length=100, description="Model")
-    unidad_medida: str = Field(default="UNIDAD", max_length=20, description="Unit of measure")
-    peso: Optional[Decimal] = Field(None, description="Weight")
-    dimensiones: Optional[Dict[str, Any]] = Field(None, description="Dimensions")
-    codigo_barras: Optional[str] = Field(None, max_length=100, description="Barcode")
-    imagenes: Optional[List[str]] = Field(None, description="Image URLs")
-    status: str = Field(default="active", description="Product status")
-    extra_data: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    code: Str50 = Field(..., description=doc("Product code"))
+    name: Str200 = Field(..., description=doc("Product name"))
+    description: Optional[str] = Field(None, description=doc("Product description"))
+    category_id: Optional[int] = Field(None, description=doc("Category ID"))
+    stock_actual: int = Field(default=0, description=doc("Current stock"))
+    stock_minimo: int = Field(default=10, description=doc("Minimum stock"))
+    stock_maximo: Optional[int] = Field(None, description=doc("Maximum stock"))
+    precio_compra: Decimal = Field(default=0, description=doc("Purchase price"))
+    precio_venta: Decimal = Field(default=0, description=doc("Sale price"))
+    ubicacion_bodega: Optional[Str100] = Field(None, description=doc("Warehouse location"))
+    proveedor: Optional[Str100] = Field(None, description=doc("Supplier"))
+    marca: Optional[Str100] = Field(None, description=doc("Brand"))
+    modelo: Optional[Str100] = Field(None, description=doc("Model"))
+    unidad_medida: Str20 = Field(default="UNIDAD", description=doc("Unit of measure"))
+    peso: Optional[Decimal] = Field(None, description=doc("Weight"))
+    dimensiones: Optional[JSONObject] = Field(None, description=doc("Dimensions"))
+    codigo_barras: Optional[Str100] = Field(None, description=doc("Barcode"))
+    imagenes: Optional[List[str]] = Field(None, description=doc("Image URLs"))
+    status: str = Field(default="active", description=doc("Product status"))
+    extra_data: Optional[JSONObject] = Field(None, description=doc("Additional metadata"))
 
 
 class ProductCreate(ProductBase):
@@ -74,49 +75,47 @@ class ProductCreate(ProductBase):
 
 class ProductUpdate(BaseSchema):
     """Product update schema."""
-    code: Optional[str] = Field(None, max_length=50, description="Product code")
-    name: Optional[str] = Field(None, max_length=200, description="Product name")
-    description: Optional[str] = Field(None, description="Product description")
-    category_id: Optional[int] = Field(None, description="Category ID")
-    stock_actual: Optional[int] = Field(None, description="Current stock")
-    stock_minimo: Optional[int] = Field(None, description="Minimum stock")
-    stock_maximo: Optional[int] = Field(None, description="Maximum stock")
-    precio_compra: Optional[Decimal] = Field(None, description="Purchase price")
-    precio_venta: Optional[Decimal] = Field(None, description="Sale price")
-    ubicacion_bodega: Optional[str] = Field(None, max_length=100, description="Warehouse location")
-    proveedor: Optional[str] = Field(None, max_length=100, description="Supplier")
-    marca: Optional[str] = Field(None, max_length=100, description="Brand")
-    modelo: Optional[str] = Field(None, max_length=100, description="Model")
-    unidad_medida: Optional[str] = Field(None, max_length=20, description="Unit of measure")
-    peso: Optional[Decimal] = Field(None, description="Weight")
-    dimensiones: Optional[Dict[str, Any]] = Field(None, description="Dimensions")
-    codigo_barras: Optional[str] = Field(None, max_length=100, description="Barcode")
-    imagenes: Optional[List[str]] = Field(None, description="Image URLs")
-    status: Optional[str] = Field(None, description="Product status")
-    extra_data: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
-
-
-class ProductResponse(ProductBase):
+    code: Optional[Str50] = Field(None, description=doc("Product code"))
+    name: Optional[Str200] = Field(None, description=doc("Product name"))
+    description: Optional[str] = Field(None, description=doc("Product description"))
+    category_id: Optional[int] = Field(None, description=doc("Category ID"))
+    stock_actual: Optional[int] = Field(None, description=doc("Current stock"))
+    stock_minimo: Optional[int] = Field(None, description=doc("Minimum stock"))
+    stock_maximo: Optional[int] = Field(None, description=doc("Maximum stock"))
+    precio_compra: Optional[Decimal] = Field(None, description=doc("Purchase price"))
+    precio_venta: Optional[Decimal] = Field(None, description=doc("Sale price"))
+    ubicacion_bodega: Optional[Str100] = Field(None, description=doc("Warehouse location"))
+    proveedor: Optional[Str100] = Field(None, description=doc("Supplier"))
+    marca: Optional[Str100] = Field(None, description=doc("Brand"))
+    modelo: Optional[Str100] = Field(None, description=doc("Model"))
+    unidad_medida: Optional[Str20] = Field(None, description=doc("Unit of measure"))
+    peso: Optional[Decimal] = Field(None, description=doc("Weight"))
+    dimensiones: Optional[JSONObject] = Field(None, description=doc("Dimensions"))
+    codigo_barras: Optional[Str100] = Field(None, description=doc("Barcode"))
+    imagenes: Optional[List[str]] = Field(None, description=doc("Image URLs"))
+    status: Optional[str] = Field(None, description=doc("Product status"))
+    extra_data: Optional[JSONObject] = Field(None, description=doc("Additional metadata"))
+
+
+class ProductResponse(ProductBase, TimestampMixin, ResponseSchema):
     """Product response schema."""
-    id: int = Field(description="Product ID")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Product ID"))
 
 
 class KardexBase(BaseSchema):
     """Base kardex schema."""
-    product_id: int = Field(..., description="Product ID")
-    tipo_movimiento: str = Field(..., description="Movement type")
-    documento_asociado: Optional[str] = Field(None, max_length=100, description="Associated document")
-    referencia: Optional[str] = Field(None, max_length=200, description="Reference")
-    cantidad: int = Field(..., description="Quantity")
-    saldo_anterior: int = Field(..., description="Previous balance")
-    saldo_actual: int = Field(..., description="Current balance")
-    costo_unitario: Optional[Decimal] = Field(None, description="Unit cost")
-    costo_promedio: Optional[Decimal] = Field(None, description="Average cost")
-    valor_total: Optional[Decimal] = Field(None, description="Total value")
-    fecha_movimiento: Optional[datetime] = Field(None, description="Movement date")
-    observaciones: Optional[str] = Field(None, description="Observations")
+    product_id: int = Field(..., description=doc("Product ID"))
+    tipo_movimiento: str = Field(..., description=doc("Movement type"))
+    documento_asociado: Optional[Str100] = Field(None, description=doc("Associated document"))
+    referencia: Optional[Str200] = Field(None, description=doc("Reference"))
+    cantidad: int = Field(..., description=doc("Quantity"))
+    saldo_anterior: int = Field(..., description=doc("Previous balance"))
+    saldo_actual: int = Field(..., description=doc("Current balance"))
+    costo_unitario: Optional[Decimal] = Field(None, description=doc("Unit cost"))
+    costo_promedio: Optional[Decimal] = Field(None, description=doc("Average cost"))
+    valor_total: Optional[Decimal] = Field(None, description=doc("Total value"))
+    fecha_movimiento: Optional[datetime] = Field(None, description=doc("Movement date"))
+    observaciones: Optional[str] = Field(None, description=doc("Observations"))
 
 
 class KardexCreate(KardexBase):
@@ -124,27 +123,25 @@ class KardexCreate(KardexBase):
     pass
 
 
-class KardexResponse(KardexBase):
+class KardexResponse(KardexBase, TimestampMixin, ResponseSchema):
     """Kardex response schema."""
-    id: int = Field(description="Kardex ID")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last update timestamp")
+    id: int = Field(description=doc("Kardex ID"))
 
 
-class StockAlertResponse(BaseSchema):
+class StockAlertResponse(ResponseSchema):
     """Stock alert response schema."""
-    product_id: int = Field(description="Product ID")
-    product_name: str = Field(description="Product name")
-    current_stock: int = Field(description="Current stock")
-    minimum_stock: int = Field(description="Minimum stock")
-    alert_type: str = Field(description="Alert type (low_stock, out_of_stock)")
-    severity: str = Field(description="Alert severity (warning, critical)")
+    product_id: int = Field(description=doc("Product ID"))
+    product_name: str = Field(description=doc("Product name"))
+    current_stock: int = Field(description=doc("Current stock"))
+    minimum_stock: int = Field(description=doc("Minimum stock"))
+    alert_type: str = Field(description=doc("Alert type (low_stock, out_of_stock)"))
+    severity: str = Field(description=doc("Alert severity (warning, critical)"))
 
 
-class InventoryReportResponse(BaseSchema):
+class InventoryReportResponse(ResponseSchema):
     """Inventory report response schema."""
-    total_products: int = Field(description="Total number of products")
-    total_value: Decimal = Field(description="Total inventory value")
-    low_stock_products: int = Field(description="Number of low stock products")
-    out_of_stock_products: int = Field(description="Number of out of stock products")
-    categories_summary: List[Dict[str, Any]] = Field(description="Summary by category")
+    total_products: int = Field(description=doc("Total number of products"))
+    total_value: Decimal = Field(description=doc("Total inventory value"))
+    low_stock_products: int = Field(description=doc("Number of low stock products"))
+    out_of_stock_products: int = Field(description=doc("Number of out of stock products"))
+    categories_summary: List[Dict[str, Any]] = Field(description=doc("Summary by category"))
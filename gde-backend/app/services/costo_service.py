@@ -3,7 +3,8 @@ Costo service for accounting and cost management.
 """
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, or_, extract
+from sqlalchemy import func, or_
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, date
 from decimal import Decimal
 
@@ -14,6 +15,9 @@ from ..schemas.costo import (
 )
 from ..core.exceptions import NotFoundError, BusinessLogicError
 
+# PostgreSQL's default name for the costos.categoria_id foreign key
+COSTO_CATEGORY_FK = "costos_categoria_id_fkey"
+
 
 class CostoService:
     """Service for managing costs and expenses."""
@@ -35,24 +39,45 @@ class CostoService:
         Raises:
             NotFoundError: If category not found
         """
-        # Verify category exists
-        category = self.db.query(CostCategory).filter(
-            CostCategory.id == costo_data.categoria_id
-        ).first()
-        if not category:
-            raise NotFoundError("CostCategory", costo_data.categoria_id)
-        
         costo = Costo(
             **costo_data.model_dump(),
             created_by=user_id
         )
         
+        # The categoria_id foreign key validates the category on insert
         self.db.add(costo)
-        self.db.commit()
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if self._is_missing_category(e, costo_data.categoria_id):
+                raise NotFoundError("CostCategory", costo_data.categoria_id)
+            raise
         self.db.refresh(costo)
         
         return costo
     
+    def _is_missing_category(self, error: IntegrityError, categoria_id: int) -> bool:
+        """
+        Check whether a failed insert violated the categoria_id foreign key.
+        
+        PostgreSQL drivers report the violated constraint; on other backends
+        the category is looked up instead.
+        
+        Args:
+            error: IntegrityError raised by the commit
+            categoria_id: Category ID of the costo
+            
+        Returns:
+            bool: True if the category does not exist
+        """
+        diag = getattr(error.orig, "diag", None)
+        constraint = getattr(diag, "constraint_name", None)
+        if constraint is not None:
+            return constraint == COSTO_CATEGORY_FK
+        
+        return self.db.get(CostCategory, categoria_id) is None
+    
     def get_costos(
         self,
         skip: int = 0,
@@ -93,10 +118,12 @@ class CostoService:
             query = query.filter(Costo.fecha <= fecha_hasta)
         
         if search:
+            # Served by the pg_trgm GIN indexes for terms of 3+ characters
+            pattern = f"%{search}%"
             query = query.filter(
                 or_(
-                    Costo.descripcion.ilike(f"%{search}%"),
-                    Costo.proveedor.ilike(f"%{search}%")
+                    Costo.descripcion.ilike(pattern),
+                    Costo.proveedor.ilike(pattern)
                 )
             )
         
@@ -172,7 +199,13 @@ class CostoService:
         Returns:
             dict: Costos summary
         """
-        query = self.db.query(Costo)
+        # One grouped aggregate; the result has at most tipos x estados rows
+        query = self.db.query(
+            CostCategory.tipo,
+            Costo.estado,
+            func.count(Costo.id).label("count"),
+            func.sum(Costo.monto).label("total")
+        ).outerjoin(CostCategory, Costo.categoria_id == CostCategory.id)
         
         if fecha_desde:
             query = query.filter(Costo.fecha >= fecha_desde)
@@ -180,41 +213,30 @@ class CostoService:
         if fecha_hasta:
             query = query.filter(Costo.fecha <= fecha_hasta)
         
-        costos = query.all()
+        rows = query.group_by(CostCategory.tipo, Costo.estado).all()
         
-        # Group by tipo (from category)
-        gastos = []
-        ingresos = []
-        costos_directos = []
+        total_registros = 0
+        totals_by_tipo = {}
+        totals_by_estado = {}
+        for r in rows:
+            total = r.total or 0
+            total_registros += r.count
+            if r.tipo is not None:
+                totals_by_tipo[r.tipo] = totals_by_tipo.get(r.tipo, 0) + total
+            totals_by_estado[r.estado] = totals_by_estado.get(r.estado, 0) + total
         
-        for costo in costos:
-            category = self.db.query(CostCategory).filter(
-                CostCategory.id == costo.categoria_id
-            ).first()
-            
-            if category:
-                if category.tipo == "gasto":
-                    gastos.append(costo)
-                elif category.tipo == "ingreso":
-                    ingresos.append(costo)
-                else:
-                    costos_directos.append(costo)
-        
-        total_gastos = sum(c.monto for c in gastos)
-        total_ingresos = sum(c.monto for c in ingresos)
-        total_costos = sum(c.monto for c in costos_directos)
-        
-        # Status summary
-        pendientes = sum(c.monto for c in costos if c.estado == "pendiente")
-        pagados = sum(c.monto for c in costos if c.estado == "pagado")
+        # Categories that are neither gasto nor ingreso count as direct costs
+        total_gastos = totals_by_tipo.pop("gasto", 0)
+        total_ingresos = totals_by_tipo.pop("ingreso", 0)
+        total_costos = sum(totals_by_tipo.values())
         
         return {
-            "total_registros": len(costos),
+            "total_registros": total_registros,
             "total_gastos": float(total_gastos),
             "total_ingresos": float(total_ingresos),
             "total_costos": float(total_costos),
-            "total_pendiente": float(pendientes),
-            "total_pagado": float(pagados),
+            "total_pendiente": float(totals_by_estado.get("pendiente", 0)),
+            "total_pagado": float(totals_by_estado.get("pagado", 0)),
             "utilidad_bruta": float(total_ingresos - total_costos),
             "utilidad_neta": float(total_ingresos - total_costos - total_gastos)
         }
@@ -238,8 +260,8 @@ class CostoService:
             CostCategory.name,
             CostCategory.tipo,
             func.count(Costo.id).label("count"),
-            func.sum(Costo.monto).label("total")
-        ).join(Costo).group_by(CostCategory.id, CostCategory.name, CostCategory.tipo)
+            func.coalesce(func.sum(Costo.monto), 0).label("total")
+        ).select_from(CostCategory).join(Costo, Costo.categoria_id == CostCategory.id)
         
         if fecha_desde:
             query = query.filter(Costo.fecha >= fecha_desde)
@@ -247,14 +269,14 @@ class CostoService:
         if fecha_hasta:
             query = query.filter(Costo.fecha <= fecha_hasta)
         
-        results = query.all()
+        results = query.group_by(CostCategory.id, CostCategory.name, CostCategory.tipo).all()
         
         return [
             {
                 "categoria": r.name,
                 "tipo": r.tipo,
                 "cantidad": r.count,
-                "total": float(r.total or 0)
+                "total": float(r.total)
             }
             for r in results
         ]
@@ -270,34 +292,24 @@ class CostoService:
         Returns:
             dict: Monthly report
         """
-        query = self.db.query(Costo).filter(
-            extract('year', Costo.fecha) == year,
-            extract('month', Costo.fecha) == month
-        )
+        # Range predicate instead of EXTRACT so ix_costos_fecha_desc_cat_estado applies
+        month_start = date(year, month, 1)
+        next_month = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
         
-        costos = query.all()
+        rows = self.db.query(
+            CostCategory.tipo,
+            func.sum(Costo.monto).label("total")
+        ).join(Costo, Costo.categoria_id == CostCategory.id).filter(
+            Costo.fecha >= month_start,
+            Costo.fecha < next_month
+        ).group_by(CostCategory.tipo).all()
         
-        # Group by category type
-        gastos = []
-        ingresos = []
-        costos_directos = []
+        totals_by_tipo = {r.tipo: r.total or 0 for r in rows}
         
-        for costo in costos:
-            category = self.db.query(CostCategory).filter(
-                CostCategory.id == costo.categoria_id
-            ).first()
-            
-            if category:
-                if category.tipo == "gasto":
-                    gastos.append(costo)
-                elif category.tipo == "ingreso":
-                    ingresos.append(costo)
-                else:
-                    costos_directos.append(costo)
-        
-        total_gastos = sum(c.monto for c in gastos)
-        total_ingresos = sum(c.monto for c in ingresos)
-        total_costos = sum(c.monto for c in costos_directos)
+        # Categories that are neither gasto nor ingreso count as direct costs
+        total_gastos = totals_by_tipo.pop("gasto", 0)
+        total_ingresos = totals_by_tipo.pop("ingreso", 0)
+        total_costos = sum(totals_by_tipo.values())
         
         return {
             "year": year,
@@ -404,15 +416,13 @@ class CostoService:
         if not category:
             return False
         
-        # Check if category has costos
-        costos_count = self.db.query(Costo).filter(
-            Costo.categoria_id == category_id
-        ).count()
+        # EXISTS stops at the first associated costo instead of counting them all
+        has_costos = self.db.query(
+            self.db.query(Costo).filter(Costo.categoria_id == category_id).exists()
+        ).scalar()
         
-        if costos_count > 0:
-            raise BusinessLogicError(
-                f"Cannot delete category with {costos_count} associated costs"
-            )
+        if has_costos:
+            raise BusinessLogicError("Cannot delete category with associated costs")
         
         self.db.delete(category)
         self.db.commit()
@@ -3,15 +3,88 @@ File processing service for Excel/CSV imports.
 """
 import pandas as pd
 import logging
-from typing import Dict, List, Any, Optional
-from pathlib import Path
+import os
+from datetime import datetime
+from itertools import islice
+from typing import Dict, FrozenSet, List, Any, Iterator, Optional, Set, Tuple
+from openpyxl import load_workbook
+from sqlalchemy import inspect, select
 from sqlalchemy.orm import Session
 
 from ..models.audit import ImportLog
+from ..models.costo import CostCategory
+from ..models.product import Category
 from ..core.exceptions import FileProcessingError
 
 logger = logging.getLogger(__name__)
 
+# Rows per chunk when streaming Excel imports
+EXCEL_CHUNK_SIZE = 10_000
+
+# Import file extension -> ImportLog.tipo_archivo
+IMPORT_FILE_TYPES = {".xlsx": "excel", ".xls": "excel", ".csv": "csv"}
+
+# tipo_archivo -> (label for messages, FileService chunk reader method)
+IMPORT_READERS = {
+    "excel": ("Excel", "_iter_excel_chunks"),
+    "csv": ("CSV", "_iter_csv_chunks"),
+}
+
+# Range of the INTEGER columns that int import values are stored in
+_INT_MIN = -2**31
+_INT_MAX = 2**31 - 1
+
+# Columns an import file must contain, per entity type
+REQUIRED_COLUMNS: Dict[str, FrozenSet[str]] = {
+    "products": frozenset({"code", "name", "stock_actual"}),
+    "guias": frozenset({"codigo", "cliente_nombre"}),
+    "costos": frozenset({"fecha", "descripcion", "monto"}),
+}
+
+# Output columns per entity type: column -> (type, value used when missing)
+COLUMN_SPECS: Dict[str, Dict[str, Tuple[type, Any]]] = {
+    "products": {
+        "code": (str, ""),
+        "name": (str, ""),
+        "description": (str, ""),
+        "stock_actual": (int, 0),
+        "stock_minimo": (int, 10),
+        "precio_compra": (float, 0.0),
+        "precio_venta": (float, 0.0),
+        "categoria_id": (int, None),
+        "proveedor": (str, ""),
+        "marca": (str, ""),
+        "modelo": (str, ""),
+        "ubicacion_bodega": (str, ""),
+        "codigo_barras": (str, ""),
+        "status": (str, "active"),
+    },
+    "guias": {
+        "codigo": (str, ""),
+        "cliente_nombre": (str, ""),
+        "cliente_ruc": (str, ""),
+        "cliente_direccion": (str, ""),
+        "cliente_telefono": (str, ""),
+        "cliente_email": (str, ""),
+        "direccion_entrega": (str, ""),
+        "transportista": (str, ""),
+        "observaciones": (str, ""),
+    },
+    "costos": {
+        "fecha": (str, ""),
+        "descripcion": (str, ""),
+        "monto": (float, 0.0),
+        "categoria_id": (int, None),
+        "proveedor": (str, ""),
+        "documento": (str, ""),
+        "numero_documento": (str, ""),
+        "tipo_documento": (str, ""),
+        "estado": (str, "pendiente"),
+        "metodo_pago": (str, "transferencia"),
+        "observaciones": (str, ""),
+    },
+}
+
 
 class FileService:
     """Service for file processing operations."""
@@ -19,6 +92,33 @@ class FileService:
     def __init__(self, db: Session):
         self.db = db
     
+    def process_file(
+        self,
+        file_path: str,
+        entity_type: str,
+        user_id: str
+    ) -> Dict[str, Any]:
+        """
+        Process an Excel or CSV file, picking the reader from its extension.
+        
+        Args:
+            file_path: Path to the file
+            entity_type: Type of entity to import (products, guias, costos)
+            user_id: ID of the user performing the import
+            
+        Returns:
+            Dict[str, Any]: Processing results
+            
+        Raises:
+            FileProcessingError: If the file type is unsupported or processing fails
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        tipo_archivo = IMPORT_FILE_TYPES.get(extension)
+        if tipo_archivo is None:
+            raise FileProcessingError(f"Unsupported file type: {extension}")
+        
+        return self._import_file(file_path, entity_type, user_id, tipo_archivo)
+    
     def process_excel_file(
         self, 
         file_path: str, 
@@ -39,57 +139,7 @@ class FileService:
         Raises:
             FileProcessingError: If file processing fails
         """
-        try:
-            # Create import log
-            import_log = ImportLog(
-                usuario_id=user_id,
-                archivo=Path(file_path).name,
-                tipo_archivo="excel",
-                entidad=entity_type,
-                estado="processing"
-            )
-            self.db.add(import_log)
-            self.db.commit()
-            self.db.refresh(import_log)
-            
-            # Read Excel file
-            df = pd.read_excel(file_path)
-            
-            # Validate data
-            validated_data = self._validate_data(df, entity_type)
-            
-            # Process data
-            processed_data = self._process_data(validated_data, entity_type)
-            
-            # Update import log
-            import_log.registros_totales = len(df)
-            import_log.registros_exitosos = len(processed_data['success'])
-            import_log.registros_fallidos = len(processed_data['errors'])
-            import_log.errores = processed_data['errors']
-            import_log.estado = "completed"
-            import_log.fecha_procesamiento = pd.Timestamp.now()
-            
-            self.db.commit()
-            
-            return {
-                "import_log_id": import_log.id,
-                "total_records": len(df),
-                "successful_records": len(processed_data['success']),
-                "failed_records": len(processed_data['errors']),
-                "errors": processed_data['errors'],
-                "success_data": processed_data['success']
-            }
-            
-        except Exception as e:
-            logger.error(f"Error processing Excel file: {e}")
-            
-            # Update import log with error
-            if 'import_log' in locals():
-                import_log.estado = "failed"
-                import_log.errores = {"error": str(e)}
-                self.db.commit()
-            
-            raise FileProcessingError(f"Error processing Excel file: {str(e)}")
+        return self._import_file(file_path, entity_type, user_id, "excel")
     
     def process_csv_file(
         self, 
@@ -111,57 +161,176 @@ class FileService:
         Raises:
             FileProcessingError: If file processing fails
         """
+        return self._import_file(file_path, entity_type, user_id, "csv")
+    
+    def _import_file(
+        self,
+        file_path: str,
+        entity_type: str,
+        user_id: str,
+        tipo_archivo: str
+    ) -> Dict[str, Any]:
+        """
+        Run the shared import pipeline over a file's chunks.
+        
+        Args:
+            file_path: Path to the file
+            entity_type: Type of entity to import
+            user_id: ID of the user performing the import
+            tipo_archivo: Key of IMPORT_READERS (excel or csv)
+            
+        Returns:
+            Dict[str, Any]: Processing results
+            
+        Raises:
+            FileProcessingError: If file processing fails
+        """
+        label, reader_name = IMPORT_READERS[tipo_archivo]
+        
         try:
             # Create import log
             import_log = ImportLog(
                 usuario_id=user_id,
-                archivo=Path(file_path).name,
-                tipo_archivo="csv",
+                archivo=os.path.basename(file_path),
+                tipo_archivo=tipo_archivo,
                 entidad=entity_type,
                 estado="processing"
             )
             self.db.add(import_log)
-            self.db.commit()
-            self.db.refresh(import_log)
+            self.db.flush()
             
-            # Read CSV file
-            df = pd.read_csv(file_path)
+            success = []
+            errors = []
+            total = 0
             
-            # Validate data
-            validated_data = self._validate_data(df, entity_type)
-            
-            # Process data
-            processed_data = self._process_data(validated_data, entity_type)
+            # Progress is committed only after full chunks, so files that fit
+            # in one chunk commit once at the end
+            for chunk in getattr(self, reader_name)(file_path):
+                validated_data = self._validate_data(chunk, entity_type)
+                processed_data = self._process_data(validated_data, entity_type)
+                
+                total += len(chunk)
+                success.extend(processed_data['success'])
+                errors.extend(processed_data['errors'])
+                
+                import_log.registros_totales = total
+                import_log.registros_exitosos = len(success)
+                import_log.registros_fallidos = len(errors)
+                if len(chunk) == EXCEL_CHUNK_SIZE:
+                    self.db.commit()
             
             # Update import log
-            import_log.registros_totales = len(df)
-            import_log.registros_exitosos = len(processed_data['success'])
-            import_log.registros_fallidos = len(processed_data['errors'])
-            import_log.errores = processed_data['errors']
+            import_log.errores = errors
             import_log.estado = "completed"
-            import_log.fecha_procesamiento = pd.Timestamp.now()
+            import_log.fecha_procesamiento = datetime.utcnow()
             
             self.db.commit()
             
             return {
                 "import_log_id": import_log.id,
-                "total_records": len(df),
-                "successful_records": len(processed_data['success']),
-                "failed_records": len(processed_data['errors']),
-                "errors": processed_data['errors'],
-                "success_data": processed_data['success']
+                "total_records": total,
+                "successful_records": len(success),
+                "failed_records": len(errors),
+                "errors": errors,
+                "success_data": success
             }
             
         except Exception as e:
-            logger.error(f"Error processing CSV file: {e}")
+            logger.error(f"Error processing {label} file: {e}")
             
-            # Update import log with error
             if 'import_log' in locals():
-                import_log.estado = "failed"
-                import_log.errores = {"error": str(e)}
-                self.db.commit()
+                self._record_failure(import_log, e)
+            
+            raise FileProcessingError(f"Error processing {label} file: {str(e)}")
+    
+    def _iter_excel_chunks(
+        self,
+        file_path: str,
+        chunk_size: int = EXCEL_CHUNK_SIZE
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Read the first worksheet as DataFrames of at most chunk_size rows.
+        
+        .xlsx files are streamed with openpyxl's read-only mode so memory stays
+        flat; legacy .xls files go through pandas/xlrd in a single chunk. Chunk
+        indexes continue across chunks so error row numbers match the sheet.
+        
+        Args:
+            file_path: Path to the Excel file
+            chunk_size: Maximum rows per chunk
+            
+        Yields:
+            pd.DataFrame: Next chunk of rows (at least one, possibly empty)
+        """
+        if os.path.splitext(file_path)[1].lower() == ".xls":
+            yield pd.read_excel(file_path)
+            return
+        
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None) or ()
+            columns = [
+                str(name) if name is not None else f"Unnamed: {i}"
+                for i, name in enumerate(header)
+            ]
+            # Read-only sheets report blank trailing rows; pandas drops them
+            rows = (row for row in rows if any(value is not None for value in row))
             
-            raise FileProcessingError(f"Error processing CSV file: {str(e)}")
+            offset = 0
+            while True:
+                batch = list(islice(rows, chunk_size))
+                if not batch and offset:
+                    return
+                yield pd.DataFrame(
+                    batch,
+                    columns=columns,
+                    index=range(offset, offset + len(batch))
+                )
+                if len(batch) < chunk_size:
+                    return
+                offset += len(batch)
+        finally:
+            workbook.close()
+    
+    def _iter_csv_chunks(self, file_path: str) -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file with the multi-threaded Arrow parser, as one chunk.
+        
+        Args:
+            file_path: Path to the CSV file
+            
+        Yields:
+            pd.DataFrame: All rows of the file
+        """
+        yield pd.read_csv(file_path, engine="pyarrow")
+    
+    def _record_failure(self, import_log: ImportLog, error: Exception) -> None:
+        """
+        Roll back a failed import and store its log as failed.
+        
+        A log that was only flushed is discarded by the rollback, so a fresh
+        row is inserted; one already committed by progress updates is
+        reloaded and updated in place.
+        
+        Args:
+            import_log: Log created for the import
+            error: Exception that aborted the import
+        """
+        self.db.rollback()
+        
+        if not inspect(import_log).persistent:
+            import_log = ImportLog(
+                usuario_id=import_log.usuario_id,
+                archivo=import_log.archivo,
+                tipo_archivo=import_log.tipo_archivo,
+                entidad=import_log.entidad
+            )
+            self.db.add(import_log)
+        
+        import_log.estado = "failed"
+        import_log.errores = {"error": str(error)}
+        self.db.commit()
     
     def _validate_data(self, df: pd.DataFrame, entity_type: str) -> pd.DataFrame:
         """
@@ -177,33 +346,25 @@ class FileService:
         Raises:
             FileProcessingError: If validation fails
         """
-        if entity_type == "products":
-            required_columns = ["code", "name", "stock_actual"]
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise FileProcessingError(f"Missing required columns: {missing_columns}")
-        
-        elif entity_type == "guias":
-            required_columns = ["codigo", "cliente_nombre"]
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise FileProcessingError(f"Missing required columns: {missing_columns}")
-        
-        elif entity_type == "costos":
-            required_columns = ["fecha", "descripcion", "monto"]
-            missing_columns = [col for col in required_columns if col not in df.columns]
-            if missing_columns:
-                raise FileProcessingError(f"Missing required columns: {missing_columns}")
-        
-        else:
+        required_columns = REQUIRED_COLUMNS.get(entity_type)
+        if required_columns is None:
             raise FileProcessingError(f"Unsupported entity type: {entity_type}")
         
+        missing_columns = required_columns.difference(df.columns)
+        if missing_columns:
+            raise FileProcessingError(f"Missing required columns: {sorted(missing_columns)}")
+        
         return df
     
     def _process_data(self, df: pd.DataFrame, entity_type: str) -> Dict[str, List]:
         """
         Process validated data.
         
+        Columns are cast as whole Series per COLUMN_SPECS; rows holding a
+        non-numeric value in a numeric column, a fractional or out-of-range
+        value in an int column, or an unknown categoria_id are reported as
+        errors.
+        
         Args:
             df: Validated DataFrame
             entity_type: Type of entity
@@ -211,83 +372,90 @@ class FileService:
         Returns:
             Dict[str, List]: Processed data with success and error lists
         """
-        success = []
-        errors = []
-        
-        for index, row in df.iterrows():
-            try:
-                if entity_type == "products":
-                    processed_row = self._process_product_row(row)
-                    success.append(processed_row)
-                elif entity_type == "guias":
-                    processed_row = self._process_guia_row(row)
-                    success.append(processed_row)
-                elif entity_type == "costos":
-                    processed_row = self._process_costo_row(row)
-                    success.append(processed_row)
-                else:
-                    raise ValueError(f"Unsupported entity type: {entity_type}")
-                    
-            except Exception as e:
-                errors.append({
-                    "row": index + 1,
-                    "error": str(e),
-                    "data": row.to_dict()
-                })
+        spec = COLUMN_SPECS.get(entity_type)
+        if spec is None:
+            raise FileProcessingError(f"Unsupported entity type: {entity_type}")
+        
+        frame = df.reindex(columns=list(spec))
+        processed = {}
+        problems = []
+        
+        for column, (kind, default) in spec.items():
+            values = frame[column]
+            present = values.notna()
+            
+            if kind is str:
+                if pd.api.types.is_datetime64_any_dtype(values):
+                    # Same text as str(Timestamp); empty cells (NaT) take the default
+                    values = values.dt.strftime("%Y-%m-%d %H:%M:%S")
+                processed[column] = values.where(present, default).astype(str)
+                continue
+            
+            numeric = pd.to_numeric(values, errors="coerce")
+            if kind is int:
+                # Fractions and out-of-range values would be truncated or
+                # overflow on the cast, so they are rejected like text
+                bad = (numeric % 1 != 0) | (numeric < _INT_MIN) | (numeric > _INT_MAX)
+                numeric = numeric.mask(bad)
+            invalid = present & numeric.isna()
+            if invalid.any():
+                problems.append(invalid.map({True: f"Invalid {column}", False: ""}))
+            
+            dtype = "int64" if kind is int else "float64"
+            if default is None:
+                nullable = numeric.astype(dtype.capitalize()).astype(object)
+                processed[column] = nullable.where(numeric.notna(), None)
+            else:
+                processed[column] = numeric.fillna(default).astype(dtype)
+        
+        if "categoria_id" in processed:
+            categoria = processed["categoria_id"]
+            known = self._existing_category_ids(entity_type, categoria.dropna().unique().tolist())
+            unknown = categoria.notna() & ~categoria.isin(known)
+            if unknown.any():
+                problems.append(unknown.map({True: "Unknown categoria_id", False: ""}))
+        
+        result = pd.DataFrame(processed, index=frame.index)
+        
+        if not problems:
+            return {
+                "success": result.to_dict(orient="records"),
+                "errors": []
+            }
+        
+        messages = pd.concat(problems, axis=1).agg(
+            lambda row: "; ".join(message for message in row if message), axis=1
+        )
+        failed = messages != ""
+        failed_rows = df[failed].astype(object)
+        failed_rows = failed_rows.where(failed_rows.notna(), None)
+        
+        errors = [
+            {"row": index + 1, "error": messages[index], "data": data}
+            for index, data in zip(failed_rows.index, failed_rows.to_dict(orient="records"))
+        ]
         
         return {
-            "success": success,
+            "success": result[~failed].to_dict(orient="records"),
             "errors": errors
         }
     
-    def _process_product_row(self, row: pd.Series) -> Dict[str, Any]:
-        """Process a single product row."""
-        return {
-            "code": str(row.get("code", "")),
-            "name": str(row.get("name", "")),
-            "description": str(row.get("description", "")),
-            "stock_actual": int(row.get("stock_actual", 0)),
-            "stock_minimo": int(row.get("stock_minimo", 10)),
-            "precio_compra": float(row.get("precio_compra", 0)),
-            "precio_venta": float(row.get("precio_venta", 0)),
-            "categoria_id": int(row.get("categoria_id", 0)) if pd.notna(row.get("categoria_id")) else None,
-            "proveedor": str(row.get("proveedor", "")),
-            "marca": str(row.get("marca", "")),
-            "modelo": str(row.get("modelo", "")),
-            "ubicacion_bodega": str(row.get("ubicacion_bodega", "")),
-            "codigo_barras": str(row.get("codigo_barras", "")),
-            "status": str(row.get("status", "active"))
-        }
-    
-    def _process_guia_row(self, row: pd.Series) -> Dict[str, Any]:
-        """Process a single guia row."""
-        return {
-            "codigo": str(row.get("codigo", "")),
-            "cliente_nombre": str(row.get("cliente_nombre", "")),
-            "cliente_ruc": str(row.get("cliente_ruc", "")),
-            "cliente_direccion": str(row.get("cliente_direccion", "")),
-            "cliente_telefono": str(row.get("cliente_telefono", "")),
-            "cliente_email": str(row.get("cliente_email", "")),
-            "direccion_entrega": str(row.get("direccion_entrega", "")),
-            "transportista": str(row.get("transportista", "")),
-            "observaciones": str(row.get("observaciones", ""))
-        }
-    
-    def _process_costo_row(self, row: pd.Series) -> Dict[str, Any]:
-        """Process a single costo row."""
-        return {
-            "fecha": str(row.get("fecha", "")),
-            "descripcion": str(row.get("descripcion", "")),
-            "monto": float(row.get("monto", 0)),
-            "categoria_id": int(row.get("categoria_id", 0)) if pd.notna(row.get("categoria_id")) else None,
-            "proveedor": str(row.get("proveedor", "")),
-            "documento": str(row.get("documento", "")),
-            "numero_documento": str(row.get("numero_documento", "")),
-            "tipo_documento": str(row.get("tipo_documento", "")),
-            "estado": str(row.get("estado", "pendiente")),
-            "metodo_pago": str(row.get("metodo_pago", "transferencia")),
-            "observaciones": str(row.get("observaciones", ""))
-        }
+    def _existing_category_ids(self, entity_type: str, ids: List[int]) -> Set[int]:
+        """
+        Return which of the referenced category IDs exist, in one lookup.
+        
+        Args:
+            entity_type: Type of entity (costos or products)
+            ids: Distinct category IDs referenced by the import
+            
+        Returns:
+            Set[int]: IDs that exist
+        """
+        if not ids:
+            return set()
+        
+        model = CostCategory if entity_type == "costos" else Category
+        return set(self.db.scalars(select(model.id).where(model.id.in_(ids))))
     
     def get_import_logs(
         self, 
@@ -1,9 +1,10 @@
 """
 Guia (dispatch guide) service for business logic.
 """
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.engine import Row
 from datetime import datetime
 
 from ..models.guia import Guia, GuiaItem, GuiaMovement
@@ -15,6 +16,14 @@ from ..schemas.guia import (
 )
 from ..core.exceptions import NotFoundError, BusinessLogicError
 
+# Must match ix_guias_search_fts; literals are inlined so the index expression applies
+GUIA_SEARCH_VECTOR = func.to_tsvector(
+    literal_column("'simple'"),
+    func.coalesce(Guia.codigo, literal_column("''"))
+    + literal_column("' '")
+    + func.coalesce(Guia.cliente_nombre, literal_column("''"))
+)
+
 
 class GuiaService:
     """Service for managing dispatch guides."""
@@ -88,12 +97,21 @@ class GuiaService:
         query = self.db.query(Guia)
         
         if search:
-            query = query.filter(
-                or_(
-                    Guia.codigo.ilike(f"%{search}%"),
-                    Guia.cliente_nombre.ilike(f"%{search}%")
-                )
-            )
+            # Served by the pg_trgm GIN indexes; lower() would bypass them
+            pattern = f"%{search}%"
+            conditions = [
+                Guia.codigo.ilike(pattern),
+                Guia.cliente_nombre.ilike(pattern)
+            ]
+            
+            # Multi-word searches also match the words in any order through
+            # the full-text index, ranked by relevance
+            if len(search.split()) > 1 and self.db.get_bind().dialect.name == "postgresql":
+                tsquery = func.plainto_tsquery(literal_column("'simple'"), search)
+                conditions.append(GUIA_SEARCH_VECTOR.op("@@")(tsquery))
+                query = query.order_by(func.ts_rank_cd(GUIA_SEARCH_VECTOR, tsquery).desc())
+            
+            query = query.filter(or_(*conditions))
         
         if estado:
             query = query.filter(Guia.estado == estado)
@@ -365,6 +383,21 @@ class GuiaService:
             GuiaMovement.guia_id == guia_id
         ).order_by(GuiaMovement.fecha_movimiento.desc()).all()
     
+    def get_guia_movement_rows(self, guia_id: int, columns: Sequence[Any]) -> List[Row]:
+        """
+        Get selected columns of all movements for a guia, without loading ORM objects.
+        
+        Args:
+            guia_id: Guia ID
+            columns: GuiaMovement columns to select
+            
+        Returns:
+            List[Row]: Movement rows, newest first
+        """
+        return self.db.query(*columns).filter(
+            GuiaMovement.guia_id == guia_id
+        ).order_by(GuiaMovement.fecha_movimiento.desc()).all()
+    
     def get_guia_tracking(self, codigo: str) -> Optional[dict]:
         """
         Get guia tracking information.
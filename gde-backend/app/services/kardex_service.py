@@ -3,7 +3,7 @@ Kardex service for inventory movements.
 """
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import case, desc, func
 from datetime import datetime, timedelta
 from decimal import Decimal
 
@@ -158,7 +158,15 @@ class KardexService:
         Returns:
             dict: Kardex summary statistics
         """
-        query = self.db.query(Kardex)
+        query = self.db.query(
+            func.count(Kardex.id).label("total"),
+            *(
+                func.coalesce(
+                    func.sum(case((Kardex.tipo_movimiento == tipo, Kardex.cantidad), else_=0)), 0
+                ).label(tipo)
+                for tipo in ("entrada", "salida", "ajuste")
+            )
+        )
         
         if product_id:
             query = query.filter(Kardex.product_id == product_id)
@@ -172,20 +180,14 @@ class KardexService:
         if fecha_hasta:
             query = query.filter(Kardex.fecha_movimiento <= fecha_hasta)
         
-        entries = query.all()
-        
-        total_entradas = sum(
-            k.cantidad for k in entries if k.tipo_movimiento == "entrada"
-        )
-        total_salidas = sum(
-            k.cantidad for k in entries if k.tipo_movimiento == "salida"
-        )
-        total_ajustes = sum(
-            k.cantidad for k in entries if k.tipo_movimiento == "ajuste"
-        )
+        # Summed in SQL so no Kardex rows are loaded
+        totals = query.one()
+        total_entradas = int(totals.entrada)
+        total_salidas = int(totals.salida)
+        total_ajustes = int(totals.ajuste)
         
         return {
-            "total_movimientos": len(entries),
+            "total_movimientos": totals.total,
             "total_entradas": total_entradas,
             "total_salidas": total_salidas,
             "total_ajustes": total_ajustes,
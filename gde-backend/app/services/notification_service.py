@@ -2,6 +2,7 @@
 Notification service for managing user notifications.
 """
 from typing import List, Optional
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 from datetime import datetime
 import uuid
@@ -50,26 +51,30 @@ class NotificationService:
         Returns:
             List[Notification]: Created notifications
         """
-        notifications = []
-        
-        for user_id in bulk_data.user_ids:
-            notification = Notification(
-                user_id=user_id,
-                title=bulk_data.title,
-                message=bulk_data.message,
-                type=bulk_data.type,
-                priority=bulk_data.priority,
-                data=bulk_data.data
-            )
-            self.db.add(notification)
-            notifications.append(notification)
-        
+        rows = [
+            {
+                "user_id": user_id,
+                "title": bulk_data.title,
+                "message": bulk_data.message,
+                "type": bulk_data.type,
+                "priority": bulk_data.priority,
+                "data": bulk_data.data
+            }
+            for user_id in bulk_data.user_ids
+        ]
+        if not rows:
+            return []
+        
+        # One multi-row INSERT instead of building and flushing an object per user
+        ids = self.db.scalars(
+            insert(Notification).returning(Notification.id, sort_by_parameter_order=True),
+            rows
+        ).all()
         self.db.commit()
         
-        for notification in notifications:
-            self.db.refresh(notification)
-        
-        return notifications
+        return self.db.scalars(
+            select(Notification).where(Notification.id.in_(ids)).order_by(Notification.id)
+        ).all()
     
     def get_user_notifications(
         self,
@@ -149,7 +154,7 @@ class NotificationService:
         """
         unread_notifications = self.db.query(Notification).filter(
             Notification.user_id == user_id,
-            Notification.is_read == False
+            Notification.is_read.is_(False)
         ).all()
         
         count = 0
@@ -194,7 +199,7 @@ class NotificationService:
         """
         return self.db.query(Notification).filter(
             Notification.user_id == user_id,
-            Notification.is_read == False
+            Notification.is_read.is_(False)
         ).count()
     
     # Notification Settings
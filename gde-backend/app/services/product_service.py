@@ -3,7 +3,8 @@ Product service for business logic.
 """
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from sqlalchemy import and_, case, or_, func
+from sqlalchemy.engine import Row
 from decimal import Decimal
 
 from ..models.product import Product, Category, Kardex
@@ -304,6 +305,36 @@ class ProductService:
         
         return query.all()
     
+    def get_low_stock_alert_rows(self, threshold: Optional[int] = None) -> List[Row]:
+        """
+        Get low stock alerts as plain rows, without loading Product objects.
+        
+        Rows carry the StockAlertResponse fields; alert type and severity are
+        computed in SQL.
+        
+        Args:
+            threshold: Stock threshold (uses product's stock_minimo if not provided)
+            
+        Returns:
+            List[Row]: Alert rows
+        """
+        out_of_stock = Product.stock_actual == 0
+        query = self.db.query(
+            Product.id.label("product_id"),
+            Product.name.label("product_name"),
+            Product.stock_actual.label("current_stock"),
+            Product.stock_minimo.label("minimum_stock"),
+            case((out_of_stock, "out_of_stock"), else_="low_stock").label("alert_type"),
+            case((out_of_stock, "critical"), else_="warning").label("severity")
+        ).filter(Product.status == "active")
+        
+        if threshold:
+            query = query.filter(Product.stock_actual <= threshold)
+        else:
+            query = query.filter(Product.stock_actual <= Product.stock_minimo)
+        
+        return query.all()
+    
     def get_inventory_summary(self) -> Dict[str, Any]:
         """
         Get inventory summary statistics.
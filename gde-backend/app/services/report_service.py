@@ -1,9 +1,9 @@
 """
 Report service for generating analytics and reports.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import Date, DateTime, Row, and_, cast, func, extract, literal_column, select, true
 from datetime import datetime, date, timedelta
 from decimal import Decimal
 
@@ -11,6 +11,63 @@ from ..models.product import Product, Kardex
 from ..models.guia import Guia, GuiaItem
 from ..models.costo import Costo, CostCategory
 from ..models.pistoleo import PistoleoSession, Escaneo
+from ..core.cache import cached_method
+from ..core.exceptions import ValidationError
+
+# Column headers for streamed exports, in row order
+INVENTORY_EXPORT_COLUMNS = (
+    "code", "name", "stock_actual", "stock_minimo", "precio_compra", "valor_inventario"
+)
+COSTS_EXPORT_COLUMNS = (
+    "fecha", "categoria", "tipo", "descripcion", "proveedor", "monto", "estado"
+)
+
+# Rows fetched per round-trip when streaming exports
+EXPORT_BATCH_SIZE = 1000
+
+# Seconds a cached report stays valid
+REPORT_CACHE_TTL = 60
+
+# Periods accepted by get_costs_trends; interpolated into SQL, so keep whitelisted
+TREND_GROUPINGS = frozenset({"day", "week", "month", "year"})
+
+# Days covered by the default costs period warmed at startup
+WARMUP_PERIOD_DAYS = 30
+
+
+def cache_warmup_calls() -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Report calls pre-computed at startup, as (method name, kwargs).
+    
+    Kwargs mirror exactly what the report routes pass for their default
+    query, so the warmed cache keys are the ones requests look up.
+    
+    Returns:
+        List[Tuple[str, Dict[str, Any]]]: Calls to warm
+    """
+    fecha_hasta = date.today()
+    fecha_desde = fecha_hasta - timedelta(days=WARMUP_PERIOD_DAYS)
+    
+    return [
+        ("get_dashboard_summary", {}),
+        ("get_inventory_report", {
+            "categoria_id": None,
+            "almacen": None,
+            "low_stock_only": False,
+            "include_zero": False
+        }),
+        ("get_costs_report", {
+            "fecha_desde": fecha_desde,
+            "fecha_hasta": fecha_hasta,
+            "categoria_id": None,
+            "estado": None
+        }),
+        ("get_costs_trends", {
+            "fecha_desde": fecha_desde,
+            "fecha_hasta": fecha_hasta,
+            "group_by": "month"
+        }),
+    ]
 
 
 class ReportService:
@@ -19,48 +76,53 @@ class ReportService:
     def __init__(self, db: Session):
         self.db = db
     
+    def warm_cache(self) -> None:
+        """Populate the report cache with the cache_warmup_calls shapes."""
+        for method_name, kwargs in cache_warmup_calls():
+            getattr(self, method_name)(**kwargs)
+    
+    @cached_method(ttl=REPORT_CACHE_TTL)
     def get_dashboard_summary(self) -> Dict[str, Any]:
         """
         Get dashboard summary with key metrics.
         
+        Product and guia counters are computed in a single statement so the
+        endpoint pays one round-trip for all KPIs.
+        
         Returns:
             Dict[str, Any]: Dashboard summary
         """
-        # Products summary
-        total_products = self.db.query(Product).filter(Product.status == "active").count()
-        low_stock_products = self.db.query(Product).filter(
-            Product.stock_actual <= Product.stock_minimo,
-            Product.status == "active"
-        ).count()
-        out_of_stock_products = self.db.query(Product).filter(
-            Product.stock_actual == 0,
-            Product.status == "active"
-        ).count()
-        
-        # Inventory value
-        products = self.db.query(Product).filter(Product.status == "active").all()
-        inventory_value = sum(
-            (p.stock_actual or 0) * (p.precio_compra or 0) for p in products
-        )
-        
-        # Guias summary (last 30 days)
         thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-        total_guias = self.db.query(Guia).filter(
-            Guia.fecha_creacion >= thirty_days_ago
-        ).count()
-        
-        guias_pendientes = self.db.query(Guia).filter(
-            Guia.estado == "pendiente"
-        ).count()
-        
-        guias_en_transito = self.db.query(Guia).filter(
-            Guia.estado == "en_transito"
-        ).count()
-        
-        guias_entregadas = self.db.query(Guia).filter(
-            Guia.fecha_creacion >= thirty_days_ago,
-            Guia.estado == "entregada"
-        ).count()
+        active = Product.status == "active"
+        recent = Guia.fecha_creacion >= thirty_days_ago
+        
+        products = select(
+            func.count().filter(active).label("total_products"),
+            func.count().filter(
+                active, Product.stock_actual <= Product.stock_minimo
+            ).label("low_stock_products"),
+            func.count().filter(
+                active, Product.stock_actual == 0
+            ).label("out_of_stock_products"),
+            func.coalesce(
+                func.sum(Product.stock_actual * Product.precio_compra).filter(active), 0
+            ).label("inventory_value")
+        ).subquery()
+        
+        guias = select(
+            func.count().filter(recent).label("total_guias"),
+            func.count().filter(Guia.estado == "pendiente").label("guias_pendientes"),
+            func.count().filter(Guia.estado == "en_transito").label("guias_en_transito"),
+            func.count().filter(
+                recent, Guia.estado == "entregada"
+            ).label("guias_entregadas")
+        ).subquery()
+        
+        # Each subquery yields one row; join them explicitly rather than
+        # listing both in FROM, which SQLAlchemy flags as a cartesian product
+        kpis = self.db.execute(
+            select(products, guias).join_from(products, guias, true())
+        ).mappings().one()
         
         # Recent movements
         recent_movements = self.db.query(Kardex).order_by(
@@ -69,16 +131,16 @@ class ReportService:
         
         return {
             "products": {
-                "total": total_products,
-                "low_stock": low_stock_products,
-                "out_of_stock": out_of_stock_products,
-                "inventory_value": float(inventory_value)
+                "total": kpis["total_products"],
+                "low_stock": kpis["low_stock_products"],
+                "out_of_stock": kpis["out_of_stock_products"],
+                "inventory_value": float(kpis["inventory_value"])
             },
             "guias": {
-                "total_last_30_days": total_guias,
-                "pendientes": guias_pendientes,
-                "en_transito": guias_en_transito,
-                "entregadas_last_30_days": guias_entregadas
+                "total_last_30_days": kpis["total_guias"],
+                "pendientes": kpis["guias_pendientes"],
+                "en_transito": kpis["guias_en_transito"],
+                "entregadas_last_30_days": kpis["guias_entregadas"]
             },
             "recent_movements": [
                 {
@@ -92,29 +154,40 @@ class ReportService:
             ]
         }
     
+    @cached_method(ttl=REPORT_CACHE_TTL)
     def get_inventory_report(
         self,
-        category_id: Optional[int] = None,
-        low_stock_only: bool = False
+        categoria_id: Optional[int] = None,
+        almacen: Optional[str] = None,
+        low_stock_only: bool = False,
+        include_zero: bool = False
     ) -> Dict[str, Any]:
         """
         Get detailed inventory report.
         
         Args:
-            category_id: Optional category filter
+            categoria_id: Optional category filter
+            almacen: Optional warehouse location filter
             low_stock_only: Whether to show only low stock products
+            include_zero: Whether to include products with no stock
             
         Returns:
             Dict[str, Any]: Inventory report
         """
         query = self.db.query(Product).filter(Product.status == "active")
         
-        if category_id:
-            query = query.filter(Product.category_id == category_id)
+        if categoria_id:
+            query = query.filter(Product.category_id == categoria_id)
+        
+        if almacen:
+            query = query.filter(Product.ubicacion_bodega == almacen)
         
         if low_stock_only:
             query = query.filter(Product.stock_actual <= Product.stock_minimo)
         
+        if not include_zero:
+            query = query.filter(Product.stock_actual > 0)
+        
         products = query.all()
         
         total_value = sum(
@@ -148,6 +221,63 @@ class ReportService:
             ]
         }
     
+    def iter_inventory_export(self) -> Iterator[Row]:
+        """
+        Stream active products for export.
+        
+        Rows are fetched in batches of EXPORT_BATCH_SIZE instead of loading
+        the whole table, and follow INVENTORY_EXPORT_COLUMNS.
+        
+        Returns:
+            Iterator[Row]: Export rows
+        """
+        stmt = select(
+            Product.code,
+            Product.name,
+            Product.stock_actual,
+            Product.stock_minimo,
+            Product.precio_compra,
+            (Product.stock_actual * Product.precio_compra).label("valor_inventario")
+        ).where(
+            Product.status == "active"
+        ).order_by(Product.code)
+        
+        return iter(self.db.execute(
+            stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        ))
+    
+    def iter_costs_export(self, fecha_desde: date, fecha_hasta: date) -> Iterator[Row]:
+        """
+        Stream costs in a date range for export.
+        
+        Rows follow COSTS_EXPORT_COLUMNS.
+        
+        Args:
+            fecha_desde: Start date
+            fecha_hasta: End date
+            
+        Returns:
+            Iterator[Row]: Export rows
+        """
+        stmt = select(
+            Costo.fecha,
+            CostCategory.name,
+            CostCategory.tipo,
+            Costo.descripcion,
+            Costo.proveedor,
+            Costo.monto,
+            Costo.estado
+        ).join(
+            CostCategory, Costo.categoria_id == CostCategory.id
+        ).where(
+            Costo.fecha >= fecha_desde,
+            Costo.fecha <= fecha_hasta
+        ).order_by(Costo.fecha)
+        
+        return iter(self.db.execute(
+            stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        ))
+    
     def get_sales_report(
         self,
         fecha_desde: Optional[date] = None,
@@ -169,31 +299,35 @@ class ReportService:
         if not fecha_hasta:
             fecha_hasta = date.today()
         
-        # Get guias in date range
-        guias = self.db.query(Guia).filter(
+        in_range = and_(
             Guia.fecha_creacion >= datetime.combine(fecha_desde, datetime.min.time()),
             Guia.fecha_creacion <= datetime.combine(fecha_hasta, datetime.max.time())
+        )
+        
+        # Aggregated tuple rows only; no Guia/GuiaItem entities are hydrated
+        guias_by_estado = dict(self.db.execute(
+            select(Guia.estado, func.count(Guia.id)).where(in_range).group_by(Guia.estado)
+        ).all())
+        
+        products_rows = self.db.execute(
+            select(
+                GuiaItem.product_id,
+                func.count(GuiaItem.id),
+                func.coalesce(func.sum(GuiaItem.cantidad), 0),
+                func.coalesce(func.sum(GuiaItem.subtotal), 0)
+            ).join(
+                Guia, Guia.id == GuiaItem.guia_id
+            ).where(in_range).group_by(GuiaItem.product_id)
         ).all()
         
-        # Get all items from these guias
-        guia_ids = [g.id for g in guias]
-        items = self.db.query(GuiaItem).filter(GuiaItem.guia_id.in_(guia_ids)).all() if guia_ids else []
-        
-        total_items = len(items)
-        total_quantity = sum(item.cantidad for item in items)
-        total_value = sum(float(item.subtotal or 0) for item in items)
-        
-        # Group by product
-        products_sold = {}
-        for item in items:
-            if item.product_id not in products_sold:
-                products_sold[item.product_id] = {
-                    "product_id": item.product_id,
-                    "quantity": 0,
-                    "value": 0
-                }
-            products_sold[item.product_id]["quantity"] += item.cantidad
-            products_sold[item.product_id]["value"] += float(item.subtotal or 0)
+        products_sold = [
+            {
+                "product_id": product_id,
+                "quantity": int(quantity),
+                "value": float(value)
+            }
+            for product_id, _, quantity, value in products_rows
+        ]
         
         return {
             "period": {
@@ -201,21 +335,19 @@ class ReportService:
                 "fecha_hasta": fecha_hasta.isoformat()
             },
             "summary": {
-                "total_guias": len(guias),
-                "total_items": total_items,
-                "total_quantity": total_quantity,
-                "total_value": total_value
+                "total_guias": sum(guias_by_estado.values()),
+                "total_items": sum(row[1] for row in products_rows),
+                "total_quantity": sum(item["quantity"] for item in products_sold),
+                "total_value": sum(item["value"] for item in products_sold)
             },
-            "products_sold": list(products_sold.values()),
+            "products_sold": products_sold,
             "guias_by_status": {
-                "pendiente": len([g for g in guias if g.estado == "pendiente"]),
-                "en_transito": len([g for g in guias if g.estado == "en_transito"]),
-                "entregada": len([g for g in guias if g.estado == "entregada"]),
-                "devuelta": len([g for g in guias if g.estado == "devuelta"]),
-                "cancelada": len([g for g in guias if g.estado == "cancelada"])
+                estado: guias_by_estado.get(estado, 0)
+                for estado in ("pendiente", "en_transito", "entregada", "devuelta", "cancelada")
             }
         }
     
+    @cached_method(ttl=REPORT_CACHE_TTL)
     def get_financial_report(
         self,
         fecha_desde: Optional[date] = None,
@@ -237,34 +369,25 @@ class ReportService:
         if not fecha_hasta:
             fecha_hasta = date.today()
         
-        query = self.db.query(Costo).filter(
+        # One grouped SUM per category tipo instead of loading every costo
+        rows = self.db.query(
+            CostCategory.tipo,
+            func.count(Costo.id),
+            func.coalesce(func.sum(Costo.monto), 0)
+        ).select_from(Costo).join(
+            CostCategory, CostCategory.id == Costo.categoria_id
+        ).filter(
             Costo.fecha >= fecha_desde,
             Costo.fecha <= fecha_hasta
-        )
+        ).group_by(CostCategory.tipo).all()
         
-        costos = query.all()
+        totals_by_tipo = {tipo: (count, float(total)) for tipo, count, total in rows}
+        count_ingresos, total_ingresos = totals_by_tipo.pop("ingreso", (0, 0.0))
+        count_gastos, total_gastos = totals_by_tipo.pop("gasto", (0, 0.0))
         
-        # Categorize by type
-        ingresos = []
-        gastos = []
-        costos_directos = []
-        
-        for costo in costos:
-            category = self.db.query(CostCategory).filter(
-                CostCategory.id == costo.categoria_id
-            ).first()
-            
-            if category:
-                if category.tipo == "ingreso":
-                    ingresos.append(costo)
-                elif category.tipo == "gasto":
-                    gastos.append(costo)
-                else:
-                    costos_directos.append(costo)
-        
-        total_ingresos = sum(float(c.monto) for c in ingresos)
-        total_gastos = sum(float(c.monto) for c in gastos)
-        total_costos = sum(float(c.monto) for c in costos_directos)
+        # Every other tipo counts as a direct cost
+        count_costos = sum(count for count, _ in totals_by_tipo.values())
+        total_costos = sum(total for _, total in totals_by_tipo.values())
         
         utilidad_bruta = total_ingresos - total_costos
         utilidad_neta = utilidad_bruta - total_gastos
@@ -276,15 +399,15 @@ class ReportService:
             },
             "ingresos": {
                 "total": total_ingresos,
-                "count": len(ingresos)
+                "count": count_ingresos
             },
             "costos": {
                 "total": total_costos,
-                "count": len(costos_directos)
+                "count": count_costos
             },
             "gastos": {
                 "total": total_gastos,
-                "count": len(gastos)
+                "count": count_gastos
             },
             "utilidad_bruta": utilidad_bruta,
             "utilidad_neta": utilidad_neta,
@@ -292,6 +415,138 @@ class ReportService:
             "margen_neto": (utilidad_neta / total_ingresos * 100) if total_ingresos > 0 else 0
         }
     
+    @cached_method(ttl=REPORT_CACHE_TTL)
+    def get_costs_report(
+        self,
+        fecha_desde: date,
+        fecha_hasta: date,
+        categoria_id: Optional[int] = None,
+        estado: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get cost totals for a period, by category type and by status.
+        
+        Args:
+            fecha_desde: Start date
+            fecha_hasta: End date
+            categoria_id: Optional cost category filter
+            estado: Optional status filter
+            
+        Returns:
+            Dict[str, Any]: Costs summary
+        """
+        # One grouped aggregate; the result has at most tipos x estados rows
+        query = self.db.query(
+            CostCategory.tipo,
+            Costo.estado,
+            func.count(Costo.id),
+            func.coalesce(func.sum(Costo.monto), 0)
+        ).select_from(Costo).join(
+            CostCategory, CostCategory.id == Costo.categoria_id
+        ).filter(
+            Costo.fecha >= fecha_desde,
+            Costo.fecha <= fecha_hasta
+        )
+        
+        if categoria_id:
+            query = query.filter(Costo.categoria_id == categoria_id)
+        
+        if estado:
+            query = query.filter(Costo.estado == estado)
+        
+        total = 0.0
+        count = 0
+        by_tipo = {}
+        by_estado = {}
+        for tipo, row_estado, row_count, row_total in query.group_by(CostCategory.tipo, Costo.estado):
+            row_total = float(row_total)
+            total += row_total
+            count += row_count
+            by_tipo[tipo] = by_tipo.get(tipo, 0.0) + row_total
+            by_estado[row_estado] = by_estado.get(row_estado, 0.0) + row_total
+        
+        return {
+            "period": {
+                "fecha_desde": fecha_desde.isoformat(),
+                "fecha_hasta": fecha_hasta.isoformat()
+            },
+            "total": total,
+            "count": count,
+            "by_tipo": by_tipo,
+            "by_estado": by_estado
+        }
+    
+    @cached_method(ttl=REPORT_CACHE_TTL)
+    def get_costs_trends(
+        self,
+        fecha_desde: date,
+        fecha_hasta: date,
+        group_by: str = "month"
+    ) -> Dict[str, Any]:
+        """
+        Get cost totals bucketed by period, including empty periods.
+        
+        Buckets are generated and aggregated in the database, so only one
+        row per period is returned.
+        
+        Args:
+            fecha_desde: Start date
+            fecha_hasta: End date
+            group_by: Period size (day, week, month, year)
+            
+        Returns:
+            Dict[str, Any]: Costs trends
+            
+        Raises:
+            ValidationError: If group_by is not a supported period
+        """
+        if group_by not in TREND_GROUPINGS:
+            raise ValidationError(
+                f"Invalid group_by: {group_by}",
+                details={"allowed": sorted(TREND_GROUPINGS)}
+            )
+        
+        # Same expression as the ix_costos_fecha_month index
+        costo_bucket = func.date_trunc(group_by, cast(Costo.fecha, DateTime))
+        buckets = select(
+            func.generate_series(
+                func.date_trunc(group_by, cast(fecha_desde, DateTime)),
+                func.date_trunc(group_by, cast(fecha_hasta, DateTime)),
+                literal_column(f"interval '1 {group_by}'")
+            ).label("bucket")
+        ).subquery()
+        
+        stmt = select(
+            cast(buckets.c.bucket, Date).label("periodo"),
+            func.coalesce(func.sum(Costo.monto), 0).label("total"),
+            func.count(Costo.id).label("count")
+        ).select_from(buckets).outerjoin(
+            Costo,
+            and_(
+                costo_bucket == buckets.c.bucket,
+                Costo.fecha >= fecha_desde,
+                Costo.fecha <= fecha_hasta
+            )
+        ).group_by(buckets.c.bucket).order_by(buckets.c.bucket)
+        
+        trends = [
+            {
+                "periodo": row.periodo.isoformat(),
+                "total": float(row.total),
+                "count": row.count
+            }
+            for row in self.db.execute(stmt)
+        ]
+        
+        return {
+            "period": {
+                "fecha_desde": fecha_desde.isoformat(),
+                "fecha_hasta": fecha_hasta.isoformat()
+            },
+            "group_by": group_by,
+            "trends": trends
+        }
+    
     def get_scanning_report(
         self,
         fecha_desde: Optional[datetime] = None,
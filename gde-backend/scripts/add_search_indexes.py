@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Create the listing and search indexes for GDE Backend API.
+
+Run once against databases created before the models declared these
+indexes; create_all only builds indexes for tables it creates.
+"""
+import sys
+from pathlib import Path
+
+# Add the app directory to the Python path
+app_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(app_dir))
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+STATEMENTS = (
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_costos_fecha_desc_cat_estado ON costos (fecha DESC, categoria_id, estado)",
+    "CREATE INDEX IF NOT EXISTS ix_costos_fecha_month ON costos (date_trunc('month', fecha::timestamp))",
+    "CREATE INDEX IF NOT EXISTS ix_costos_descripcion_trgm ON costos USING gin (descripcion gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_costos_proveedor_trgm ON costos USING gin (proveedor gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_guias_estado ON guias (estado)",
+    "CREATE INDEX IF NOT EXISTS idx_guias_fecha_creacion ON guias (fecha_creacion)",
+    "CREATE INDEX IF NOT EXISTS ix_guias_codigo_trgm ON guias USING gin (codigo gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_guias_cliente_nombre_trgm ON guias USING gin (cliente_nombre gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS ix_guias_search_fts ON guias USING gin "
+    "(to_tsvector('simple', coalesce(codigo, '') || ' ' || coalesce(cliente_nombre, '')))",
+    "CREATE INDEX IF NOT EXISTS ix_guia_movimientos_guia_fecha ON guia_movimientos (guia_id, fecha_movimiento DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_kardex_product_fecha ON kardex (product_id, fecha_movimiento DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_escaneos_session_fecha ON escaneos (session_id, fecha_escaneo)",
+    "CREATE INDEX IF NOT EXISTS ix_escaneos_codigo_barras ON escaneos (codigo_barras)",
+    "CREATE INDEX IF NOT EXISTS ix_audit_logs_usuario_fecha ON audit_logs (usuario_id, fecha DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_audit_logs_tabla_registro ON audit_logs (tabla_afectada, registro_id)",
+    "CREATE INDEX IF NOT EXISTS ix_notifications_user_read_sent ON notifications (user_id, is_read, sent_at DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_notifications_unread ON notifications (user_id) WHERE is_read IS false",
+)
+
+
+def main():
+    """Run the migration in a single transaction."""
+    print("🗄️  Creating search indexes...")
+    
+    try:
+        with engine.begin() as conn:
+            for statement in STATEMENTS:
+                conn.execute(text(statement))
+                print(f"   - {statement}")
+        print("✅ Migration completed!")
+    except Exception as e:
+        print(f"❌ Error running migration: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Convert URL list columns from TEXT[] to JSONB for GDE Backend API.
+
+Run once against databases created before the models switched to JSONB.
+"""
+import sys
+from pathlib import Path
+
+# Add the app directory to the Python path
+app_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(app_dir))
+
+from sqlalchemy import text
+
+from app.core.database import engine
+
+STATEMENTS = (
+    "ALTER TABLE products ALTER COLUMN imagenes TYPE JSONB USING to_jsonb(imagenes)",
+    "ALTER TABLE guia_movimientos ALTER COLUMN evidencias TYPE JSONB USING to_jsonb(evidencias)",
+    "ALTER TABLE costos ALTER COLUMN evidencias TYPE JSONB USING to_jsonb(evidencias)",
+    "CREATE INDEX IF NOT EXISTS ix_products_imagenes_gin ON products USING gin (imagenes)",
+)
+
+
+def main():
+    """Run the migration in a single transaction."""
+    print("🗄️  Migrating array columns to JSONB...")
+    
+    try:
+        with engine.begin() as conn:
+            for statement in STATEMENTS:
+                conn.execute(text(statement))
+                print(f"   - {statement}")
+        print("✅ Migration completed!")
+    except Exception as e:
+        print(f"❌ Error running migration: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
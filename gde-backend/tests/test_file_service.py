@@ -0,0 +1,231 @@
+"""
+Tests for the file import pipeline.
+"""
+import pytest
+import pandas as pd
+from uuid import uuid4
+from openpyxl import Workbook
+from sqlalchemy.orm import Session
+
+from app.models.audit import ImportLog
+from app.models.costo import CostCategory
+from app.models.product import Category
+from app.services.file_service import FileService
+from app.core.exceptions import FileProcessingError
+
+
+def _product_frame(**columns) -> pd.DataFrame:
+    """Build a products import frame, one row per value in stock_actual."""
+    rows = len(columns["stock_actual"])
+    data = {"code": [f"P{i}" for i in range(rows)], "name": ["Product"] * rows}
+    data.update(columns)
+    return pd.DataFrame(data)
+
+
+def _write_workbook(path, header, rows) -> str:
+    """Write an .xlsx file with a header row and data rows."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(header)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def category(db_session: Session):
+    """Create a product category for import lookups."""
+    category = Category(name="Import Category")
+    db_session.add(category)
+    db_session.commit()
+    return category
+
+
+class TestProcessData:
+    """Tests for FileService._process_data."""
+    
+    def test_valid_rows(self, db_session: Session, category):
+        """Test valid rows are cast per column spec."""
+        service = FileService(db_session)
+        df = _product_frame(stock_actual=[5, None], categoria_id=[category.id, None])
+        
+        result = service._process_data(df, "products")
+        
+        assert result["errors"] == []
+        assert [row["stock_actual"] for row in result["success"]] == [5, 0]
+        assert [row["categoria_id"] for row in result["success"]] == [category.id, None]
+        assert result["success"][0]["description"] == ""
+    
+    def test_fractional_int_is_error(self, db_session: Session, category):
+        """Test fractional values in int columns are rejected, not truncated."""
+        service = FileService(db_session)
+        df = _product_frame(stock_actual=[2.5, 3], categoria_id=[category.id, 1.5])
+        
+        result = service._process_data(df, "products")
+        
+        assert result["success"] == []
+        assert [error["row"] for error in result["errors"]] == [1, 2]
+        assert result["errors"][0]["error"] == "Invalid stock_actual"
+        assert result["errors"][1]["error"] == "Invalid categoria_id"
+    
+    def test_out_of_range_int_is_error(self, db_session: Session):
+        """Test values beyond the INTEGER range are rejected, not wrapped."""
+        service = FileService(db_session)
+        df = _product_frame(stock_actual=[1e20, float("inf"), -1e10])
+        
+        result = service._process_data(df, "products")
+        
+        assert result["success"] == []
+        assert all(error["error"] == "Invalid stock_actual" for error in result["errors"])
+        assert result["errors"][0]["data"]["stock_actual"] == 1e20
+    
+    def test_non_numeric_is_error(self, db_session: Session):
+        """Test text in numeric columns is reported with its row."""
+        service = FileService(db_session)
+        df = _product_frame(stock_actual=[1, "many"], precio_venta=["abc", 9.5])
+        
+        result = service._process_data(df, "products")
+        
+        assert result["success"] == []
+        assert result["errors"][0]["error"] == "Invalid precio_venta"
+        assert result["errors"][1]["error"] == "Invalid stock_actual"
+    
+    def test_unknown_categoria_id_is_error(self, db_session: Session, category):
+        """Test references to missing categories are reported."""
+        service = FileService(db_session)
+        df = _product_frame(stock_actual=[1, 1], categoria_id=[category.id, category.id + 1000])
+        
+        result = service._process_data(df, "products")
+        
+        assert len(result["success"]) == 1
+        assert result["errors"][0]["row"] == 2
+        assert result["errors"][0]["error"] == "Unknown categoria_id"
+    
+    def test_unknown_cost_categoria_id_is_error(self, db_session: Session):
+        """Test costos rows are checked against cost categories."""
+        cost_category = CostCategory(name="Fuel", tipo="gasto")
+        db_session.add(cost_category)
+        db_session.commit()
+        service = FileService(db_session)
+        df = pd.DataFrame({
+            "fecha": ["2025-01-15", "2025-01-16"],
+            "descripcion": ["Fuel", "Tolls"],
+            "monto": [100, 25],
+            "categoria_id": [cost_category.id, cost_category.id + 1000],
+        })
+        
+        result = service._process_data(df, "costos")
+        
+        assert len(result["success"]) == 1
+        assert result["errors"][0]["row"] == 2
+        assert result["errors"][0]["error"] == "Unknown categoria_id"
+    
+    def test_datetime_column(self, db_session: Session):
+        """Test datetime cells become text and empty ones take the default."""
+        service = FileService(db_session)
+        df = pd.DataFrame({
+            "fecha": pd.to_datetime(["2025-01-15", None]),
+            "descripcion": ["Fuel", "Tolls"],
+            "monto": [100, 25.5],
+        })
+        
+        result = service._process_data(df, "costos")
+        
+        assert result["errors"] == []
+        assert [row["fecha"] for row in result["success"]] == ["2025-01-15 00:00:00", ""]
+        assert [row["monto"] for row in result["success"]] == [100.0, 25.5]
+    
+    def test_unsupported_entity(self, db_session: Session):
+        """Test unknown entity types raise FileProcessingError."""
+        service = FileService(db_session)
+        
+        with pytest.raises(FileProcessingError):
+            service._process_data(pd.DataFrame(), "unknown")
+
+
+class TestValidateData:
+    """Tests for FileService._validate_data."""
+    
+    def test_missing_columns(self, db_session: Session):
+        """Test files without the required columns are rejected."""
+        service = FileService(db_session)
+        df = pd.DataFrame({"codigo": ["G1"]})
+        
+        with pytest.raises(FileProcessingError, match="cliente_nombre"):
+            service._validate_data(df, "guias")
+    
+    def test_unsupported_entity(self, db_session: Session):
+        """Test unknown entity types are rejected."""
+        service = FileService(db_session)
+        
+        with pytest.raises(FileProcessingError):
+            service._validate_data(pd.DataFrame(), "unknown")
+
+
+class TestExcelImport:
+    """Tests for streaming Excel imports."""
+    
+    def test_excel_chunks(self, db_session: Session, tmp_path):
+        """Test chunks keep sheet row indexes and skip blank rows."""
+        path = _write_workbook(
+            tmp_path / "guias.xlsx",
+            ["codigo", "cliente_nombre"],
+            [["G1", "A"], ["G2", "B"], [None, None], ["G3", "C"]]
+        )
+        service = FileService(db_session)
+        
+        chunks = list(service._iter_excel_chunks(path, chunk_size=2))
+        
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert list(chunks[1].index) == [2]
+        assert chunks[1]["codigo"].tolist() == ["G3"]
+    
+    def test_empty_sheet(self, db_session: Session, tmp_path):
+        """Test a header-only sheet yields one empty chunk."""
+        path = _write_workbook(tmp_path / "empty.xlsx", ["codigo", "cliente_nombre"], [])
+        service = FileService(db_session)
+        
+        chunks = list(service._iter_excel_chunks(path))
+        
+        assert len(chunks) == 1
+        assert chunks[0].empty
+    
+    def test_import_is_logged(self, db_session: Session, tmp_path):
+        """Test a completed import stores its counts and errors."""
+        path = _write_workbook(
+            tmp_path / "products.xlsx",
+            ["code", "name", "stock_actual"],
+            [["P1", "One", 3], ["P2", "Two", "many"]]
+        )
+        service = FileService(db_session)
+        
+        result = service.process_file(path, "products", uuid4())
+        
+        assert result["total_records"] == 2
+        assert result["successful_records"] == 1
+        assert result["errors"][0]["row"] == 2
+        
+        import_log = db_session.get(ImportLog, result["import_log_id"])
+        assert import_log.estado == "completed"
+        assert import_log.tipo_archivo == "excel"
+        assert import_log.registros_fallidos == 1
+    
+    def test_failure_is_logged(self, db_session: Session, tmp_path):
+        """Test a failed import raises and is logged as failed."""
+        path = _write_workbook(tmp_path / "bad.xlsx", ["codigo"], [["G1"]])
+        service = FileService(db_session)
+        
+        with pytest.raises(FileProcessingError):
+            service.process_file(path, "guias", uuid4())
+        
+        import_log = db_session.query(ImportLog).filter(ImportLog.archivo == "bad.xlsx").one()
+        assert import_log.estado == "failed"
+        assert "cliente_nombre" in import_log.errores["error"]
+    
+    def test_unsupported_extension(self, db_session: Session):
+        """Test unknown file extensions are rejected before reading."""
+        service = FileService(db_session)
+        
+        with pytest.raises(FileProcessingError, match="Unsupported file type"):
+            service.process_file("data.json", "products", uuid4())
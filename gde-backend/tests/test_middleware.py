@@ -0,0 +1,190 @@
+"""
+Tests for the CORS middleware.
+"""
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.core.middleware import FastCORSMiddleware
+
+ORIGIN = "https://app.example.com"
+
+
+async def _homepage(request):
+    return PlainTextResponse("ok", headers={"x-app": "1"})
+
+
+def _client(**options) -> TestClient:
+    """Build a client for a one-route app wrapped in FastCORSMiddleware."""
+    app = Starlette(routes=[Route("/", _homepage, methods=["GET", "POST"])])
+    return TestClient(FastCORSMiddleware(app, **options))
+
+
+def _preflight(client: TestClient, method: str = "GET", headers: str = None, origin: str = ORIGIN):
+    """Send a preflight request."""
+    request_headers = {"Origin": origin, "Access-Control-Request-Method": method}
+    if headers:
+        request_headers["Access-Control-Request-Headers"] = headers
+    return client.options("/", headers=request_headers)
+
+
+class TestSimpleRequests:
+    """Tests for non-preflight requests."""
+
+    def test_allowed_origin(self):
+        """Test an allowed origin is echoed with Vary: Origin."""
+        client = _client(allow_origins=[ORIGIN])
+
+        response = client.get("/", headers={"Origin": ORIGIN})
+
+        assert response.status_code == 200
+        assert response.text == "ok"
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["vary"] == "Origin"
+        assert "access-control-allow-credentials" not in response.headers
+
+    def test_disallowed_origin(self):
+        """Test a disallowed origin gets the response without CORS headers."""
+        client = _client(allow_origins=[ORIGIN])
+
+        response = client.get("/", headers={"Origin": "https://evil.example.com"})
+
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_wildcard_origin(self):
+        """Test a wildcard origin without credentials answers "*"."""
+        client = _client(allow_origins=["*"])
+
+        response = client.get("/", headers={"Origin": ORIGIN})
+
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "vary" not in response.headers
+
+    def test_wildcard_origin_with_credentials(self):
+        """Test credentials with a wildcard origin echo the origin instead of "*"."""
+        client = _client(allow_origins=["*"], allow_credentials=True)
+
+        response = client.get("/", headers={"Origin": ORIGIN})
+
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Origin"
+
+    def test_no_origin(self):
+        """Test requests without Origin pass through unchanged."""
+        client = _client(allow_origins=["*"], allow_credentials=True)
+
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.headers["x-app"] == "1"
+        assert not any(name.startswith("access-control-") for name in response.headers)
+        assert "vary" not in response.headers
+
+    def test_options_without_request_method(self):
+        """Test OPTIONS without Access-Control-Request-Method is not a preflight."""
+        client = _client(allow_origins=[ORIGIN])
+
+        response = client.options("/", headers={"Origin": ORIGIN})
+
+        assert response.status_code == 405
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+
+
+class TestPreflight:
+    """Tests for preflight requests."""
+
+    def test_allowed(self):
+        """Test an allowed preflight is answered with 204 and the allow headers."""
+        client = _client(
+            allow_origins=[ORIGIN],
+            allow_methods=["GET", "POST"],
+            allow_headers=["X-Custom"],
+            max_age=120
+        )
+
+        response = _preflight(client, "POST", "x-custom, content-type")
+
+        assert response.status_code == 204
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-methods"] == "GET, POST"
+        assert response.headers["access-control-max-age"] == "120"
+        assert "x-custom" in response.headers["access-control-allow-headers"].lower()
+        assert response.headers["vary"] == "Origin"
+
+    def test_disallowed_origin(self):
+        """Test a preflight from a disallowed origin is rejected."""
+        client = _client(allow_origins=[ORIGIN])
+
+        response = _preflight(client, origin="https://evil.example.com")
+
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS origin"
+        assert "access-control-allow-origin" not in response.headers
+
+    def test_disallowed_method(self):
+        """Test a preflight for a disallowed method is rejected."""
+        client = _client(allow_origins=[ORIGIN], allow_methods=["GET"])
+
+        response = _preflight(client, "DELETE")
+
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS method"
+
+    def test_disallowed_headers(self):
+        """Test a preflight requesting a header not allowed is rejected."""
+        client = _client(allow_origins=[ORIGIN], allow_headers=["X-Custom"])
+
+        response = _preflight(client, headers="x-custom, x-other")
+
+        assert response.status_code == 400
+        assert response.text == "Disallowed CORS headers"
+
+    def test_safelisted_headers(self):
+        """Test safelisted headers are allowed without being configured."""
+        client = _client(allow_origins=[ORIGIN])
+
+        response = _preflight(client, headers="Accept, Content-Language")
+
+        assert response.status_code == 204
+
+    def test_wildcard_methods(self):
+        """Test "*" methods allow every standard method."""
+        client = _client(allow_origins=[ORIGIN], allow_methods=["*"])
+
+        response = _preflight(client, "PATCH")
+
+        assert response.status_code == 204
+        assert "PATCH" in response.headers["access-control-allow-methods"]
+
+    def test_wildcard_headers_echo_request(self):
+        """Test "*" headers echo Access-Control-Request-Headers."""
+        client = _client(allow_origins=[ORIGIN], allow_headers=["*"])
+
+        response = _preflight(client, headers="X-Anything, Authorization")
+
+        assert response.status_code == 204
+        assert response.headers["access-control-allow-headers"] == "X-Anything, Authorization"
+
+    def test_wildcard_origin_with_credentials(self):
+        """Test a credentialed wildcard preflight echoes the origin."""
+        client = _client(allow_origins=["*"], allow_credentials=True)
+
+        response = _preflight(client)
+
+        assert response.status_code == 204
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Origin"
+
+    def test_wildcard_origin_without_credentials(self):
+        """Test a wildcard preflight without credentials answers "*"."""
+        client = _client(allow_origins=["*"])
+
+        response = _preflight(client)
+
+        assert response.status_code == 204
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "vary" not in response.headers
@@ -0,0 +1,36 @@
+"""
+Tests for the orjson response helpers.
+"""
+from collections import namedtuple
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from app.core.responses import ORJSONResponse, rows_json
+
+
+class _Row(BaseModel):
+    monto: Decimal
+    fecha: datetime
+
+
+class TestORJSONResponse:
+    """Tests for ORJSONResponse encoding parity with pydantic."""
+
+    def test_matches_pydantic_json(self):
+        """Test Decimal and UTC datetime encode as pydantic's JSON mode does."""
+        row = _Row(monto=Decimal("10.50"), fecha=datetime(2025, 1, 15, 8, 30, tzinfo=timezone.utc))
+
+        response = ORJSONResponse(row.model_dump())
+
+        assert response.body == row.model_dump_json().encode()
+
+    def test_rows_json(self):
+        """Test column-query rows encode as objects with the same formats."""
+        Row = namedtuple("Row", ["id", "monto", "fecha"])
+        rows = [Row(1, Decimal("0.10"), datetime(2025, 1, 15, tzinfo=timezone.utc))]
+
+        response = rows_json(rows)
+
+        assert response.body == b'[{"id":1,"monto":"0.10","fecha":"2025-01-15T00:00:00Z"}]'
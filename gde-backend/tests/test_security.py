@@ -0,0 +1,66 @@
+"""
+Tests for JWT and password utilities.
+"""
+import pytest
+from datetime import timedelta
+from fastapi import HTTPException
+
+from app.core.security import (
+    create_access_token,
+    verify_token,
+    create_refresh_token,
+    verify_refresh_token,
+    generate_password_reset_token,
+    verify_password_reset_token,
+)
+
+
+class TestTokens:
+    """Tests for token creation and verification."""
+
+    def test_access_token_roundtrip(self):
+        """Test an access token decodes back to its payload."""
+        token = create_access_token(data={"sub": "user-123"})
+        payload = verify_token(token)
+
+        assert payload["sub"] == "user-123"
+        assert "exp" in payload
+
+    def test_access_token_custom_expiration(self):
+        """Test expires_delta sets the token lifetime."""
+        token = create_access_token(
+            data={"sub": "user-123"},
+            expires_delta=timedelta(minutes=5)
+        )
+        payload = verify_token(token)
+
+        assert payload["exp"] - payload["iat"] == 300
+
+    def test_invalid_access_token(self):
+        """Test a malformed token is rejected with 401."""
+        with pytest.raises(HTTPException) as exc_info:
+            verify_token("not-a-token")
+
+        assert exc_info.value.status_code == 401
+
+    def test_refresh_token_roundtrip(self):
+        """Test a refresh token carries the refresh type."""
+        token = create_refresh_token(data={"sub": "user-123"})
+        payload = verify_refresh_token(token)
+
+        assert payload["sub"] == "user-123"
+        assert payload["type"] == "refresh"
+
+    def test_access_token_is_not_refresh_token(self):
+        """Test an access token cannot be used as a refresh token."""
+        token = create_access_token(data={"sub": "user-123"})
+
+        with pytest.raises(HTTPException):
+            verify_refresh_token(token)
+
+    def test_password_reset_token_roundtrip(self):
+        """Test a password reset token returns the email."""
+        token = generate_password_reset_token("test@example.com")
+
+        assert verify_password_reset_token(token) == "test@example.com"
+        assert verify_password_reset_token("not-a-token") is None